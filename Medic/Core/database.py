@@ -1,11 +1,15 @@
 """Database connection and query module for Medic."""
 
 import psycopg2
+import psycopg2.errors
 import psycopg2.extras
 import os
 import logging
 import json
-from typing import Optional, Union
+import threading
+import weakref
+from datetime import date, time
+from typing import Any
 
 import Medic.Helpers.logSettings as logLevel
 
@@ -13,6 +17,12 @@ import Medic.Helpers.logSettings as logLevel
 logger = logging.getLogger(__name__)
 logger.setLevel(logLevel.logSetup())
 
+# Names of server-side prepared statements already created on each connection
+_prepared_statements: "weakref.WeakKeyDictionary[Any, set[str]]" = (
+    weakref.WeakKeyDictionary()
+)
+_prepared_statements_lock = threading.Lock()
+
 
 def connect_db():
     """Create a connection to the PostgreSQL database."""
@@ -38,9 +48,77 @@ def connect_db():
         raise ConnectionError(str(e))
 
 
+def _to_server_placeholders(query: str) -> str:
+    """Rewrite %s placeholders as $1, $2, ... for a PREPARE statement."""
+    parts = query.split("%s")
+    return parts[0] + "".join(
+        f"${i}{part}" for i, part in enumerate(parts[1:], start=1)
+    )
+
+
+def execute_prepared(cur, name: str, query: str, params: tuple | None) -> None:
+    """
+    Execute query as the server-side prepared statement ``name``.
+
+    The statement is prepared the first time it is used on a connection, in
+    the same round trip as its first EXECUTE; later calls on that connection
+    only send EXECUTE, skipping server-side parse and planning. Inside a
+    transaction the PREPARE runs in a savepoint, so finding the statement
+    already prepared does not discard earlier work in the caller's
+    transaction; autocommit connections have no transaction to protect.
+
+    Preparing only pays off on long-lived connections that run the same
+    statement repeatedly, such as the worker's pooled connections.
+    """
+    conn = cur.connection
+    params = tuple(params or ())
+    execute_sql = f"EXECUTE {name}"
+    if params:
+        execute_sql += "(" + ", ".join(["%s"] * len(params)) + ")"
+
+    with _prepared_statements_lock:
+        prepared = _prepared_statements.setdefault(conn, set())
+    if name in prepared:
+        cur.execute(execute_sql, params)
+        return
+
+    prepare_sql = f"PREPARE {name} AS {_to_server_placeholders(query)}; "
+    if conn.autocommit is True:
+        try:
+            cur.execute(prepare_sql + execute_sql, params)
+        except psycopg2.errors.DuplicatePreparedStatement:
+            cur.execute(execute_sql, params)
+        prepared.add(name)
+        return
+
+    savepoint = "medic_prepare"
+    try:
+        cur.execute(
+            f"SAVEPOINT {savepoint}; {prepare_sql}"
+            f"RELEASE SAVEPOINT {savepoint}; {execute_sql}",
+            params,
+        )
+    except psycopg2.errors.DuplicatePreparedStatement:
+        cur.execute(
+            f"ROLLBACK TO SAVEPOINT {savepoint}; "
+            f"RELEASE SAVEPOINT {savepoint}; {execute_sql}",
+            params,
+        )
+    prepared.add(name)
+
+
+def _json_default(val: Any) -> str:
+    """Serialize datetime-like values that json cannot encode natively."""
+    if isinstance(val, (date, time)):
+        return val.isoformat()
+    raise TypeError(f"Object of type {type(val).__name__} is not JSON serializable")
+
+
 def query_db(
-    query: str, params: Optional[tuple] = None, show_columns: bool = True
-) -> Optional[Union[str, list]]:
+    query: str,
+    params: tuple | None = None,
+    show_columns: bool = True,
+) -> str | list | None:
     """
     Execute a SELECT query and return results.
 
@@ -56,25 +134,49 @@ def query_db(
     cur = None
     try:
         client = connect_db()
-        cur = client.cursor()
+        cursor_factory = psycopg2.extras.RealDictCursor if show_columns else None
+        cur = client.cursor(cursor_factory=cursor_factory)
         cur.execute(query, params)
         rows = cur.fetchall()
 
         if show_columns:
-            col_names = [elt[0] for elt in cur.description]
-            data = []
-            for r in rows:
-                d = {}
-                for c in range(len(col_names)):
-                    val = r[c]
-                    # Handle datetime serialization
-                    if hasattr(val, "isoformat"):
-                        val = val.isoformat()
-                    d[col_names[c]] = val
-                data.append(d)
-            return json.dumps(data)
-        else:
-            return rows
+            # Datetimes are serialized as ISO 8601 strings
+            return json.dumps(rows, default=_json_default)
+        return rows
+    except (psycopg2.Error, ConnectionError) as e:
+        logger.log(level=30, msg=f"Unable to perform query. An Error has occurred: {e}")
+        return None
+    finally:
+        if cur:
+            cur.close()
+        if client:
+            client.close()
+
+
+def query_db_rows(
+    query: str, params: tuple | None = None
+) -> list[dict[str, Any]] | None:
+    """
+    Execute a SELECT query and return rows as dictionaries.
+
+    Unlike query_db(show_columns=True), values are returned as-is (datetimes
+    are not converted) and nothing is JSON-encoded, so callers can use the
+    rows directly and serialize once at the API boundary if needed.
+
+    Args:
+        query: SQL query with %s placeholders for parameters
+        params: tuple of parameters to safely substitute into query
+
+    Returns:
+        List of row dicts keyed by column name, or None on error
+    """
+    client = None
+    cur = None
+    try:
+        client = connect_db()
+        cur = client.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+        cur.execute(query, params)
+        return [dict(row) for row in cur.fetchall()]
     except (psycopg2.Error, ConnectionError) as e:
         logger.log(
             level=30, msg=f"Unable to perform query. An Error has occurred: {str(e)}"
@@ -87,7 +189,7 @@ def query_db(
             client.close()
 
 
-def insert_db(query: str, params: Optional[tuple] = None) -> bool:
+def insert_db(query: str, params: tuple | None = None) -> bool:
     """
     Execute an INSERT/UPDATE query.
 
@@ -114,3 +216,39 @@ def insert_db(query: str, params: Optional[tuple] = None) -> bool:
             cur.close()
         if client:
             client.close()
+
+
+def insert_db_batch(query: str, params_list: list, page_size: int = 100) -> bool:
+    """
+    Execute an INSERT/UPDATE query once per parameter tuple, in batches.
+
+    Statements are sent page_size at a time with psycopg2's execute_batch
+    and committed together in one transaction.
+
+    Args:
+        query: SQL query with %s placeholders for parameters
+        params_list: list of parameter tuples, one per statement
+        page_size: number of statements sent per round trip
+
+    Returns:
+        True on success, False on failure
+    """
+    if not params_list:
+        return True
+
+    client = None
+    cur = None
+    try:
+        client = connect_db()
+        cur = client.cursor()
+        psycopg2.extras.execute_batch(cur, query, params_list, page_size=page_size)
+        client.commit()
+        return True
+    except (psycopg2.Error, ConnectionError) as e:
+        logger.log(level=30, msg=f"Unable to perform batch insert: {e}")
+        return False
+    finally:
+        if cur:
+            cur.close()
+        if client:
+            client.close()
@@ -734,3 +734,29 @@ def mark_stale_run_alerted(service_id: int, run_id: str) -> bool:
         )
 
     return result if result else False
+
+
+def mark_stale_runs_alerted(runs: list[tuple[int, str]]) -> bool:
+    """
+    Mark several stale runs as alerted in one batched transaction.
+
+    Args:
+        runs: (service_id, run_id) pairs of the runs that were alerted
+
+    Returns:
+        True if updated successfully, False otherwise
+    """
+    if not runs:
+        return True
+
+    result = db.insert_db_batch(
+        "UPDATE medic.job_runs SET status = 'STALE_ALERTED', "
+        "updated_at = NOW() "
+        "WHERE service_id = %s AND run_id = %s AND status = 'STARTED'",
+        runs,
+    )
+
+    if result:
+        logger.log(level=20, msg=f"Marked {len(runs)} stale run(s) as alerted")
+
+    return result if result else False
@@ -16,6 +16,8 @@ Environment variables:
 - OTEL_SERVICE_NAME: Service name for metrics (default: medic)
 - MEDIC_ENVIRONMENT: Deployment environment (default: development)
 - MEDIC_VERSION: Application version (default: unknown)
+- METRICS_PUSHGATEWAY: Pushgateway address the worker pushes to after each
+  cycle instead of serving /metrics (default: unset, serve for scraping)
 
 Usage:
     from Medic.Core.metrics import (
@@ -48,7 +50,11 @@ from prometheus_client import (
     Info,
     generate_latest,
     CONTENT_TYPE_LATEST,
+    GC_COLLECTOR,
+    PLATFORM_COLLECTOR,
+    PROCESS_COLLECTOR,
     REGISTRY,
+    push_to_gateway,
 )
 from prometheus_client.openmetrics.exposition import (
     generate_latest as generate_openmetrics_latest,
@@ -163,7 +169,13 @@ WORKER_CYCLE_DURATION = Histogram(
 )
 
 WORKER_SERVICES_CHECKED = Counter(
-    "medic_worker_services_checked_total", "Total services checked by worker"
+    "medic_worker_services_checked_total",
+    "Total failing or down services evaluated by worker",
+)
+
+WORKER_CYCLE_OVERRUN = Counter(
+    "medic_worker_cycle_overrun_total",
+    "Worker cycles that ran past the start of the next cycle",
 )
 
 # Database metrics - OTEL semantic: db.client.* namespace
@@ -558,6 +570,46 @@ def get_metrics_content_type(openmetrics: bool = True) -> str:
     return CONTENT_TYPE_LATEST
 
 
+# Pushes run on the worker's cycle, so a slow gateway must give up quickly
+PUSH_TIMEOUT_SECONDS = 3.0
+
+
+def push_metrics(
+    gateway: str, job: str = "medic-worker", timeout: float = PUSH_TIMEOUT_SECONDS
+) -> bool:
+    """
+    Push the current metrics to a Prometheus Pushgateway.
+
+    Args:
+        gateway: Pushgateway address (host:port or URL)
+        job: Job label the metrics are grouped under
+        timeout: Seconds to wait for the gateway before giving up
+
+    Returns:
+        True if the push succeeded, False otherwise
+    """
+    try:
+        push_to_gateway(gateway, job=job, registry=REGISTRY, timeout=timeout)
+        return True
+    except (OSError, ValueError) as e:
+        logger.log(level=30, msg=f"Failed to push metrics to {gateway}: {e}")
+        return False
+
+
+def disable_runtime_collectors() -> None:
+    """
+    Drop the default process, platform and GC collectors from the registry.
+
+    Keeps exposition down to Medic's own metrics for processes where the
+    runtime series are not wanted. Safe to call more than once.
+    """
+    for collector in (PROCESS_COLLECTOR, PLATFORM_COLLECTOR, GC_COLLECTOR):
+        try:
+            REGISTRY.unregister(collector)
+        except KeyError:
+            pass
+
+
 def refresh_config() -> None:
     """
     Refresh the metrics configuration from environment variables.
@@ -16,6 +16,8 @@ Environment variables:
 - OTEL_RESOURCE_ATTRIBUTES: Additional resource attributes (comma-separated)
 - MEDIC_ENVIRONMENT: Deployment environment (default: development)
 - MEDIC_VERSION: Application version (default: unknown)
+- OTEL_TRACES_SAMPLER / OTEL_TRACES_SAMPLER_ARG: Standard OpenTelemetry sampler
+  settings, e.g. parentbased_traceidratio with 0.01 to keep 1% of traces
 
 Usage:
     from Medic.Core.telemetry import init_telemetry, get_current_trace_id
@@ -350,6 +352,19 @@ def is_telemetry_enabled() -> bool:
     return _initialized
 
 
+def is_tracing_configured() -> bool:
+    """
+    Check if spans are being exported.
+
+    Telemetry can be initialized with tracing disabled, in which case spans
+    are no-ops and callers on hot paths can skip creating them altogether.
+
+    Returns:
+        True if a tracer provider with an exporter has been installed
+    """
+    return _tracer_provider is not None
+
+
 def get_tracer(name: str = __name__) -> trace.Tracer:
     """
     Get a tracer instance for creating custom spans.
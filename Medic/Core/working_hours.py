@@ -22,6 +22,8 @@ Multiple time ranges per day are supported:
 
 import json
 import logging
+import threading
+import time as time_module
 from dataclasses import dataclass
 from datetime import datetime, time
 from typing import Any, Optional
@@ -44,6 +46,10 @@ DAY_NAME_TO_WEEKDAY = {
 
 WEEKDAY_TO_DAY_NAME = {v: k for k, v in DAY_NAME_TO_WEEKDAY.items()}
 
+# How long a service's schedule lookup is reused before hitting the database
+# again. Schedule assignments change rarely, so a short TTL bounds staleness.
+SCHEDULE_CACHE_TTL_SECONDS = 60.0
+
 
 @dataclass
 class TimeRange:
@@ -233,16 +239,36 @@ def get_schedule(schedule_id: int) -> Optional[Schedule]:
         return None
 
 
+# Cache of service_id -> (expires_at, schedule) for get_schedule_for_service
+_service_schedule_cache: dict[int, tuple[float, Schedule | None]] = {}
+_service_schedule_cache_lock = threading.Lock()
+
+
+def clear_schedule_cache() -> None:
+    """Clear cached service schedule lookups."""
+    with _service_schedule_cache_lock:
+        _service_schedule_cache.clear()
+
+
 def get_schedule_for_service(service_id: int) -> Optional[Schedule]:
     """
     Get the schedule associated with a service.
 
+    Lookups are cached per service for SCHEDULE_CACHE_TTL_SECONDS. Database
+    errors are not cached.
+
     Args:
         service_id: The service ID to look up
 
     Returns:
         Schedule object or None if service has no schedule
     """
+    now = time_module.monotonic()
+    with _service_schedule_cache_lock:
+        cached = _service_schedule_cache.get(service_id)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
     query = """
         SELECT s.schedule_id, s.name, s.timezone, s.hours
         FROM medic.schedules s
@@ -256,24 +282,30 @@ def get_schedule_for_service(service_id: int) -> Optional[Schedule]:
 
     try:
         data = json.loads(str(result))
-        if not data:
-            return None
-
-        row = data[0]
-        hours_data = row.get("hours", {})
-        if isinstance(hours_data, str):
-            hours_data = json.loads(hours_data)
-
-        return Schedule(
-            schedule_id=row["schedule_id"],
-            name=row["name"],
-            timezone=row["timezone"],
-            hours=parse_hours(hours_data),
-        )
+        schedule = None
+        if data:
+            row = data[0]
+            hours_data = row.get("hours", {})
+            if isinstance(hours_data, str):
+                hours_data = json.loads(hours_data)
+
+            schedule = Schedule(
+                schedule_id=row["schedule_id"],
+                name=row["name"],
+                timezone=row["timezone"],
+                hours=parse_hours(hours_data),
+            )
     except (json.JSONDecodeError, TypeError, KeyError, ValueError) as e:
         logger.error(f"Failed to parse schedule for service {service_id}: {e}")
         return None
 
+    with _service_schedule_cache_lock:
+        _service_schedule_cache[service_id] = (
+            now + SCHEDULE_CACHE_TTL_SECONDS,
+            schedule,
+        )
+    return schedule
+
 
 def is_within_working_hours(
     schedule: Schedule,
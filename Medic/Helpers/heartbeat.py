@@ -3,8 +3,11 @@
 import Medic.Core.database as db
 from datetime import datetime
 from enum import Enum
-from typing import Optional, Union
-import pytz
+from typing import Any
+from zoneinfo import ZoneInfo
+
+# Timezone used for heartbeat timestamps
+HEARTBEAT_TIMEZONE = ZoneInfo("America/Chicago")
 
 
 class HeartbeatStatus(str, Enum):
@@ -52,13 +55,11 @@ class Heartbeat:
     """
 
     def __init__(
-        self, s_id: int, name: str, current_status: str, run_id: Optional[str] = None
+        self, s_id: int, name: str, current_status: str, run_id: str | None = None
     ):
         self.service_id = s_id
         self.heartbeat_name = name
-        self.time = datetime.now(pytz.timezone("America/Chicago")).strftime(
-            "%Y-%m-%d %H:%M:%S %Z"
-        )
+        self.time = datetime.now(HEARTBEAT_TIMEZONE).strftime("%Y-%m-%d %H:%M:%S %Z")
         self.status = current_status
         self.run_id = run_id
 
@@ -94,8 +95,8 @@ def addHeartbeat(heartbeat_obj: Heartbeat) -> bool:
 
 
 def queryHeartbeats(
-    h_name: str, starttime: Optional[str] = None, endtime: Optional[str] = None
-) -> Optional[Union[str, list]]:
+    h_name: str, starttime: str | None = None, endtime: str | None = None
+) -> str | list[dict[str, Any]] | None:
     """
     Query heartbeats by name and optional time range.
 
@@ -105,7 +106,8 @@ def queryHeartbeats(
         endtime: Optional end time filter
 
     Returns:
-        JSON string of results or error message
+        List of heartbeat rows, an error message string, or None on
+        database error
     """
     base_query = """
         SELECT heartbeat_id, services.heartbeat_name, services.service_name,
@@ -117,7 +119,7 @@ def queryHeartbeats(
 
     if starttime is None and endtime is None:
         query = base_query + " ORDER BY time DESC LIMIT 250"
-        result = db.query_db(query, (h_name,), show_columns=True)
+        result = db.query_db_rows(query, (h_name,))
         return result
     elif starttime is None and endtime is not None:
         return "You must enter an end_time"
@@ -127,11 +129,11 @@ def queryHeartbeats(
         query = (
             base_query + " AND time >= %s AND time <= %s ORDER BY time DESC LIMIT 250"
         )
-        result = db.query_db(query, (h_name, starttime, endtime), show_columns=True)
+        result = db.query_db_rows(query, (h_name, starttime, endtime))
         return result
 
 
-def queryLastHeartbeat(heartbeat_name: str) -> Optional[Union[str, list]]:
+def queryLastHeartbeat(heartbeat_name: str) -> list[dict[str, Any]] | None:
     """
     Query the most recent heartbeat by name.
 
@@ -139,7 +141,7 @@ def queryLastHeartbeat(heartbeat_name: str) -> Optional[Union[str, list]]:
         heartbeat_name: Heartbeat name to query
 
     Returns:
-        JSON string of the most recent heartbeat
+        List containing the most recent heartbeat row, or None on error
     """
     query = """
         SELECT heartbeat_id, services.heartbeat_name, services.service_name,
@@ -150,11 +152,11 @@ def queryLastHeartbeat(heartbeat_name: str) -> Optional[Union[str, list]]:
         ORDER BY time DESC
         LIMIT 1
     """
-    result = db.query_db(query, (heartbeat_name,), show_columns=True)
+    result = db.query_db_rows(query, (heartbeat_name,))
     return result
 
 
-def queryHeartbeatsByRunId(run_id: str) -> Optional[Union[str, list]]:
+def queryHeartbeatsByRunId(run_id: str) -> list[dict[str, Any]] | None:
     """
     Query heartbeats by run_id to find correlated start/complete events.
 
@@ -162,7 +164,7 @@ def queryHeartbeatsByRunId(run_id: str) -> Optional[Union[str, list]]:
         run_id: The run identifier to query
 
     Returns:
-        JSON string of heartbeats with the given run_id
+        List of heartbeat rows with the given run_id, or None on error
     """
     query = """
         SELECT heartbeat_id, services.heartbeat_name, services.service_name,
@@ -172,5 +174,5 @@ def queryHeartbeatsByRunId(run_id: str) -> Optional[Union[str, list]]:
         WHERE h.run_id = %s
         ORDER BY time ASC
     """
-    result = db.query_db(query, (run_id,), show_columns=True)
+    result = db.query_db_rows(query, (run_id,))
     return result
@@ -2,6 +2,7 @@
 
 import os
 import logging
+from functools import lru_cache
 
 # Log level mapping
 LOG_LEVELS = {
@@ -12,12 +13,17 @@ LOG_LEVELS = {
     "CRITICAL": logging.CRITICAL,
 }
 
+# Track whether configure_logging() has already run
+_configured = False
 
+
+@lru_cache(maxsize=1)
 def logSetup() -> int:
     """
     Get the configured log level.
 
     Uses LOG_LEVEL environment variable if set, otherwise defaults to WARNING.
+    The level is read once per process; call logSetup.cache_clear() to re-read.
 
     Returns:
         Logging level as integer
@@ -27,10 +33,19 @@ def logSetup() -> int:
 
 
 def configure_logging():
-    """Configure logging for the application."""
+    """
+    Configure logging for the application.
+
+    Does nothing if it has already run or the root logger already has
+    handlers (e.g. from Medic.Core.logging_config).
+    """
+    global _configured
+    if _configured or logging.getLogger().handlers:
+        return
     level = logSetup()
     logging.basicConfig(
         level=level,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
+    _configured = True
@@ -4,5 +4,5 @@ import uuid
 
 
 def generate_random_uuid() -> str:
-    """Generate a random UUID string."""
-    return str(uuid.uuid4())
+    """Generate a random UUID as a 32-character hex string (no dashes)."""
+    return uuid.uuid4().hex
@@ -2,6 +2,8 @@
 
 import psycopg2
 import os
+import re
+from datetime import UTC, date, datetime, timedelta
 
 from Medic.Core.logging_config import configure_logging, get_logger
 
@@ -9,6 +11,14 @@ from Medic.Core.logging_config import configure_logging, get_logger
 configure_logging()
 logger = get_logger(__name__)
 
+# Rows removed per DELETE statement. Bounded batches keep lock hold times and
+# WAL bursts small and let autovacuum interleave with the cleanup.
+CLEANUP_BATCH_SIZE = 10000
+
+# Monthly partitions of "heartbeatEvents" (see migration 018)
+PARTITION_NAME_PATTERN = re.compile(r"^heartbeatEvents_(\d{4})(\d{2})$")
+DEFAULT_PARTITION = "heartbeatEvents_default"
+
 
 def connect_db():
     """Create a connection to the PostgreSQL database."""
@@ -29,39 +39,162 @@ def connect_db():
         logger.log(
             level=50,
             msg=f"Failed to connect to {dbname} with supplied credentials. "
-            f"Is it running and do you have access? Error: {str(e)}",
+            f"Is it running and do you have access? Error: {e}",
         )
         raise ConnectionError(str(e))
 
 
+def _month_start(day: date) -> date:
+    """Return the first day of the month containing day."""
+    return day.replace(day=1)
+
+
+def _next_month(month_start: date) -> date:
+    """Return the first day of the month after month_start."""
+    if month_start.month == 12:
+        return month_start.replace(year=month_start.year + 1, month=1)
+    return month_start.replace(month=month_start.month + 1)
+
+
+def _partition_month(name: str) -> date | None:
+    """Return the month a partition covers, or None for non-monthly partitions."""
+    match = PARTITION_NAME_PATTERN.match(name)
+    if not match:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+def is_partitioned(cur) -> bool:
+    """Check whether "heartbeatEvents" is a partitioned table."""
+    cur.execute(
+        "SELECT 1 FROM pg_partitioned_table "
+        "WHERE partrelid = to_regclass('\"heartbeatEvents\"')"
+    )
+    return cur.fetchone() is not None
+
+
+def _table_exists(cur, name: str) -> bool:
+    """Check whether a table with the given name is visible on the search path."""
+    cur.execute("SELECT to_regclass(%s) IS NOT NULL", (f'"{name}"',))
+    return cur.fetchone()[0]
+
+
+def ensure_heartbeat_partitions(cur, today: date) -> None:
+    """
+    Create the current and next month's heartbeatEvents partitions.
+
+    Rows for a month without a partition land in the DEFAULT partition, and
+    Postgres refuses to create a partition whose range the default already
+    holds rows for (e.g. after a missed run). The default is therefore
+    detached while a missing partition is created, and its rows for that
+    month are moved into the new partition before it is attached again.
+    """
+    month = _month_start(today)
+    for start in (month, _next_month(month)):
+        name = f"heartbeatEvents_{start:%Y%m}"
+        if _table_exists(cur, name):
+            continue
+        end = _next_month(start)
+        has_default = _table_exists(cur, DEFAULT_PARTITION)
+        if has_default:
+            cur.execute(
+                f'ALTER TABLE "heartbeatEvents" DETACH PARTITION "{DEFAULT_PARTITION}"'
+            )
+        cur.execute(
+            f'CREATE TABLE "{name}" '
+            'PARTITION OF "heartbeatEvents" FOR VALUES FROM (%s) TO (%s)',
+            (start, end),
+        )
+        if has_default:
+            cur.execute(
+                f'WITH moved AS (DELETE FROM "{DEFAULT_PARTITION}" '
+                "WHERE time >= %s AND time < %s RETURNING *) "
+                f'INSERT INTO "{name}" SELECT * FROM moved',
+                (start, end),
+            )
+            cur.execute(
+                'ALTER TABLE "heartbeatEvents" '
+                f'ATTACH PARTITION "{DEFAULT_PARTITION}" DEFAULT'
+            )
+        logger.log(level=20, msg=f"DB Cleanup: Created partition {name}")
+
+
+def drop_expired_partitions(cur, cutoff: date) -> int:
+    """
+    Drop monthly partitions whose whole range is older than cutoff.
+
+    A partition is only dropped once the day after its upper bound is at or
+    before cutoff, which absorbs any session time zone offset in the bounds.
+
+    Returns:
+        Number of partitions dropped
+    """
+    cur.execute(
+        "SELECT c.relname FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = '\"heartbeatEvents\"'::regclass"
+    )
+    dropped = 0
+    for (name,) in cur.fetchall():
+        month = _partition_month(name)
+        if month is None:
+            continue
+        if _next_month(month) + timedelta(days=1) <= cutoff:
+            cur.execute(f'DROP TABLE IF EXISTS "{name}"')
+            logger.log(level=20, msg=f"DB Cleanup: Dropped partition {name}")
+            dropped += 1
+    return dropped
+
+
 def cleanup_old_heartbeats(days: int = 30) -> int:
     """
     Delete heartbeat entries older than specified days.
 
+    When "heartbeatEvents" is partitioned, upcoming monthly partitions are
+    created and partitions entirely older than the cutoff are dropped first.
+    Remaining expired rows are removed in batches of CLEANUP_BATCH_SIZE,
+    committing after each batch, until no matching rows remain.
+
     Args:
         days: Number of days to retain (default 30)
 
     Returns:
-        Number of rows deleted
+        Number of rows deleted (rows in dropped partitions are not counted)
     """
     client = None
     cur = None
     try:
         client = connect_db()
         cur = client.cursor()
-        # Use parameterized interval - note: psycopg2 handles interval properly
-        cur.execute(
-            'DELETE FROM "heartbeatEvents" WHERE time <= (NOW() - INTERVAL %s)',
-            (f"{days} days",),
-        )
-        rows_deleted = cur.rowcount
-        client.commit()
+        if is_partitioned(cur):
+            today = datetime.now(UTC).date()
+            ensure_heartbeat_partitions(cur, today)
+            dropped = drop_expired_partitions(cur, today - timedelta(days=days))
+            client.commit()
+            logger.log(
+                level=20,
+                msg=f"DB Cleanup: Dropped {dropped} heartbeat partitions older than {days} days",
+            )
+        rows_deleted = 0
+        while True:
+            # Use parameterized interval - note: psycopg2 handles interval properly
+            cur.execute(
+                'DELETE FROM "heartbeatEvents" WHERE (heartbeat_id, time) IN ('
+                'SELECT heartbeat_id, time FROM "heartbeatEvents" '
+                "WHERE time <= (NOW() - INTERVAL %s) LIMIT %s)",
+                (f"{days} days", CLEANUP_BATCH_SIZE),
+            )
+            batch_deleted = cur.rowcount
+            client.commit()
+            if batch_deleted <= 0:
+                break
+            rows_deleted += batch_deleted
         logger.log(
             level=20,
             msg=f"DB Cleanup: Deleted {rows_deleted} heartbeat events older than {days} days",
         )
         return rows_deleted
-    except psycopg2.Error as e:
+    except (psycopg2.Error, ConnectionError) as e:
         logger.log(level=40, msg=f"Unable to perform cleanup: {str(e)}")
         return 0
     finally:
@@ -1,18 +1,28 @@
+import atexit
 import os
-from datetime import datetime
-import pytz
+import select
+from collections import namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import UTC, datetime
+from zoneinfo import ZoneInfo
 import threading
 import time
+from contextlib import contextmanager
 import psycopg2
+import psycopg2.extras
+import psycopg2.pool
+from Medic.Core.database import execute_prepared
 from Medic.Core.logging_config import configure_logging, get_logger
 from Medic.Worker import slack_client as slack
 from Medic.Worker import pagerduty_client as pagerduty
+from config import get_config
 
 # Import telemetry
 try:
     from Medic.Core.telemetry import (
         init_worker_telemetry,
         get_tracer,
+        is_tracing_configured,
         shutdown_telemetry,
     )
     from opentelemetry import trace
@@ -23,27 +33,24 @@ except ImportError:
     TELEMETRY_AVAILABLE = False
     init_worker_telemetry = None  # type: ignore[misc, assignment]
     get_tracer = None  # type: ignore[misc, assignment]
+    is_tracing_configured = None  # type: ignore[misc, assignment]
     shutdown_telemetry = None  # type: ignore[misc, assignment]
     trace = None  # type: ignore[misc, assignment]
 
 # Import maintenance window checker
 try:
-    from Medic.Core.maintenance_windows import (
-        is_service_in_maintenance,
-        get_active_maintenance_window_for_service,
-    )
+    from Medic.Core.maintenance_windows import get_active_maintenance_windows
 
     MAINTENANCE_WINDOWS_AVAILABLE = True
 except ImportError:
     MAINTENANCE_WINDOWS_AVAILABLE = False
-    is_service_in_maintenance = None  # type: ignore[misc, assignment]
-    get_active_maintenance_window_for_service = None  # type: ignore[misc, assignment]
+    get_active_maintenance_windows = None  # type: ignore[misc, assignment]
 
 # Import duration threshold checker
 try:
     from Medic.Core.job_runs import (
         get_stale_runs_exceeding_max_duration,
-        mark_stale_run_alerted,
+        mark_stale_runs_alerted,
         DurationAlert,
     )
 
@@ -51,7 +58,7 @@ try:
 except ImportError:
     DURATION_ALERTS_AVAILABLE = False
     get_stale_runs_exceeding_max_duration = None  # type: ignore[misc, assignment]
-    mark_stale_run_alerted = None  # type: ignore[misc, assignment]
+    mark_stale_runs_alerted = None  # type: ignore[misc, assignment]
     DurationAlert = None  # type: ignore[misc, assignment]
 
 # Import metrics
@@ -65,6 +72,9 @@ try:
         record_alert_resolved,
         WORKER_CYCLE_DURATION,
         WORKER_SERVICES_CHECKED,
+        WORKER_CYCLE_OVERRUN,
+        disable_runtime_collectors,
+        push_metrics,
     )
 
     METRICS_AVAILABLE = True
@@ -77,10 +87,16 @@ except ImportError:
     record_alert_resolved = None  # type: ignore[misc, assignment]
     WORKER_CYCLE_DURATION = None  # type: ignore[misc, assignment]
     WORKER_SERVICES_CHECKED = None  # type: ignore[misc, assignment]
+    WORKER_CYCLE_OVERRUN = None  # type: ignore[misc, assignment]
+    disable_runtime_collectors = None  # type: ignore[misc, assignment]
+    push_metrics = None  # type: ignore[misc, assignment]
 
 # Default metrics server port
 DEFAULT_METRICS_PORT = 9091
 
+# When set, metrics are pushed here after each cycle instead of being served
+METRICS_PUSHGATEWAY = os.environ.get("METRICS_PUSHGATEWAY")
+
 # Import playbook alert integration
 try:
     from Medic.Core.playbook_alert_integration import (
@@ -103,96 +119,322 @@ _tracer = None
 
 
 def _get_tracer():
-    """Get the tracer instance, initializing if needed."""
+    """
+    Get the tracer instance, initializing if needed.
+
+    Returns None while no spans are exported, so each cycle skips span
+    creation entirely when tracing is disabled.
+    """
     global _tracer
-    if _tracer is None and TELEMETRY_AVAILABLE and get_tracer is not None:
+    if _tracer is None and TELEMETRY_AVAILABLE and is_tracing_configured():
         _tracer = get_tracer("medic.worker")
     return _tracer
 
 
+class _MaintenanceLookup:
+    """Active maintenance windows, loaded at most once per monitor cycle."""
+
+    def __init__(self):
+        self._windows = None
+        self._lock = threading.Lock()
+
+    def window_for(self, service_id):
+        """Return the active window covering service_id, or None."""
+        if not MAINTENANCE_WINDOWS_AVAILABLE:
+            return None
+        with self._lock:
+            if self._windows is None:
+                self._windows = get_active_maintenance_windows()
+        for window in self._windows:
+            if window.applies_to_service(service_id):
+                return window
+        return None
+
+
+ACTIVE_ALERTS_QUERY = (
+    "SELECT DISTINCT ON (service_id) * FROM alerts WHERE active = 1 "
+    "ORDER BY service_id, alert_id DESC"
+)
+
+
+class _ActiveAlerts:
+    """
+    Latest active alert per service, loaded at most once per monitor cycle.
+
+    The rows are read on the connection of the first caller, so loading
+    them never needs a second pooled connection.
+    """
+
+    def __init__(self):
+        self._alerts = None
+        self._lock = threading.Lock()
+
+    def pop(self, service_id, conn=None):
+        """Return and forget the active alert row for service_id, or None."""
+        with self._lock:
+            if self._alerts is None:
+                rows = query_db(
+                    ACTIVE_ALERTS_QUERY,
+                    show_columns=False,
+                    conn=conn,
+                    prepare="medic_worker_active_alerts",
+                )
+                if rows is None:
+                    # Not cached, so the next caller retries the load
+                    return None
+                self._alerts = {row[2]: row for row in rows}
+            return self._alerts.pop(service_id, None)
+
+
+# Slack and PagerDuty calls run on a small thread pool so a slow
+# notification API does not hold up the heartbeat check
+NOTIFIER_MAX_WORKERS = 8
+NOTIFIER_MAX_PENDING = 256
+_notifier = ThreadPoolExecutor(
+    max_workers=NOTIFIER_MAX_WORKERS, thread_name_prefix="medic-notifier"
+)
+_notifier_slots = threading.BoundedSemaphore(NOTIFIER_MAX_PENDING)
+
+
+def _dispatch(func, *args, **kwargs):
+    """
+    Run a notification call on the notifier pool.
+
+    Blocks once NOTIFIER_MAX_PENDING calls are outstanding so a stalled
+    notification API applies back-pressure instead of queueing without bound.
+    """
+    _notifier_slots.acquire()
+    try:
+        future = _notifier.submit(func, *args, **kwargs)
+    except RuntimeError:
+        # Pool already shut down; deliver inline
+        _notifier_slots.release()
+        func(*args, **kwargs)
+        return
+    future.add_done_callback(_notification_done)
+
+
+def _notification_done(future):
+    _notifier_slots.release()
+    exc = future.exception()
+    if exc is not None:
+        logger.error("Notification failed: %s", exc)
+
+
+# A cycle with at least this many Slack notices posts them combined, at most
+# SLACK_BATCH_MAX_NOTICES per message
+SLACK_BATCH_THRESHOLD = 3
+SLACK_BATCH_MAX_NOTICES = 20
+
+
+class _SlackBatch:
+    """
+    Slack notices raised during one cycle, posted when the cycle ends.
+
+    A few notices are still sent one per message; during a wide outage they
+    are joined into a handful of messages instead of one Slack call each.
+    """
+
+    def __init__(self):
+        self._messages = []
+        self._lock = threading.Lock()
+
+    def add(self, message):
+        with self._lock:
+            self._messages.append(message)
+
+    def flush(self):
+        with self._lock:
+            messages, self._messages = self._messages, []
+        if len(messages) < SLACK_BATCH_THRESHOLD:
+            for message in messages:
+                _dispatch(slack.send_message, message)
+            return
+        for start in range(0, len(messages), SLACK_BATCH_MAX_NOTICES):
+            chunk = messages[start : start + SLACK_BATCH_MAX_NOTICES]
+            _dispatch(slack.send_message, "\n".join(chunk))
+
+
+def _notify_slack(message, slack_batch=None):
+    """Send message now, or add it to the cycle's batch when given one."""
+    if slack_batch is None:
+        _dispatch(slack.send_message, message)
+    else:
+        slack_batch.add(message)
+
+
+# Connection pool shared by all worker database calls (created lazily)
+POOL_MIN_CONNECTIONS = 2
+POOL_MAX_CONNECTIONS = 16
+
+# Services in a cycle are checked in parallel, each holding one pooled
+# connection. The cycle query and recovery checks never overlap them (the
+# first finishes before they start, the second waits on _check_lock), but
+# the stale-job check runs alongside and holds one connection at a time.
+SERVICE_WORKERS = POOL_MAX_CONNECTIONS - 1
+_service_executor = ThreadPoolExecutor(
+    max_workers=SERVICE_WORKERS, thread_name_prefix="medic-service"
+)
+_pool: psycopg2.pool.ThreadedConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> psycopg2.pool.ThreadedConnectionPool:
+    """Get the worker connection pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            user = os.environ["PG_USER"]
+            password = os.environ["PG_PASS"]
+            dbname = os.environ["DB_NAME"]
+            dbhost = os.environ["DB_HOST"]
+            try:
+                _pool = psycopg2.pool.ThreadedConnectionPool(
+                    POOL_MIN_CONNECTIONS,
+                    POOL_MAX_CONNECTIONS,
+                    user=user,
+                    password=password,
+                    host=dbhost,
+                    port="5432",
+                    database=dbname,
+                )
+            except psycopg2.Error as e:
+                logger.critical(
+                    "Failed to connect to %s with supplied credentials. "
+                    "Is it running and do you have access? Error: %s",
+                    dbname,
+                    e,
+                )
+                raise ConnectionError
+            logger.info(
+                "Connected to %s:5432\\%s with user: %s successfully.",
+                dbhost,
+                dbname,
+                user,
+            )
+        return _pool
+
+
+def close_pool():
+    """Close all pooled connections and discard the pool."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.closeall()
+            _pool = None
+
+
 def connect_db():
-    user = os.environ["PG_USER"]
-    password = os.environ["PG_PASS"]
-    dbname = os.environ["DB_NAME"]
-    dbhost = os.environ["DB_HOST"]
+    """Check out a connection from the worker pool."""
+    pool = get_pool()
     try:
-        conn = psycopg2.connect(
-            user=user, password=password, host=dbhost, port="5432", database=dbname
-        )
-        logger.log(
-            level=20,
-            msg="Connected to "
-            + dbhost
-            + ":5432\\"
-            + dbname
-            + " with user: "
-            + user
-            + " successfully.",
-        )
+        conn = pool.getconn()
+        if conn.closed:
+            # Drop connections the server has closed and take a fresh one
+            pool.putconn(conn, close=True)
+            conn = pool.getconn()
         return conn
     except psycopg2.Error as e:
-        logger.log(
-            level=50,
-            msg="Failed to connect to "
-            + dbname
-            + " with supplied credentials. Is it running and do you have access? Error: "
-            + str(e),
-        )
+        logger.critical("Failed to get a database connection: %s", e)
         raise ConnectionError
 
 
-def to_json(rows, columns):
-    data = []
-    for r in rows:
-        d = {}
-        for c in range(len(columns)):
-            d[columns[c]] = r[c]
-        data.append(d)
-    return data
+def release_db(conn):
+    """Return a connection obtained from connect_db() to the pool."""
+    pool = _pool
+    if pool is not None:
+        pool.putconn(conn)
+    else:
+        conn.close()
 
 
-def query_db(query, params=None, show_columns=True):
-    client = None
-    cur = None
+@contextmanager
+def borrow(conn=None):
+    """
+    Yield conn if one is given, otherwise a pooled connection.
+
+    A pooled connection is returned to the pool when the block exits; a
+    connection passed in is left open for its owner.
+    """
+    if conn is not None:
+        yield conn
+        return
+    client = connect_db()
     try:
-        client = connect_db()
-        cur = client.cursor()
-        cur.execute(query, params)
-        rows = cur.fetchall()
-        if show_columns:
-            col_names = [elt[0] for elt in cur.description]
-            return to_json(rows, col_names)
-        else:
-            return rows
-    except psycopg2.Error as e:
-        logger.log(
-            level=30, msg="Unable to perform query. An Error has occurred: " + str(e)
-        )
-        return None
+        yield client
     finally:
-        if cur:
-            cur.close()
-        if client:
-            client.close()
+        release_db(client)
+
+
+def _reset_pool_after_fork():
+    """Forget the parent's pool in a forked child without closing its sockets."""
+    global _pool, _pool_lock
+    _pool = None
+    _pool_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pool_after_fork)
 
 
-def insert_db(query, params=None):
-    client = None
-    cur = None
+def query_db(
+    query, params=None, show_columns=True, conn=None, commit=False, prepare=None
+):
+    """Run a query and return its rows.
+
+    When conn is given the query runs on that connection, which is left
+    open for the caller, and database errors are raised so the caller can
+    roll its transaction back; otherwise a pooled connection is used, errors
+    are logged and None is returned, and with commit=True the pooled
+    connection is committed before it is released (for writes with
+    RETURNING). With prepare, the query runs as that server-side prepared
+    statement, which lives as long as the pooled connection. With
+    show_columns, rows come back as dicts keyed by column name.
+    """
+    cursor_factory = psycopg2.extras.RealDictCursor if show_columns else None
+    try:
+        with borrow(conn) as client:
+            cur = client.cursor(cursor_factory=cursor_factory)
+            try:
+                if prepare:
+                    execute_prepared(cur, prepare, query, params)
+                else:
+                    cur.execute(query, params)
+                rows = cur.fetchall()
+                if commit and conn is None:
+                    client.commit()
+                return rows
+            finally:
+                cur.close()
+    except (psycopg2.Error, ConnectionError) as e:
+        if conn is not None:
+            raise
+        logger.warning("Unable to perform query. An Error has occurred: %s", e)
+        return None
+
+
+def insert_db(query, params=None, conn=None):
+    """Run a write statement.
+
+    When conn is given the statement joins that connection's transaction
+    and the caller commits, or rolls back on the raised database error;
+    otherwise it is committed immediately and failures return False.
+    """
     try:
-        client = connect_db()
-        cur = client.cursor()
-        cur.execute(query, params)
-        client.commit()
+        with borrow(conn) as client:
+            cur = client.cursor()
+            try:
+                cur.execute(query, params)
+            finally:
+                cur.close()
+            if conn is None:
+                client.commit()
         return True
-    except psycopg2.Error as e:
-        logger.log(level=30, msg="Unable to perform insert: " + str(e))
+    except (psycopg2.Error, ConnectionError) as e:
+        if conn is not None:
+            raise
+        logger.warning("Unable to perform insert: %s", e)
         return False
-    finally:
-        if cur:
-            cur.close()
-        if client:
-            client.close()
 
 
 def queryForNoHeartbeat():
@@ -217,20 +459,90 @@ def queryForNoHeartbeat():
         if METRICS_AVAILABLE and WORKER_CYCLE_DURATION is not None:
             duration = time.time() - start_time
             WORKER_CYCLE_DURATION.observe(duration)
+        if METRICS_AVAILABLE and METRICS_PUSHGATEWAY:
+            push_metrics(METRICS_PUSHGATEWAY)
+
+
+# Last-seen times in alert and recovery messages use this zone and format;
+# timestamps written to the database stay timezone-aware UTC
+ALERT_TIMEZONE = ZoneInfo("America/Chicago")
+ALERT_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# A muted service is unmuted once its active alert is this many hours old
+AUTO_UNMUTE_HOURS = get_config().app.alert_auto_unmute_hours
+
+
+# Active services with their latest heartbeat and the number of heartbeats
+# inside each service's alert interval
+SERVICES_WITH_HEARTBEATS_QUERY = """
+    SELECT s.service_id, s.heartbeat_name, s.service_name, s.alert_interval,
+           s.threshold, s.team, s.priority, s.muted, s.down, s.runbook,
+           s.grace_period_seconds, h.time AS last_heartbeat_time, h.recent_count
+    FROM services s
+    LEFT JOIN LATERAL (
+        SELECT e.time, (
+            SELECT COUNT(*)
+            FROM "heartbeatEvents" c
+            WHERE c.service_id = s.service_id
+            AND c.time >= NOW() - make_interval(mins => s.alert_interval)
+        ) AS recent_count
+        FROM "heartbeatEvents" e
+        WHERE e.service_id = s.service_id
+        ORDER BY e.time DESC
+        LIMIT 1
+    ) h ON true
+    WHERE s.active = 1 AND s.service_name <> %s
+"""
+
+# Healthy services that are not down need no action, so the cycle only
+# fetches services that are failing or still marked down
+SERVICES_TO_CHECK_QUERY = (
+    SERVICES_WITH_HEARTBEATS_QUERY + " AND (s.down = 1 OR h.recent_count IS NULL"
+    " OR h.recent_count < s.threshold)"
+)
+
+# One row of SERVICES_WITH_HEARTBEATS_QUERY, in select order
+Service = namedtuple(
+    "Service",
+    [
+        "service_id",
+        "heartbeat_name",
+        "service_name",
+        "alert_interval",
+        "threshold",
+        "team",
+        "priority",
+        "muted",
+        "down",
+        "runbook",
+        "grace_period_seconds",
+        "last_heartbeat_time",
+        "recent_count",
+    ],
+)
+
+# Serializes full cycles and notification-driven recovery checks so a
+# service is never evaluated by both at once
+_check_lock = threading.Lock()
 
 
 def _queryForNoHeartbeat_impl(span):
-    # Setup main timezone
-    tz = pytz.timezone("America/Chicago")
+    with _check_lock:
+        _check_heartbeats(span)
+
 
-    # Setup the main loop for active services to check
+def _check_heartbeats(span):
     res = query_db(
-        "SELECT * FROM services WHERE active = 1 AND service_name <> %s",
+        SERVICES_TO_CHECK_QUERY,
         ("fakeservice",),
-        show_columns=True,
+        show_columns=False,
+        prepare="medic_worker_services_to_check",
     )
-    if res is None or res == []:
-        logger.log(level=20, msg="No Services configured for heartbeats.")
+    if res is None:
+        logger.error("Unable to check heartbeats: database unavailable.")
+        return
+    if res == []:
+        logger.debug("No services are failing or down.")
         if span:
             span.set_attribute("services.checked", 0)
         return
@@ -242,100 +554,286 @@ def _queryForNoHeartbeat_impl(span):
     if METRICS_AVAILABLE and WORKER_SERVICES_CHECKED is not None:
         WORKER_SERVICES_CHECKED.inc(len(res))
 
-    for heartbeat in res:
-        s_id = heartbeat["service_id"]
-        name = heartbeat["heartbeat_name"]
-        s_name = heartbeat["service_name"]
-        interval = heartbeat["alert_interval"]
-        threshold = heartbeat["threshold"]
-        team = heartbeat["team"]
-        priority = heartbeat["priority"]
-        muted = heartbeat["muted"]
-        down = heartbeat["down"]
-        runbook = heartbeat.get("runbook")
-        grace_period = heartbeat.get("grace_period_seconds", 0) or 0
-        fmt = "%Y-%m-%d %H:%M:%S"
-        now_cdt = datetime.now(tz).strftime(fmt)
-
-        # Query for recent heartbeat(s) with parameterized query
-        query = """
-            SELECT time, (
-                SELECT COUNT(service_id)
-                FROM "heartbeatEvents"
-                WHERE service_id = %s
-                AND time >= NOW() - INTERVAL '%s minutes'
-                GROUP BY service_id
+    # One timestamp for the whole cycle
+    now_utc = datetime.now(UTC)
+    maintenance = _MaintenanceLookup()
+    active_alerts = _ActiveAlerts()
+    slack_batch = _SlackBatch()
+    try:
+        list(
+            _service_executor.map(
+                lambda heartbeat: _process_service(
+                    heartbeat,
+                    now_utc,
+                    maintenance,
+                    active_alerts,
+                    slack_batch,
+                ),
+                map(Service._make, res),
             )
-            FROM "heartbeatEvents"
-            WHERE service_id = %s
-            ORDER BY time DESC
-            LIMIT 1
-        """
-        last_hbeat = query_db(query, (s_id, interval, s_id), show_columns=False)
-        logger.log(level=20, msg=str(last_hbeat))
+        )
+    finally:
+        slack_batch.flush()
 
-        if last_hbeat is None or last_hbeat == []:
-            logger.log(level=40, msg="ERROR: No results found for " + name)
-            if muted != 1:
-                message = (
-                    ":elmofire: `"
-                    + str(name)
-                    + "` has been registered in medic but has not yet "
-                    "sent a heartbeat. This message will repeat until muted. :elmofire:"
+
+def _process_service(heartbeat, now_utc, maintenance, active_alerts, slack_batch=None):
+    """Check one service on its own pooled connection and commit its updates."""
+    try:
+        with borrow() as conn:
+            # Each service commits on its own so one failure does not
+            # discard the others
+            try:
+                _check_service(
+                    conn,
+                    heartbeat,
+                    now_utc,
+                    maintenance,
+                    active_alerts,
+                    slack_batch,
                 )
-                slack.send_message(message)
-        else:
-            last_hbeat_count = last_hbeat[0][1] if last_hbeat[0][1] is not None else 0
-            lh_cvtd = (last_hbeat[0][0]).astimezone(tz).strftime(fmt)
-
-            if int(last_hbeat_count) < int(threshold):
-                # Check grace period before alerting
-                # Grace period adds additional delay after expected heartbeat window
-                if grace_period > 0:
-                    last_hbeat_time = last_hbeat[0][0]
-                    now_utc = datetime.now(pytz.UTC)
-                    # Ensure last_hbeat_time is timezone-aware
-                    if last_hbeat_time.tzinfo is None:
-                        last_hbeat_time = pytz.UTC.localize(last_hbeat_time)
-                    time_since_last = (now_utc - last_hbeat_time).total_seconds()
-                    # Alert interval is in minutes, grace period is in seconds
-                    interval_seconds = int(interval) * 60
-                    required_delay = interval_seconds + grace_period
-                    if time_since_last < required_delay:
-                        grace_remaining = int(required_delay - time_since_last)
-                        logger.log(
-                            level=20,
-                            msg=f"Alert delayed for {name}: grace period "
-                            f"({grace_remaining}s remaining)",
-                        )
-                        continue
-
-                # Check if service is in maintenance window before alerting
-                if MAINTENANCE_WINDOWS_AVAILABLE and is_service_in_maintenance(s_id):
-                    window = get_active_maintenance_window_for_service(s_id)
-                    window_name = window.name if window else "Unknown"
-                    logger.log(
-                        level=20,
-                        msg=f"Alert suppressed for {name}: service is in maintenance window '{window_name}'",
-                    )
-                else:
-                    sendAlert(
-                        s_id,
-                        s_name,
+                conn.commit()
+            except psycopg2.Error as e:
+                conn.rollback()
+                logger.error(
+                    "Failed to update heartbeat state for %s: %s",
+                    heartbeat.heartbeat_name,
+                    e,
+                )
+    except ConnectionError:
+        logger.error(
+            "Unable to check %s: database unavailable.", heartbeat.heartbeat_name
+        )
+
+
+def _check_service(
+    conn,
+    heartbeat,
+    now_utc,
+    maintenance,
+    active_alerts=None,
+    slack_batch=None,
+):
+    """Alert on or recover a single service on the given connection."""
+    s_id = heartbeat.service_id
+    name = heartbeat.heartbeat_name
+    s_name = heartbeat.service_name
+    interval = heartbeat.alert_interval
+    threshold = heartbeat.threshold
+    team = heartbeat.team
+    priority = heartbeat.priority
+    muted = heartbeat.muted
+    down = heartbeat.down
+    runbook = heartbeat.runbook
+    grace_period = heartbeat.grace_period_seconds or 0
+
+    last_hbeat_time = heartbeat.last_heartbeat_time
+
+    if last_hbeat_time is None:
+        logger.error("ERROR: No results found for %s", name)
+        if muted != 1:
+            message = (
+                f":elmofire: `{name}` has been registered in medic but has not yet "
+                "sent a heartbeat. This message will repeat until muted. :elmofire:"
+            )
+            _notify_slack(message, slack_batch)
+    else:
+        last_hbeat_count = heartbeat.recent_count or 0
+        lh_cvtd = last_hbeat_time.astimezone(ALERT_TIMEZONE).strftime(ALERT_TIME_FORMAT)
+
+        if int(last_hbeat_count) < int(threshold):
+            # Check grace period before alerting
+            # Grace period adds additional delay after expected heartbeat window
+            if grace_period > 0:
+                # Ensure last_hbeat_time is timezone-aware
+                if last_hbeat_time.tzinfo is None:
+                    last_hbeat_time = last_hbeat_time.replace(tzinfo=UTC)
+                time_since_last = (now_utc - last_hbeat_time).total_seconds()
+                # Alert interval is in minutes, grace period is in seconds
+                interval_seconds = int(interval) * 60
+                required_delay = interval_seconds + grace_period
+                if time_since_last < required_delay:
+                    grace_remaining = int(required_delay - time_since_last)
+                    logger.info(
+                        "Alert delayed for %s: grace period (%ss remaining)",
                         name,
-                        lh_cvtd,
-                        interval,
-                        team,
-                        priority,
-                        muted,
-                        now_cdt,
-                        runbook,
+                        grace_remaining,
                     )
-            elif int(last_hbeat_count) >= int(threshold) and down == 1:
-                logger.log(level=20, msg="Heartbeat: " + str(name) + " is current.")
-                closeAlert(name, s_name, s_id, lh_cvtd, team, muted, now_cdt)
+                    return
+
+            # Check if service is in maintenance window before alerting
+            window = maintenance.window_for(s_id)
+            if window is not None:
+                window_name = window.name
+                logger.info(
+                    "Alert suppressed for %s: service is in maintenance window '%s'",
+                    name,
+                    window_name,
+                )
             else:
-                logger.log(level=20, msg="Heartbeat: " + str(name) + " is current.")
+                sendAlert(
+                    s_id,
+                    s_name,
+                    name,
+                    lh_cvtd,
+                    interval,
+                    team,
+                    priority,
+                    muted,
+                    now_utc,
+                    runbook,
+                    conn=conn,
+                    slack_batch=slack_batch,
+                )
+        elif int(last_hbeat_count) >= int(threshold) and down == 1:
+            logger.info("Heartbeat: %s is current.", name)
+            closeAlert(
+                name,
+                s_name,
+                s_id,
+                lh_cvtd,
+                team,
+                muted,
+                now_utc,
+                conn=conn,
+                active_alerts=active_alerts,
+                slack_batch=slack_batch,
+            )
+        else:
+            logger.info("Heartbeat: %s is current.", name)
+
+
+# Heartbeat inserts are announced on this channel by the
+# heartbeat_events_notify trigger (migration 020)
+HEARTBEAT_CHANNEL = "heartbeat_in"
+LISTEN_RETRY_SECONDS = 15
+
+_pending_heartbeats: set[int] = set()
+_pending_heartbeats_lock = threading.Lock()
+_heartbeat_wake = threading.Event()
+
+
+def _drain_notifications(conn):
+    """Collect the service IDs from a connection's pending notifications."""
+    service_ids = set()
+    while conn.notifies:
+        notify = conn.notifies.pop(0)
+        try:
+            service_ids.add(int(notify.payload))
+        except (TypeError, ValueError):
+            logger.warning("Ignoring heartbeat notification: %r", notify.payload)
+    return service_ids
+
+
+def listen_for_heartbeats():
+    """
+    Wake the worker when heartbeats arrive.
+
+    Runs forever on a dedicated connection, queueing the service IDs
+    announced on HEARTBEAT_CHANNEL and setting the wake event so recovered
+    services can be closed without waiting for the next full cycle.
+    """
+    while True:
+        conn = None
+        try:
+            conn = psycopg2.connect(
+                user=os.environ["PG_USER"],
+                password=os.environ["PG_PASS"],
+                host=os.environ["DB_HOST"],
+                port="5432",
+                database=os.environ["DB_NAME"],
+            )
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                cur.execute(f"LISTEN {HEARTBEAT_CHANNEL}")
+            logger.info("Listening for %s notifications", HEARTBEAT_CHANNEL)
+
+            while True:
+                if select.select([conn], [], [], LISTEN_RETRY_SECONDS) == ([], [], []):
+                    continue
+                conn.poll()
+                service_ids = _drain_notifications(conn)
+                if service_ids:
+                    with _pending_heartbeats_lock:
+                        _pending_heartbeats.update(service_ids)
+                    _heartbeat_wake.set()
+        except (psycopg2.Error, OSError) as e:
+            logger.warning("Heartbeat listener disconnected: %s", e)
+        finally:
+            if conn is not None:
+                conn.close()
+        time.sleep(LISTEN_RETRY_SECONDS)
+
+
+def checkRecoveredServices():
+    """Close alerts for down services whose heartbeats were just announced."""
+    with _pending_heartbeats_lock:
+        service_ids = list(_pending_heartbeats)
+        _pending_heartbeats.clear()
+    if not service_ids:
+        return
+
+    with _check_lock:
+        try:
+            conn = connect_db()
+        except ConnectionError:
+            return
+        try:
+            # Only services back at or above their threshold; failing
+            # services are left to the regular cycle and its alert cadence
+            try:
+                res = query_db(
+                    SERVICES_WITH_HEARTBEATS_QUERY
+                    + " AND s.down = 1 AND s.service_id = ANY(%s)"
+                    " AND h.recent_count >= s.threshold",
+                    ("fakeservice", service_ids),
+                    show_columns=False,
+                    conn=conn,
+                )
+            except psycopg2.Error as e:
+                conn.rollback()
+                logger.error("Unable to check recovered services: %s", e)
+                return
+            if not res:
+                return
+            now_utc = datetime.now(UTC)
+            maintenance = _MaintenanceLookup()
+            active_alerts = _ActiveAlerts()
+            slack_batch = _SlackBatch()
+            try:
+                for heartbeat in map(Service._make, res):
+                    try:
+                        _check_service(
+                            conn,
+                            heartbeat,
+                            now_utc,
+                            maintenance,
+                            active_alerts,
+                            slack_batch,
+                        )
+                        conn.commit()
+                    except psycopg2.Error as e:
+                        conn.rollback()
+                        logger.error(
+                            "Failed to close alert for %s: %s",
+                            heartbeat.heartbeat_name,
+                            e,
+                        )
+            finally:
+                slack_batch.flush()
+        finally:
+            release_db(conn)
+
+
+def wait_for_next_cycle(seconds):
+    """Wait for the next full cycle, handling heartbeat wakeups meanwhile."""
+    deadline = time.monotonic() + seconds
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        if _heartbeat_wake.wait(remaining):
+            _heartbeat_wake.clear()
+            checkRecoveredServices()
 
 
 def sendAlert(
@@ -349,28 +847,103 @@ def sendAlert(
     muted,
     current_time,
     runbook=None,
+    conn=None,
+    slack_batch=None,
 ):
     # Convert interval to seconds from minutes
     interval_seconds = int(interval) * 60
 
-    # Check for active alert
+    alert_message = f"Medic - Heartbeat failure for {heartbeat_name}"
+    # The PagerDuty dedup key is deterministic, so a new alert records it
+    # up front instead of in a follow-up UPDATE; muted alerts get no page
+    pd_key = pagerduty.dedup_key_for(heartbeat_name) if muted != 1 else None
+
+    # Mark the service down and open a new alert or advance the active one.
+    # The statement also lifts the mute once the active alert is
+    # AUTO_UNMUTE_HOURS old and reports whether it is due to re-notify.
     result = query_db(
-        "SELECT * FROM alerts WHERE active = 1 AND service_id = %s ORDER BY alert_id DESC LIMIT 1",
-        (service_id,),
+        """
+        WITH existing AS (
+            SELECT alert_id, created_date,
+                   COALESCE(next_notify_at <= NOW(), TRUE) AS due
+            FROM alerts
+            WHERE active = 1 AND service_id = %s
+            ORDER BY alert_id DESC
+            LIMIT 1
+        ),
+        mute AS (
+            -- A mute only lapses once its alert has been active for the
+            -- auto-unmute window; without an active alert it stays put
+            SELECT s.muted = 1
+                   AND e.alert_id IS NOT NULL
+                   AND e.created_date
+                       <= NOW() - make_interval(hours => %s) AS expired
+            FROM services s
+            LEFT JOIN existing e ON TRUE
+            WHERE s.service_id = %s
+        ),
+        svc AS (
+            UPDATE services SET
+                down = 1,
+                muted = CASE WHEN mute.expired THEN 0 ELSE services.muted END,
+                date_muted = CASE
+                    WHEN mute.expired THEN NULL ELSE services.date_muted
+                END
+            FROM mute
+            WHERE services.service_id = %s
+              -- Leave the row alone while it is already down and nothing
+              -- changes, so a long outage does not rewrite it every cycle
+              AND (services.down IS DISTINCT FROM 1 OR mute.expired)
+        ),
+        upd AS (
+            UPDATE alerts SET
+                alert_cycle = alerts.alert_cycle + 1,
+                next_notify_at = CASE
+                    WHEN existing.due THEN NOW() + make_interval(secs => %s)
+                    ELSE alerts.next_notify_at
+                END
+            FROM existing
+            WHERE alerts.alert_id = existing.alert_id
+            RETURNING alerts.alert_cycle, 'updated'::text AS op, existing.due
+        ),
+        ins AS (
+            INSERT INTO alerts(
+                alert_name, service_id, active, alert_cycle, created_date,
+                external_reference_id, next_notify_at
+            )
+            SELECT %s::text, %s::integer, 1, 1, %s::timestamptz, %s::text,
+                   NOW() + make_interval(secs => %s)
+            WHERE NOT EXISTS (SELECT 1 FROM existing)
+            RETURNING alert_cycle, 'inserted'::text AS op, TRUE AS due
+        )
+        SELECT alert_cycle, op, due FROM upd
+        UNION ALL
+        SELECT alert_cycle, op, due FROM ins
+        """,
+        (
+            service_id,
+            AUTO_UNMUTE_HOURS,
+            service_id,
+            service_id,
+            interval_seconds,
+            alert_message,
+            service_id,
+            current_time,
+            pd_key,
+            interval_seconds,
+        ),
         show_columns=False,
+        conn=conn,
+        commit=True,
+        prepare="medic_worker_alert_upsert",
     )
 
-    # Mark service down in DB
-    insert_db("UPDATE services SET down = 1 WHERE service_id = %s", (service_id,))
-
-    alert_message = "Medic - Heartbeat failure for " + str(heartbeat_name)
+    if not result:
+        logger.error("Unable to record alert for %s.", heartbeat_name)
+        return
 
-    if result is None or result == []:
-        # No active alert is present - create one
-        insert_db(
-            "INSERT INTO alerts(alert_name, service_id, active, alert_cycle, created_date) VALUES(%s, %s, 1, 1, %s)",
-            (alert_message, service_id, current_time),
-        )
+    if result[0][1] == "inserted":
+        # No active alert was present - one was created
         alert_cycle = 1  # New alert starts at cycle 1
 
         # Record alert created metric
@@ -378,12 +951,11 @@ def sendAlert(
             record_alert_created(priority=priority, team=team)
 
         if muted == 1:
-            logger.log(
-                level=20, msg=str(heartbeat_name) + " is muted. No alert will be sent."
-            )
+            logger.info("%s is muted. No alert will be sent.", heartbeat_name)
         else:
-            # Send PagerDuty alert
-            pd_key = pagerduty.create_alert(
+            # Send PagerDuty alert; its dedup key is already on the alert
+            _dispatch(
+                pagerduty.create_alert,
                 alert_message=alert_message,
                 service_name=service_name,
                 heartbeat_name=heartbeat_name,
@@ -392,68 +964,31 @@ def sendAlert(
                 runbook=runbook,
             )
 
-            # Update the alert with the PagerDuty dedup key
-            if pd_key:
-                insert_db(
-                    "UPDATE alerts SET external_reference_id = %s WHERE service_id = %s AND active = 1",
-                    (pd_key, service_id),
-                )
-
             # Send slack message
             message = (
-                ":broken_heart: No heartbeat has been detected for `"
-                + str(heartbeat_name)
-                + "` for service `"
-                + str(service_name)
-                + "` since "
-                + str(last_seen)
-                + ". Alert is being routed to `"
-                + str(team)
-                + "`"
+                f":broken_heart: No heartbeat has been detected for `{heartbeat_name}` "
+                f"for service `{service_name}` since {last_seen}. "
+                f"Alert is being routed to `{team}`"
             )
-            slack.send_message(message)
+            _notify_slack(message, slack_batch)
 
             # Check for playbook triggers
             _check_playbook_triggers(service_id, service_name, alert_cycle)
     else:
-        # Active alert exists
-        alert_cycle = int(result[0][5])
-        count = alert_cycle + 1
-
-        # Update alert_cycle counter in db
-        insert_db(
-            "UPDATE alerts SET alert_cycle = %s WHERE alert_id = %s",
-            (count, result[0][0]),
-        )
+        # Active alert exists; its cycle counter has been advanced
+        count = int(result[0][0])
+        due = result[0][2]
 
         if muted == 1:
-            logger.log(
-                level=20,
-                msg="Alert already active for "
-                + str(heartbeat_name)
-                + ", but muted. Checking Expiration...",
-            )
-            if alert_cycle % (1440 / 15) == 0:
-                # 24 Hours have passed. Auto-unmute alert.
-                insert_db(
-                    "UPDATE services SET muted = 0, date_muted = NULL WHERE service_id = %s",
-                    (service_id,),
-                )
+            logger.info("Alert already active for %s, but muted.", heartbeat_name)
         else:
-            # Calculate notification interval
-            if alert_cycle % (interval_seconds / 15) == 0:
+            if due:
                 message = (
-                    ":broken_heart: No heartbeat has been detected for `"
-                    + str(heartbeat_name)
-                    + "` for service `"
-                    + str(service_name)
-                    + "` since "
-                    + str(last_seen)
-                    + ". Alert has been routed to `"
-                    + str(team)
-                    + "`"
+                    ":broken_heart: No heartbeat has been detected for "
+                    f"`{heartbeat_name}` for service `{service_name}` since "
+                    f"{last_seen}. Alert has been routed to `{team}`"
                 )
-                slack.send_message(message)
+                _notify_slack(message, slack_batch)
 
             # Check for playbook triggers on subsequent cycles
             _check_playbook_triggers(service_id, service_name, count)
@@ -491,11 +1026,11 @@ def _check_playbook_triggers(service_id, service_name, alert_cycle):
         )
 
         if result.triggered:
-            logger.log(
-                level=20,
-                msg=f"Playbook triggered for {service_name}: "
-                f"{result.message} (execution_id: "
-                f"{result.execution.execution_id if result.execution else 'N/A'})",
+            logger.info(
+                "Playbook triggered for %s: %s (execution_id: %s)",
+                service_name,
+                result.message,
+                result.execution.execution_id if result.execution else "N/A",
             )
 
             # Send Slack notification about playbook execution
@@ -505,81 +1040,89 @@ def _check_playbook_triggers(service_id, service_name, alert_cycle):
                     f"'{result.playbook.playbook_name}' started for "
                     f"`{service_name}` (execution: {result.execution.execution_id})"
                 )
-                slack.send_message(playbook_msg)
+                _dispatch(slack.send_message, playbook_msg)
             elif result.status == "pending_approval":
                 playbook_msg = (
                     f":hourglass: Auto-remediation playbook "
                     f"'{result.playbook.playbook_name}' awaiting approval for "
                     f"`{service_name}` (execution: {result.execution.execution_id})"
                 )
-                slack.send_message(playbook_msg)
+                _dispatch(slack.send_message, playbook_msg)
 
     except Exception as e:
-        logger.log(
-            level=40,
-            msg=f"Error checking playbook triggers for {service_name}: {str(e)}",
-        )
+        logger.error("Error checking playbook triggers for %s: %s", service_name, e)
 
 
 def closeAlert(
-    heartbeat_name, service_name, service_id, last_seen, team, muted, current_time
+    heartbeat_name,
+    service_name,
+    service_id,
+    last_seen,
+    team,
+    muted,
+    current_time,
+    conn=None,
+    active_alerts=None,
+    slack_batch=None,
 ):
-    # Find the active alert
-    ar = query_db(
-        "SELECT * FROM alerts WHERE active = 1 AND service_id = %s ORDER BY alert_id DESC LIMIT 1",
-        (service_id,),
-        show_columns=False,
-    )
+    # Find the active alert, preferring the cycle's preloaded alerts
+    alert = active_alerts.pop(service_id, conn) if active_alerts is not None else None
+    if alert is not None:
+        ar = [alert]
+    else:
+        ar = query_db(
+            "SELECT * FROM alerts WHERE active = 1 AND service_id = %s ORDER BY alert_id DESC LIMIT 1",
+            (service_id,),
+            show_columns=False,
+            conn=conn,
+            prepare="medic_worker_active_alert",
+        )
 
     if ar is None or ar == []:
-        logger.log(level=20, msg="No active alert to close for " + str(heartbeat_name))
+        logger.info("No active alert to close for %s", heartbeat_name)
         return
 
-    # Close the alert in the DB
-    insert_db(
-        "UPDATE services SET down = 0, muted = 0 WHERE service_id = %s", (service_id,)
-    )
-    insert_db(
+    # Close the alert in the DB; nothing is announced unless both writes land
+    closed = insert_db(
+        "UPDATE services SET down = 0, muted = 0 WHERE service_id = %s",
+        (service_id,),
+        conn=conn,
+    ) and insert_db(
         "UPDATE alerts SET active = 0, closed_date = %s WHERE alert_id = %s",
         (current_time, ar[0][0]),
+        conn=conn,
     )
+    if not closed:
+        logger.error("Unable to close alert for %s.", heartbeat_name)
+        return
 
     # Record alert resolved metric
     if METRICS_AVAILABLE and record_alert_resolved is not None:
         record_alert_resolved()
 
     if muted == 1:
-        logger.log(
-            level=20, msg=str(heartbeat_name) + " is muted. No alert will be sent."
-        )
+        logger.info("%s is muted. No alert will be sent.", heartbeat_name)
     else:
         message = (
-            ":green_heart: Heartbeat has recovered for `"
-            + str(heartbeat_name)
-            + "` belonging to service `"
-            + str(service_name)
-            + "` as of "
-            + str(last_seen)
+            f":green_heart: Heartbeat has recovered for `{heartbeat_name}` "
+            f"belonging to service `{service_name}` as of {last_seen}"
         )
-        slack.send_message(message)
+        _notify_slack(message, slack_batch)
 
     # Close PagerDuty alert if one exists
     pd_key = ar[0][4]
     if pd_key and pd_key != "" and pd_key != "NULL":
-        pagerduty.close_alert(pd_key)
+        _dispatch(pagerduty.close_alert, pd_key)
     else:
-        logger.log(level=20, msg="No PagerDuty alert to close for alert: " + str(ar[0]))
+        logger.debug("No PagerDuty alert to close for alert: %r", ar[0])
+
+
+# Slack attachment colors by alert priority; unknown priorities use p1's
+_COLOR_BY_SEVERITY = {"p1": "#F35A00", "p2": "#e9a820", "p3": "#e9a820"}
 
 
 def color_code(severity):
-    if severity == "p1":
-        return "#F35A00"
-    elif severity == "p2":
-        return "#e9a820"
-    elif severity == "p3":
-        return "#e9a820"
-    else:
-        return "#F35A00"
+    return _COLOR_BY_SEVERITY.get(severity, "#F35A00")
 
 
 def checkForStaleJobs():
@@ -595,32 +1138,46 @@ def checkForStaleJobs():
     try:
         stale_alerts = get_stale_runs_exceeding_max_duration()
         update_stale_jobs_count(len(stale_alerts))
+        maintenance = _MaintenanceLookup()
+        alerted = []
 
-        for alert in stale_alerts:
-            # Check if service is in maintenance window
-            if MAINTENANCE_WINDOWS_AVAILABLE and is_service_in_maintenance(
-                alert.service_id
-            ):
-                window = get_active_maintenance_window_for_service(alert.service_id)
-                window_name = window.name if window else "Unknown"
-                logger.log(
-                    level=20,
-                    msg=f"Stale job alert suppressed for {alert.service_name}: "
-                    f"service is in maintenance window '{window_name}'",
-                )
-                continue
-
-            # Send alert for stale job
-            sendStaleJobAlert(alert)
+        try:
+            for alert in stale_alerts:
+                # Check if service is in maintenance window
+                window = maintenance.window_for(alert.service_id)
+                if window is not None:
+                    window_name = window.name
+                    logger.info(
+                        "Stale job alert suppressed for %s: "
+                        "service is in maintenance window '%s'",
+                        alert.service_name,
+                        window_name,
+                    )
+                    continue
 
-            # Mark as alerted to prevent duplicate alerts
-            mark_stale_run_alerted(alert.service_id, alert.run_id)
+                # Send alert for stale job; a run is only marked once its
+                # alert is handled, so a failed send is retried next cycle
+                try:
+                    sent = sendStaleJobAlert(alert)
+                except (psycopg2.Error, ConnectionError, RuntimeError) as e:
+                    logger.error(
+                        "Failed to send stale job alert for %s: %s",
+                        alert.service_name,
+                        e,
+                    )
+                    continue
+                if not sent:
+                    continue
+                alerted.append((alert.service_id, alert.run_id))
 
-            # Record metric
-            record_duration_alert("stale")
+                # Record metric
+                record_duration_alert("stale")
+        finally:
+            # Mark as alerted to prevent duplicate alerts, in one batch
+            mark_stale_runs_alerted(alerted)
 
     except Exception as e:
-        logger.log(level=40, msg=f"Error checking for stale jobs: {str(e)}")
+        logger.error("Error checking for stale jobs: %s", e)
 
 
 def sendStaleJobAlert(alert):
@@ -629,34 +1186,32 @@ def sendStaleJobAlert(alert):
 
     Args:
         alert: DurationAlert object containing stale job information
+
+    Returns:
+        True if the alert was sent or the service is muted, False if the
+        service could not be looked up
     """
     # Get service info for team routing
     service_info = query_db(
         "SELECT team, priority, muted FROM services WHERE service_id = %s",
         (alert.service_id,),
-        show_columns=True,
+        show_columns=False,
     )
 
     if not service_info:
-        logger.log(
-            level=30,
-            msg=f"Could not find service info for stale job alert: "
-            f"service_id={alert.service_id}",
+        logger.warning(
+            "Could not find service info for stale job alert: service_id=%s",
+            alert.service_id,
         )
-        return
+        return False
 
-    service = service_info[0]
-    team = service.get("team", "site-reliability")
-    priority = service.get("priority", "p3")
-    muted = service.get("muted", 0)
+    team, priority, muted = service_info[0]
 
     if muted == 1:
-        logger.log(
-            level=20,
-            msg=f"Stale job alert suppressed for {alert.service_name}: "
-            f"service is muted",
+        logger.info(
+            "Stale job alert suppressed for %s: service is muted", alert.service_name
         )
-        return
+        return True
 
     # Calculate elapsed time in human-readable format
     elapsed_seconds = (alert.duration_ms or 0) // 1000
@@ -681,7 +1236,8 @@ def sendStaleJobAlert(alert):
     alert_message = f"Medic - Stale job detected for {alert.service_name}"
 
     # Send PagerDuty alert
-    pagerduty.create_alert(
+    _dispatch(
+        pagerduty.create_alert,
         alert_message=alert_message,
         service_name=alert.service_name,
         heartbeat_name=alert.service_name,
@@ -698,49 +1254,122 @@ def sendStaleJobAlert(alert):
         f"exceeding max duration of {max_str}. "
         f"Alert routed to `{team}`."
     )
-    slack.send_message(message)
+    _dispatch(slack.send_message, message)
 
-    logger.log(
-        level=30,
-        msg=f"Stale job alert sent for {alert.service_name} "
-        f"(run_id: {alert.run_id})",
+    logger.warning(
+        "Stale job alert sent for %s (run_id: %s)", alert.service_name, alert.run_id
     )
+    return True
+
+
+# Seconds between the starts of consecutive monitoring cycles
+CYCLE_SECONDS = 15
+
+# The heartbeat and stale-job checks run on a fixed pair of threads
+_cycle_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="medic-cycle")
+_cycle_futures: dict[str, Future] = {}
+
+
+def _record_overrun():
+    if METRICS_AVAILABLE and WORKER_CYCLE_OVERRUN is not None:
+        WORKER_CYCLE_OVERRUN.inc()
+
+
+def _submit_check(name, func):
+    """Start a check on the cycle executor unless its last run is unfinished."""
+    previous = _cycle_futures.get(name)
+    if previous is not None and not previous.done():
+        logger.warning("Previous %s still running; skipping this cycle", name)
+        _record_overrun()
+        return None
+    future = _cycle_executor.submit(func)
+    _cycle_futures[name] = future
+    return future
 
 
 def thread_function():
-    t = threading.Thread(target=queryForNoHeartbeat)
-    logger.log(level=20, msg="Thread starting.")
-    t.start()
+    logger.info("Cycle starting.")
+    futures = [_submit_check("heartbeat check", queryForNoHeartbeat)]
 
     # Also check for stale jobs
     if DURATION_ALERTS_AVAILABLE:
-        t2 = threading.Thread(target=checkForStaleJobs)
-        t2.start()
+        futures.append(_submit_check("stale job check", checkForStaleJobs))
+
+    futures = [f for f in futures if f is not None]
+    if not futures:
+        return
+
+    # Leave a second of the slot for the scheduler; a check still running
+    # after that is skipped next cycle rather than started twice
+    _, pending = wait(futures, timeout=CYCLE_SECONDS - 1)
+    if pending:
+        logger.warning("%d check(s) still running at end of cycle", len(pending))
+
+
+def schedule_next_cycle(next_tick, interval=CYCLE_SECONDS):
+    """
+    Wait until the next cycle is due and return its start time.
+
+    Cycles start at fixed monotonic offsets, so time spent inside a cycle
+    does not push later cycles back. When a cycle overruns its slot the
+    schedule restarts from now instead of firing the missed cycles at once.
+    """
+    next_tick += interval
+    sleep_for = next_tick - time.monotonic()
+    if sleep_for < 0:
+        logger.warning("Worker cycle overran by %.1fs", -sleep_for)
+        _record_overrun()
+        return time.monotonic()
+    wait_for_next_cycle(sleep_for)
+    return next_tick
 
 
 if __name__ == "__main__":
+    for error in get_config().app.validate():
+        logger.warning("Configuration warning: %s", error)
+
     # Initialize telemetry for the worker
     if TELEMETRY_AVAILABLE and init_worker_telemetry is not None:
         telemetry_enabled = os.environ.get("OTEL_ENABLED", "true").lower() == "true"
         init_worker_telemetry(service_name="medic-worker", enable=telemetry_enabled)
-        logger.log(
-            level=20, msg=f"Worker telemetry initialized (enabled={telemetry_enabled})"
-        )
-
-    # Start metrics HTTP server for Prometheus scraping
-    if METRICS_AVAILABLE and start_metrics_server is not None:
+        logger.info("Worker telemetry initialized (enabled=%s)", telemetry_enabled)
+
+    # Start metrics HTTP server for Prometheus scraping, unless pushing
+    if METRICS_PUSHGATEWAY:
+        # Pushes carry only Medic's own series; a scrape keeps the runtime
+        # process and GC series existing dashboards rely on
+        if METRICS_AVAILABLE and disable_runtime_collectors is not None:
+            disable_runtime_collectors()
+        logger.info("Pushing metrics to %s after each cycle", METRICS_PUSHGATEWAY)
+    elif METRICS_AVAILABLE and start_metrics_server is not None:
         metrics_port = int(os.environ.get("METRICS_PORT", DEFAULT_METRICS_PORT))
         try:
             start_metrics_server(metrics_port)
-            logger.log(level=20, msg=f"Metrics server started on port {metrics_port}")
+            logger.info("Metrics server started on port %s", metrics_port)
         except Exception as e:
-            logger.log(level=40, msg=f"Failed to start metrics server: {e}")
+            logger.error("Failed to start metrics server: %s", e)
+
+    # Open the database connection pool up front and close it on exit
+    try:
+        get_pool()
+    except ConnectionError:
+        logger.error("Database unavailable at startup; will retry")
+    atexit.register(close_pool)
+
+    # Close recovered alerts as soon as their heartbeats arrive
+    threading.Thread(
+        target=listen_for_heartbeats, name="medic-heartbeat-listener", daemon=True
+    ).start()
 
     try:
+        next_tick = time.monotonic()
         while True:
             thread_function()
-            time.sleep(15)
+            next_tick = schedule_next_cycle(next_tick)
     except KeyboardInterrupt:
-        logger.log(level=20, msg="Worker shutting down...")
+        logger.info("Worker shutting down...")
+        _cycle_executor.shutdown(wait=True)
+        _service_executor.shutdown(wait=True)
+        _notifier.shutdown(wait=True)
         if TELEMETRY_AVAILABLE and shutdown_telemetry is not None:
             shutdown_telemetry()
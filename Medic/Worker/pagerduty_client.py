@@ -3,7 +3,9 @@
 import os
 import logging
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Any, Optional
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +21,25 @@ except ImportError:
 # PagerDuty Events API v2 endpoint
 PAGERDUTY_EVENTS_URL = "https://events.pagerduty.com/v2/enqueue"
 
+# One keep-alive session for all Events API calls. Retried POSTs are safe:
+# PagerDuty deduplicates events by dedup_key. Bodies are passed as json=,
+# which also sets the Content-Type header, so no per-call headers are needed.
+_session = requests.Session()
+_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=10,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=frozenset(["POST"]),
+            raise_on_status=False,
+        ),
+    ),
+)
+
 # Priority to PagerDuty severity mapping
 PRIORITY_SEVERITY_MAP = {
     "p1": "critical",
@@ -42,6 +63,11 @@ def get_severity(priority: str) -> str:
     return PRIORITY_SEVERITY_MAP.get(priority.lower(), "warning")
 
 
+def dedup_key_for(heartbeat_name: str) -> str:
+    """Return the dedup_key used for a heartbeat's PagerDuty alerts."""
+    return f"medic-{heartbeat_name}"
+
+
 def create_alert(
     alert_message: str,
     service_name: str,
@@ -72,7 +98,7 @@ def create_alert(
         return None
 
     # Use heartbeat_name as dedup_key for idempotent alerts
-    dedup_key = f"medic-{heartbeat_name}"
+    dedup_key = dedup_key_for(heartbeat_name)
 
     payload: dict[str, Any] = {
         "routing_key": routing_key,
@@ -101,10 +127,9 @@ def create_alert(
         payload["links"] = [{"href": runbook, "text": "Runbook"}]
 
     try:
-        response = requests.post(
+        response = _session.post(
             PAGERDUTY_EVENTS_URL,
             json=payload,
-            headers={"Content-Type": "application/json"},
             timeout=30,
         )
 
@@ -129,7 +154,7 @@ def create_alert(
             return None
 
     except requests.RequestException as e:
-        logger.error("Failed to create PagerDuty alert: %s", str(e))
+        logger.error("Failed to create PagerDuty alert: %s", e)
         if METRICS_AVAILABLE and record_pagerduty_request is not None:
             record_pagerduty_request(action="trigger", success=False)
         return None
@@ -163,10 +188,9 @@ def close_alert(dedup_key: str) -> bool:
     }
 
     try:
-        response = requests.post(
+        response = _session.post(
             PAGERDUTY_EVENTS_URL,
             json=payload,
-            headers={"Content-Type": "application/json"},
             timeout=30,
         )
 
@@ -186,7 +210,7 @@ def close_alert(dedup_key: str) -> bool:
             return False
 
     except requests.RequestException as e:
-        logger.error("Failed to resolve PagerDuty alert: %s", str(e))
+        logger.error("Failed to resolve PagerDuty alert: %s", e)
         if METRICS_AVAILABLE and record_pagerduty_request is not None:
             record_pagerduty_request(action="resolve", success=False)
         return False
@@ -220,10 +244,9 @@ def acknowledge_alert(dedup_key: str) -> bool:
     }
 
     try:
-        response = requests.post(
+        response = _session.post(
             PAGERDUTY_EVENTS_URL,
             json=payload,
-            headers={"Content-Type": "application/json"},
             timeout=30,
         )
 
@@ -243,7 +266,7 @@ def acknowledge_alert(dedup_key: str) -> bool:
             return False
 
     except requests.RequestException as e:
-        logger.error("Failed to acknowledge PagerDuty alert: %s", str(e))
+        logger.error("Failed to acknowledge PagerDuty alert: %s", e)
         if METRICS_AVAILABLE and record_pagerduty_request is not None:
             record_pagerduty_request(action="acknowledge", success=False)
         return False
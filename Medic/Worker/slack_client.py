@@ -1,5 +1,6 @@
 """Slack client for Medic notifications."""
 
+import functools
 import os
 import logging
 from slack_sdk import WebClient
@@ -17,14 +18,27 @@ except ImportError:
     record_slack_request = None  # type: ignore[misc, assignment]
 
 
+@functools.lru_cache(maxsize=1)
 def get_client() -> WebClient:
-    """Get a configured Slack WebClient."""
+    """Get the process-wide Slack WebClient, creating it on first use."""
     token = os.environ.get("SLACK_API_TOKEN")
     if not token:
         logger.warning("SLACK_API_TOKEN not set")
     return WebClient(token=token)
 
 
+@functools.lru_cache(maxsize=1)
+def get_channel() -> str:
+    """Get the Slack channel notifications are posted to."""
+    return os.environ.get("SLACK_CHANNEL_ID") or ""
+
+
+def reload_settings() -> None:
+    """Forget the cached client and channel so the environment is read again."""
+    get_client.cache_clear()
+    get_channel.cache_clear()
+
+
 def send_message(message: str) -> bool:
     """
     Send a message to the configured Slack channel.
@@ -35,7 +49,7 @@ def send_message(message: str) -> bool:
     Returns:
         True on success, False on failure
     """
-    slack_channel = os.environ.get("SLACK_CHANNEL_ID")
+    slack_channel = get_channel()
     if not slack_channel:
         logger.warning("SLACK_CHANNEL_ID not set, skipping Slack notification")
         return False
@@ -48,12 +62,12 @@ def send_message(message: str) -> bool:
             record_slack_request(success=success)
         return success
     except SlackApiError as e:
-        logger.error(f"Slack API error: {e.response['error']}")
+        logger.error("Slack API error: %s", e.response["error"])
         if METRICS_AVAILABLE and record_slack_request is not None:
             record_slack_request(success=False)
         return False
     except Exception as e:
-        logger.error(f"Failed to send Slack message: {str(e)}")
+        logger.error("Failed to send Slack message: %s", e)
         if METRICS_AVAILABLE and record_slack_request is not None:
             record_slack_request(success=False)
         return False
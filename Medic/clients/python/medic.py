@@ -10,6 +10,9 @@ logger = logging.getLogger(__name__)
 # Default base URL, configurable via environment variable
 DEFAULT_BASE_URL = "https://medic.example.com"
 
+# Reused across heartbeats so the connection to Medic is kept alive
+_session = requests.Session()
+
 
 def get_base_url() -> str:
     """Get the Medic API base URL from environment or use default."""
@@ -42,7 +45,7 @@ def SendHeartbeat(
             "Content-Type": "application/json",
         }
 
-        response = requests.post(url, json=payload, headers=headers, timeout=30)
+        response = _session.post(url, json=payload, headers=headers, timeout=30)
 
         if response.status_code >= 300:
             logger.warning("Unable to post heartbeat: %s", response.text)
@@ -50,5 +53,5 @@ def SendHeartbeat(
 
         return True
     except requests.RequestException as e:
-        logger.error("Failed to Send Heartbeat. Upstream Error: %s", str(e))
+        logger.error("Failed to Send Heartbeat. Upstream Error: %s", e)
         return False
@@ -5,9 +5,9 @@ Medic CLI - Command-line interface for Medic heartbeat monitoring service.
 Usage:
     medic-cli service list [--active] [--team=<team>]
     medic-cli service get <name>
-    medic-cli service mute <name> [--duration=<duration>]
-    medic-cli service unmute <name>
-    medic-cli heartbeat send <name> [--status=<status>]
+    medic-cli service mute <name>... [--duration=<duration>]
+    medic-cli service unmute <name>...
+    medic-cli heartbeat send <name>... [--status=<status>]
     medic-cli heartbeat list [--name=<name>] [--limit=<limit>]
     medic-cli alerts list [--active]
     medic-cli health
@@ -24,11 +24,34 @@ Options:
 import os
 import sys
 import json
+import atexit
 import argparse
-import requests
-from typing import Optional, Dict, Any
+from typing import TYPE_CHECKING, Optional, Dict, Any
 from datetime import datetime
 
+# requests (with urllib3 and its other dependencies) is imported when the
+# first API call is made, so help and argument errors do not load it
+if TYPE_CHECKING:
+    import requests
+
+# orjson parses large list responses several times faster than json
+# (optional - falls back to the standard library)
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+    json_loads = json.loads
+
+# Connect and read timeouts for API calls, in seconds
+REQUEST_TIMEOUT = (3.05, 30)
+HEALTH_TIMEOUT = (3.05, 10)
+# Concurrent requests for commands given several names
+MAX_PARALLEL_REQUESTS = 8
+
+_session: Optional["requests.Session"] = None
+
 
 def get_base_url() -> str:
     """Get the Medic API base URL from environment."""
@@ -36,25 +59,67 @@ def get_base_url() -> str:
     return url.rstrip("/")
 
 
+def get_session() -> "requests.Session":
+    """Get the HTTP session shared by all API calls, creating it on first use.
+
+    Reusing one session keeps the connection to Medic alive between calls
+    instead of opening a new one per request. Idempotent GETs are retried
+    on gateway errors. 503 is left out: /health answers with it when Medic
+    is unhealthy, and that report should come back on the first request.
+    """
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        _session = requests.Session()
+        adapter = HTTPAdapter(
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.2,
+                status_forcelist=[502, 504],
+                allowed_methods=frozenset(["GET"]),
+                # Hand back the last response instead of raising once
+                # retries run out
+                raise_on_status=False,
+            )
+        )
+        _session.mount("http://", adapter)
+        _session.mount("https://", adapter)
+        atexit.register(_session.close)
+    return _session
+
+
 def api_request(
     method: str,
     endpoint: str,
     data: Optional[Dict] = None,
-    params: Optional[Dict] = None
+    params: Optional[Dict] = None,
+    timeout: tuple = REQUEST_TIMEOUT
 ) -> Dict[str, Any]:
     """Make an API request to Medic."""
+    import requests
+
     url = f"{get_base_url()}{endpoint}"
-    headers = {"Content-Type": "application/json"}
+    session = get_session()
 
     try:
         if method.upper() == "GET":
-            response = requests.get(url, params=params, headers=headers, timeout=30)
+            response = session.get(url, params=params, timeout=timeout)
         elif method.upper() == "POST":
-            response = requests.post(url, json=data, headers=headers, timeout=30)
+            # json= also sets the Content-Type header
+            response = session.post(url, json=data, timeout=timeout)
         else:
             raise ValueError(f"Unsupported HTTP method: {method}")
 
-        return response.json()
+        payload = json_loads(response.content)
+        # Older servers send list results as a JSON-encoded string; decode
+        # them here once. Errors carry an empty string, which is kept.
+        results = payload.get("results") if isinstance(payload, dict) else None
+        if isinstance(results, str) and results:
+            payload["results"] = json_loads(results)
+        return payload
     except requests.RequestException as e:
         return {"success": False, "message": str(e), "results": []}
     except json.JSONDecodeError:
@@ -66,22 +131,14 @@ def format_table(headers: list, rows: list) -> str:
     if not rows:
         return "No results found."
 
-    # Calculate column widths
-    widths = [len(h) for h in headers]
-    for row in rows:
-        for i, cell in enumerate(row):
-            widths[i] = max(widths[i], len(str(cell)))
+    # Stringify every cell once; widths come from the transposed columns
+    str_rows = [[str(cell) for cell in row] for row in rows]
+    widths = [max(map(len, col)) for col in zip(headers, *str_rows)]
+    fmt = " | ".join(f"{{:<{w}}}" for w in widths)
 
-    # Build header
-    header_line = " | ".join(h.ljust(widths[i]) for i, h in enumerate(headers))
-    separator = "-+-".join("-" * w for w in widths)
-
-    # Build rows
-    row_lines = []
-    for row in rows:
-        row_lines.append(" | ".join(str(cell).ljust(widths[i]) for i, cell in enumerate(row)))
-
-    return f"{header_line}\n{separator}\n" + "\n".join(row_lines)
+    lines = [fmt.format(*headers), "-+-".join("-" * w for w in widths)]
+    lines.extend(fmt.format(*row) for row in str_rows)
+    return "\n".join(lines)
 
 
 def cmd_service_list(args: argparse.Namespace) -> int:
@@ -97,8 +154,6 @@ def cmd_service_list(args: argparse.Namespace) -> int:
         return 1
 
     services = result.get("results", [])
-    if isinstance(services, str):
-        services = json.loads(services)
 
     if args.team:
         services = [s for s in services if s.get("team") == args.team]
@@ -130,65 +185,93 @@ def cmd_service_get(args: argparse.Namespace) -> int:
         return 1
 
     services = result.get("results", [])
-    if isinstance(services, str):
-        services = json.loads(services)
 
     if not services:
         print(f"Service '{args.name}' not found.")
         return 1
 
     service = services[0]
-    print(f"Heartbeat Name: {service.get('heartbeat_name')}")
-    print(f"Service Name:   {service.get('service_name')}")
-    print(f"Active:         {'Yes' if service.get('active') == 1 else 'No'}")
-    print(f"Alert Interval: {service.get('alert_interval')} minutes")
-    print(f"Threshold:      {service.get('threshold')}")
-    print(f"Team:           {service.get('team')}")
-    print(f"Priority:       {service.get('priority')}")
-    print(f"Muted:          {'Yes' if service.get('muted') == 1 else 'No'}")
-    print(f"Down:           {'Yes' if service.get('down') == 1 else 'No'}")
-    print(f"Runbook:        {service.get('runbook') or 'Not set'}")
+    lines = [
+        f"Heartbeat Name: {service.get('heartbeat_name')}",
+        f"Service Name:   {service.get('service_name')}",
+        f"Active:         {'Yes' if service.get('active') == 1 else 'No'}",
+        f"Alert Interval: {service.get('alert_interval')} minutes",
+        f"Threshold:      {service.get('threshold')}",
+        f"Team:           {service.get('team')}",
+        f"Priority:       {service.get('priority')}",
+        f"Muted:          {'Yes' if service.get('muted') == 1 else 'No'}",
+        f"Down:           {'Yes' if service.get('down') == 1 else 'No'}",
+        f"Runbook:        {service.get('runbook') or 'Not set'}",
+    ]
+    print("\n".join(lines))
     return 0
 
 
-def cmd_service_mute(args: argparse.Namespace) -> int:
-    """Mute a service."""
-    result = api_request("POST", f"/service/{args.name}", data={"muted": 1})
+def for_each_name(names: list, request) -> list:
+    """
+    Call request(name) for every name and return the results in order.
 
-    if result.get("success", False):
-        print(f"Service '{args.name}' has been muted.")
-        return 0
-    else:
-        print(f"Error: {result.get('message', 'Failed to mute service')}")
-        return 1
+    Several names are requested concurrently over the shared session.
+    """
+    if len(names) == 1:
+        return [request(names[0])]
 
+    from concurrent.futures import ThreadPoolExecutor
 
-def cmd_service_unmute(args: argparse.Namespace) -> int:
-    """Unmute a service."""
-    result = api_request("POST", f"/service/{args.name}", data={"muted": 0})
+    get_session()  # create it before the workers share it
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_REQUESTS, len(names))) as pool:
+        return list(pool.map(request, names))
 
-    if result.get("success", False):
-        print(f"Service '{args.name}' has been unmuted.")
-        return 0
-    else:
-        print(f"Error: {result.get('message', 'Failed to unmute service')}")
-        return 1
+
+def report_each(names: list, results: list, success: str, failure: str) -> int:
+    """Print one line per name's result; return 1 if any failed."""
+    rc = 0
+    for name, result in zip(names, results):
+        if result.get("success", False):
+            print(success.format(name=name))
+        else:
+            prefix = f"Error ({name})" if len(names) > 1 else "Error"
+            print(f"{prefix}: {result.get('message', failure)}")
+            rc = 1
+    return rc
+
+
+def cmd_service_mute(args: argparse.Namespace) -> int:
+    """Mute one or more services."""
+    results = for_each_name(
+        args.names,
+        lambda name: api_request("POST", f"/service/{name}", data={"muted": 1}),
+    )
+    return report_each(
+        args.names, results, "Service '{name}' has been muted.", "Failed to mute service"
+    )
+
+
+def cmd_service_unmute(args: argparse.Namespace) -> int:
+    """Unmute one or more services."""
+    results = for_each_name(
+        args.names,
+        lambda name: api_request("POST", f"/service/{name}", data={"muted": 0}),
+    )
+    return report_each(
+        args.names, results, "Service '{name}' has been unmuted.", "Failed to unmute service"
+    )
 
 
 def cmd_heartbeat_send(args: argparse.Namespace) -> int:
-    """Send a heartbeat."""
-    data = {
-        "heartbeat_name": args.name,
-        "status": args.status
-    }
-    result = api_request("POST", "/heartbeat", data=data)
-
-    if result.get("success", False):
-        print(f"Heartbeat sent successfully for '{args.name}' (status: {args.status})")
-        return 0
-    else:
-        print(f"Error: {result.get('message', 'Failed to send heartbeat')}")
-        return 1
+    """Send a heartbeat for one or more names."""
+    results = for_each_name(
+        args.names,
+        lambda name: api_request(
+            "POST", "/heartbeat", data={"heartbeat_name": name, "status": args.status}
+        ),
+    )
+    return report_each(
+        args.names,
+        results,
+        f"Heartbeat sent successfully for '{{name}}' (status: {args.status})",
+        "Failed to send heartbeat",
+    )
 
 
 def cmd_heartbeat_list(args: argparse.Namespace) -> int:
@@ -204,8 +287,6 @@ def cmd_heartbeat_list(args: argparse.Namespace) -> int:
         return 1
 
     heartbeats = result.get("results", [])
-    if isinstance(heartbeats, str):
-        heartbeats = json.loads(heartbeats)
 
     headers = ["ID", "Name", "Service", "Time", "Status"]
     rows = []
@@ -235,8 +316,6 @@ def cmd_alerts_list(args: argparse.Namespace) -> int:
         return 1
 
     alerts = result.get("results", [])
-    if isinstance(alerts, str):
-        alerts = json.loads(alerts)
 
     headers = ["ID", "Name", "Active", "Cycle", "Created", "Closed"]
     rows = []
@@ -256,36 +335,32 @@ def cmd_alerts_list(args: argparse.Namespace) -> int:
 
 def cmd_health(args: argparse.Namespace) -> int:
     """Check Medic health status."""
-    try:
-        response = requests.get(f"{get_base_url()}/health", timeout=10)
-        health_data = response.json()
-
-        print(f"Overall Status: {health_data.get('status', 'unknown').upper()}")
-        print(f"Timestamp:      {health_data.get('timestamp', 'unknown')}")
-        print(f"Version:        {health_data.get('version', 'unknown')}")
-        print()
-        print("Components:")
-
-        components = health_data.get("components", {})
-        for name, info in components.items():
-            status = info.get("status", "unknown")
-            status_icon = "OK" if status in ["healthy", "configured"] else "WARN"
-            print(f"  {name}: [{status_icon}] {status}")
-
-        return 0 if health_data.get("status") == "healthy" else 1
-    except requests.RequestException as e:
-        print(f"Error connecting to Medic: {e}")
+    health_data = api_request("GET", "/health", timeout=HEALTH_TIMEOUT)
+    if "status" not in health_data:
+        print(f"Error connecting to Medic: {health_data.get('message', 'Unknown error')}")
         return 1
 
+    lines = [
+        f"Overall Status: {health_data.get('status', 'unknown').upper()}",
+        f"Timestamp:      {health_data.get('timestamp', 'unknown')}",
+        f"Version:        {health_data.get('version', 'unknown')}",
+        "",
+        "Components:",
+    ]
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="Medic CLI - Command-line interface for Medic heartbeat monitoring",
-        formatter_class=argparse.RawDescriptionHelpFormatter
-    )
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+    components = health_data.get("components", {})
+    for name, info in components.items():
+        status = info.get("status", "unknown")
+        status_icon = "OK" if status in ["healthy", "configured"] else "WARN"
+        lines.append(f"  {name}: [{status_icon}] {status}")
+
+    # One write for the whole report
+    print("\n".join(lines))
 
-    # Service commands
+    return 0 if health_data.get("status") == "healthy" else 1
+
+
+def _build_service_parser(subparsers) -> argparse.ArgumentParser:
     service_parser = subparsers.add_parser("service", help="Service management")
     service_subparsers = service_parser.add_subparsers(dest="subcommand")
 
@@ -296,36 +371,70 @@ def main():
     get_parser = service_subparsers.add_parser("get", help="Get service details")
     get_parser.add_argument("name", help="Heartbeat name")
 
-    mute_parser = service_subparsers.add_parser("mute", help="Mute a service")
-    mute_parser.add_argument("name", help="Heartbeat name")
+    mute_parser = service_subparsers.add_parser("mute", help="Mute services")
+    mute_parser.add_argument("names", nargs="+", metavar="name", help="Heartbeat name")
     mute_parser.add_argument("--duration", default="24h", help="Mute duration")
 
-    unmute_parser = service_subparsers.add_parser("unmute", help="Unmute a service")
-    unmute_parser.add_argument("name", help="Heartbeat name")
+    unmute_parser = service_subparsers.add_parser("unmute", help="Unmute services")
+    unmute_parser.add_argument("names", nargs="+", metavar="name", help="Heartbeat name")
+    return service_parser
+
 
-    # Heartbeat commands
+def _build_heartbeat_parser(subparsers) -> argparse.ArgumentParser:
     heartbeat_parser = subparsers.add_parser("heartbeat", help="Heartbeat operations")
     heartbeat_subparsers = heartbeat_parser.add_subparsers(dest="subcommand")
 
-    send_parser = heartbeat_subparsers.add_parser("send", help="Send a heartbeat")
-    send_parser.add_argument("name", help="Heartbeat name")
+    send_parser = heartbeat_subparsers.add_parser("send", help="Send heartbeats")
+    send_parser.add_argument("names", nargs="+", metavar="name", help="Heartbeat name")
     send_parser.add_argument("--status", default="UP", help="Status (UP/DOWN/DEGRADED)")
 
     hb_list_parser = heartbeat_subparsers.add_parser("list", help="List heartbeats")
     hb_list_parser.add_argument("--name", help="Filter by heartbeat name")
     hb_list_parser.add_argument("--limit", type=int, default=50, help="Max results")
+    return heartbeat_parser
 
-    # Alerts commands
+
+def _build_alerts_parser(subparsers) -> argparse.ArgumentParser:
     alerts_parser = subparsers.add_parser("alerts", help="Alert management")
     alerts_subparsers = alerts_parser.add_subparsers(dest="subcommand")
 
     alerts_list_parser = alerts_subparsers.add_parser("list", help="List alerts")
     alerts_list_parser.add_argument("--active", action="store_true", help="Show only active alerts")
+    return alerts_parser
+
+
+def _build_health_parser(subparsers) -> argparse.ArgumentParser:
+    return subparsers.add_parser("health", help="Check Medic health status")
+
+
+# Builders for each top-level command's parser, in help order
+COMMAND_PARSERS = {
+    "service": _build_service_parser,
+    "heartbeat": _build_heartbeat_parser,
+    "alerts": _build_alerts_parser,
+    "health": _build_health_parser,
+}
+
+
+def main(argv: Optional[list] = None):
+    if argv is None:
+        argv = sys.argv[1:]
 
-    # Health command
-    subparsers.add_parser("health", help="Check Medic health status")
+    parser = argparse.ArgumentParser(
+        description="Medic CLI - Command-line interface for Medic heartbeat monitoring",
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    # Only the selected command's parser is built; top-level help, a missing
+    # command or an unknown one need them all
+    if argv and argv[0] in COMMAND_PARSERS:
+        selected = [argv[0]]
+    else:
+        selected = list(COMMAND_PARSERS)
+    parsers = {name: COMMAND_PARSERS[name](subparsers) for name in selected}
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
@@ -342,7 +451,7 @@ def main():
         elif args.subcommand == "unmute":
             return cmd_service_unmute(args)
         else:
-            service_parser.print_help()
+            parsers["service"].print_help()
             return 1
     elif args.command == "heartbeat":
         if args.subcommand == "send":
@@ -350,13 +459,13 @@ def main():
         elif args.subcommand == "list":
             return cmd_heartbeat_list(args)
         else:
-            heartbeat_parser.print_help()
+            parsers["heartbeat"].print_help()
             return 1
     elif args.command == "alerts":
         if args.subcommand == "list":
             return cmd_alerts_list(args)
         else:
-            alerts_parser.print_help()
+            parsers["alerts"].print_help()
             return 1
     elif args.command == "health":
         return cmd_health(args)
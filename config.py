@@ -13,7 +13,57 @@ from typing import Optional
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# Values of boolean environment variables that count as enabled
+_TRUTHY = frozenset({"1", "true", "yes"})
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer environment variable, falling back to default."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"{name} must be an integer, got {value!r}; using {default}")
+        return default
+
+
+def _check(config: object, rules: tuple) -> list:
+    """
+    Apply validation rules to a configuration.
+
+    Each rule is (attribute, predicate, message); the message is reported,
+    formatted with the attribute's value, when the predicate is false.
+    """
+    errors = []
+    for attr, predicate, message in rules:
+        value = getattr(config, attr)
+        if not predicate(value):
+            errors.append(message.format(value=value))
+    return errors
+
+
+_DATABASE_RULES = (
+    ("host", bool, "DB_HOST is required"),
+    ("name", bool, "DB_NAME is required"),
+    ("user", bool, "PG_USER is required"),
+    ("password", bool, "PG_PASS is required"),
+)
+_SLACK_RULES = (
+    ("api_token", bool, "SLACK_API_TOKEN is required"),
+    ("channel_id", bool, "SLACK_CHANNEL_ID is required"),
+)
+_PAGERDUTY_RULES = (("routing_key", bool, "PAGERDUTY_ROUTING_KEY is required"),)
+_APP_RULES = (
+    ("port", lambda port: 1 <= port <= 65535, "PORT must be between 1 and 65535, got {value}"),
+    ("worker_interval_seconds", lambda n: n >= 1, "WORKER_INTERVAL_SECONDS must be at least 1"),
+    ("alert_auto_unmute_hours", lambda n: n >= 1, "ALERT_AUTO_UNMUTE_HOURS must be at least 1"),
+    ("heartbeat_retention_days", lambda n: n >= 1, "HEARTBEAT_RETENTION_DAYS must be at least 1"),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class DatabaseConfig:
     """Database configuration."""
     host: str
@@ -25,29 +75,21 @@ class DatabaseConfig:
     @classmethod
     def from_env(cls) -> "DatabaseConfig":
         """Create configuration from environment variables."""
+        env = os.environ
         return cls(
-            host=os.environ.get("DB_HOST", "localhost"),
-            port=int(os.environ.get("DB_PORT", "5432")),
-            name=os.environ.get("DB_NAME", "medic"),
-            user=os.environ.get("PG_USER", ""),
-            password=os.environ.get("PG_PASS", ""),
+            host=env.get("DB_HOST", "localhost"),
+            port=_env_int("DB_PORT", 5432),
+            name=env.get("DB_NAME", "medic"),
+            user=env.get("PG_USER", ""),
+            password=env.get("PG_PASS", ""),
         )
 
     def validate(self) -> list:
         """Validate configuration. Returns list of error messages."""
-        errors = []
-        if not self.host:
-            errors.append("DB_HOST is required")
-        if not self.name:
-            errors.append("DB_NAME is required")
-        if not self.user:
-            errors.append("PG_USER is required")
-        if not self.password:
-            errors.append("PG_PASS is required")
-        return errors
+        return _check(self, _DATABASE_RULES)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SlackConfig:
     """Slack configuration."""
     api_token: str
@@ -56,19 +98,15 @@ class SlackConfig:
     @classmethod
     def from_env(cls) -> "SlackConfig":
         """Create configuration from environment variables."""
+        env = os.environ
         return cls(
-            api_token=os.environ.get("SLACK_API_TOKEN", ""),
-            channel_id=os.environ.get("SLACK_CHANNEL_ID", ""),
+            api_token=env.get("SLACK_API_TOKEN", ""),
+            channel_id=env.get("SLACK_CHANNEL_ID", ""),
         )
 
     def validate(self) -> list:
         """Validate configuration. Returns list of error messages."""
-        errors = []
-        if not self.api_token:
-            errors.append("SLACK_API_TOKEN is required")
-        if not self.channel_id:
-            errors.append("SLACK_CHANNEL_ID is required")
-        return errors
+        return _check(self, _SLACK_RULES)
 
     @property
     def is_configured(self) -> bool:
@@ -76,7 +114,7 @@ class SlackConfig:
         return bool(self.api_token and self.channel_id)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PagerDutyConfig:
     """PagerDuty configuration."""
     routing_key: str
@@ -90,10 +128,7 @@ class PagerDutyConfig:
 
     def validate(self) -> list:
         """Validate configuration. Returns list of error messages."""
-        errors = []
-        if not self.routing_key:
-            errors.append("PAGERDUTY_ROUTING_KEY is required")
-        return errors
+        return _check(self, _PAGERDUTY_RULES)
 
     @property
     def is_configured(self) -> bool:
@@ -101,7 +136,7 @@ class PagerDutyConfig:
         return bool(self.routing_key)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     """Application configuration."""
     port: int
@@ -119,31 +154,29 @@ class AppConfig:
     @classmethod
     def from_env(cls) -> "AppConfig":
         """Create configuration from environment variables."""
+        env = os.environ
         return cls(
-            port=int(os.environ.get("PORT", "5000")),
-            base_url=os.environ.get("MEDIC_BASE_URL", "http://localhost:5000"),
-            debug=os.environ.get("DEBUG", "").lower() in ("1", "true", "yes"),
-            timezone=os.environ.get("MEDIC_TIMEZONE", "America/Chicago"),
-            worker_interval_seconds=int(os.environ.get("WORKER_INTERVAL_SECONDS", "15")),
-            alert_auto_unmute_hours=int(os.environ.get("ALERT_AUTO_UNMUTE_HOURS", "24")),
-            heartbeat_retention_days=int(os.environ.get("HEARTBEAT_RETENTION_DAYS", "30")),
+            port=_env_int("PORT", 5000),
+            base_url=env.get("MEDIC_BASE_URL", "http://localhost:5000"),
+            debug=env.get("DEBUG", "").lower() in _TRUTHY,
+            timezone=env.get("MEDIC_TIMEZONE", "America/Chicago"),
+            worker_interval_seconds=_env_int("WORKER_INTERVAL_SECONDS", 15),
+            alert_auto_unmute_hours=_env_int("ALERT_AUTO_UNMUTE_HOURS", 24),
+            heartbeat_retention_days=_env_int("HEARTBEAT_RETENTION_DAYS", 30),
         )
 
     def validate(self) -> list:
         """Validate configuration. Returns list of error messages."""
-        errors = []
-        if self.port < 1 or self.port > 65535:
-            errors.append(f"PORT must be between 1 and 65535, got {self.port}")
-        if self.worker_interval_seconds < 1:
-            errors.append("WORKER_INTERVAL_SECONDS must be at least 1")
-        if self.heartbeat_retention_days < 1:
-            errors.append("HEARTBEAT_RETENTION_DAYS must be at least 1")
-        return errors
+        return _check(self, _APP_RULES)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Complete application configuration."""
+    """Complete application configuration.
+
+    Configurations are immutable so one instance can be shared across
+    threads; call reload_config() to pick up environment changes.
+    """
     database: DatabaseConfig = field(default_factory=DatabaseConfig.from_env)
     slack: SlackConfig = field(default_factory=SlackConfig.from_env)
     pagerduty: PagerDutyConfig = field(default_factory=PagerDutyConfig.from_env)
@@ -244,7 +277,6 @@ class Constants:
     # Worker
     WORKER_INTERVAL_SECONDS = 15
     ALERT_CYCLE_DIVISOR = 15  # For calculating notification intervals
-    AUTO_UNMUTE_CYCLES = 1440 // 15  # 24 hours / 15 seconds
 
     # Priority colors (for Slack)
     PRIORITY_COLORS = {
@@ -9,7 +9,6 @@ from flask import Flask
 
 import Medic.Core.routes
 from Medic.Core.logging_config import configure_logging, get_logger
-from Medic.Core.telemetry import init_telemetry
 from config import get_config
 
 # Import API key initialization (optional - graceful degradation)
@@ -42,6 +41,10 @@ def create_app() -> Flask:
     # Initialize OpenTelemetry instrumentation
     telemetry_enabled = os.environ.get("OTEL_ENABLED", "true").lower() == "true"
     if telemetry_enabled:
+        # Imported here so the OpenTelemetry SDK and gRPC exporter are only
+        # loaded when tracing is on
+        from Medic.Core.telemetry import init_telemetry
+
         init_telemetry(app)
 
     # Register routes
@@ -0,0 +1,96 @@
+-- Migration: 018_partition_heartbeat_events
+-- Description: Convert heartbeatEvents to a monthly range-partitioned table on "time"
+-- Date: 2026-10-18
+
+-- heartbeatEvents grows linearly and is trimmed by the daily cleanup job
+-- (Medic/Jobs/dbCleanup.py). With monthly partitions, expired data is removed
+-- with DROP TABLE on whole partitions instead of a DELETE + VACUUM cycle.
+--
+-- Partitions are named "heartbeatEvents_YYYYMM". This migration creates one
+-- partition per month from the oldest existing event through next month, plus
+-- a DEFAULT partition as a safety net. The cleanup job keeps the current and
+-- next month's partitions created going forward.
+--
+-- The primary key must include the partition key, so it becomes
+-- (heartbeat_id, "time"). heartbeat_id keeps its existing sequence.
+
+DO $$
+DECLARE
+    seq_name text;
+    month_start date;
+    last_month date;
+BEGIN
+    -- Already partitioned (migration re-run or fresh install built elsewhere)
+    IF EXISTS (
+        SELECT 1 FROM pg_partitioned_table
+        WHERE partrelid = 'medic."heartbeatEvents"'::regclass
+    ) THEN
+        RETURN;
+    END IF;
+
+    ALTER TABLE medic."heartbeatEvents" RENAME TO "heartbeatEvents_legacy";
+
+    -- Detach the serial sequence so it survives dropping the legacy table
+    seq_name := pg_get_serial_sequence('medic."heartbeatEvents_legacy"', 'heartbeat_id');
+    EXECUTE format('ALTER SEQUENCE %s OWNED BY NONE', seq_name);
+
+    EXECUTE format($f$
+        CREATE TABLE medic."heartbeatEvents"
+        (
+            heartbeat_id integer NOT NULL DEFAULT nextval(%L::regclass),
+            "time" timestamp with time zone NOT NULL DEFAULT NOW(),
+            status text NOT NULL,
+            service_id integer NOT NULL REFERENCES medic.services(service_id),
+            run_id text,
+            CONSTRAINT heartbeat_events_pkey PRIMARY KEY (heartbeat_id, "time")
+        ) PARTITION BY RANGE ("time")
+    $f$, seq_name);
+
+    EXECUTE format(
+        'ALTER SEQUENCE %s OWNED BY medic."heartbeatEvents".heartbeat_id',
+        seq_name
+    );
+
+    SELECT date_trunc('month', COALESCE(MIN("time"), NOW()))::date
+      INTO month_start
+      FROM medic."heartbeatEvents_legacy";
+    last_month := (date_trunc('month', NOW()) + INTERVAL '1 month')::date;
+
+    WHILE month_start <= last_month LOOP
+        EXECUTE format(
+            'CREATE TABLE medic.%I PARTITION OF medic."heartbeatEvents" '
+            'FOR VALUES FROM (%L) TO (%L)',
+            'heartbeatEvents_' || to_char(month_start, 'YYYYMM'),
+            month_start,
+            (month_start + INTERVAL '1 month')::date
+        );
+        month_start := (month_start + INTERVAL '1 month')::date;
+    END LOOP;
+
+    CREATE TABLE medic."heartbeatEvents_default"
+        PARTITION OF medic."heartbeatEvents" DEFAULT;
+
+    INSERT INTO medic."heartbeatEvents" (heartbeat_id, "time", status, service_id, run_id)
+    SELECT heartbeat_id, "time", status, service_id, run_id
+    FROM medic."heartbeatEvents_legacy";
+
+    DROP TABLE medic."heartbeatEvents_legacy";
+END
+$$;
+
+-- Indexes are declared on the parent and propagate to every partition
+CREATE INDEX IF NOT EXISTS idx_heartbeat_events_service_id
+    ON medic."heartbeatEvents"(service_id);
+CREATE INDEX IF NOT EXISTS idx_heartbeat_events_time
+    ON medic."heartbeatEvents"("time");
+CREATE INDEX IF NOT EXISTS idx_heartbeat_events_run_id
+    ON medic."heartbeatEvents"(run_id) WHERE run_id IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_heartbeat_events_service_run_id
+    ON medic."heartbeatEvents"(service_id, run_id) WHERE run_id IS NOT NULL;
+
+COMMENT ON TABLE medic."heartbeatEvents" IS
+    'Timestamped heartbeat events from services, partitioned monthly by time';
+COMMENT ON COLUMN medic."heartbeatEvents".run_id IS
+    'Optional identifier to correlate STARTED/COMPLETED/FAILED events for the same job run';
+COMMENT ON COLUMN medic."heartbeatEvents".status IS
+    'Heartbeat status: UP (alive), DOWN (dead), STARTED (job began), COMPLETED (job finished), FAILED (job error)';
@@ -0,0 +1,13 @@
+-- Migration: 019_add_heartbeat_events_service_time_index
+-- Description: Index heartbeatEvents on (service_id, time DESC) for the monitor lookup
+-- Date: 2026-10-18
+
+-- The worker fetches, for every active service in one query, the latest
+-- heartbeat and the number of heartbeats inside the alert interval. Both are
+-- per-service range scans on "time", which this index serves directly.
+--
+-- CONCURRENTLY is not used: migrations run inside a transaction and the index
+-- is declared on the partitioned parent, neither of which allows it.
+
+CREATE INDEX IF NOT EXISTS idx_heartbeat_events_service_time
+    ON medic."heartbeatEvents"(service_id, "time" DESC);
@@ -0,0 +1,26 @@
+-- Migration: 020_notify_heartbeat_events
+-- Description: Announce heartbeat inserts on the heartbeat_in notification channel
+-- Date: 2026-10-18
+
+-- The worker LISTENs on heartbeat_in so that down services can be closed as
+-- soon as their heartbeats resume, instead of waiting for the next 15 second
+-- cycle. The payload is the service_id. PostgreSQL folds identical
+-- notifications raised within one transaction into a single delivery.
+
+CREATE OR REPLACE FUNCTION medic.notify_heartbeat_in()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    PERFORM pg_notify('heartbeat_in', NEW.service_id::text);
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS heartbeat_events_notify ON medic."heartbeatEvents";
+
+-- Row triggers on the partitioned parent are cloned onto every partition
+CREATE TRIGGER heartbeat_events_notify
+    AFTER INSERT ON medic."heartbeatEvents"
+    FOR EACH ROW
+    EXECUTE FUNCTION medic.notify_heartbeat_in();
@@ -0,0 +1,12 @@
+-- Migration: 021_add_alerts_next_notify_at
+-- Description: Store when an active alert is next due to re-notify
+-- Date: 2026-10-18
+
+-- The worker used to re-notify when alert_cycle was a multiple of the alert
+-- interval divided by the 15 second cycle length, which assumed every cycle
+-- ran exactly on time. It now compares next_notify_at with NOW() and moves
+-- it forward by the alert interval each time it notifies. NULL means the
+-- alert is due, so alerts opened before this migration notify once on their
+-- next cycle and then follow the stored schedule.
+
+ALTER TABLE medic.alerts ADD COLUMN IF NOT EXISTS next_notify_at timestamp with time zone;
@@ -19,15 +19,16 @@ Usage:
     init_api_keys()
 """
 
+import argparse
 import logging
 import os
 import sys
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 logger = logging.getLogger(__name__)
 
+# One connection serves every query of an init_api_keys() run
+_conn = None
+
 
 def _get_db():
     """Import database module (lazy to avoid import errors during collection)."""
@@ -43,42 +44,93 @@ def _get_api_keys():
     return hash_api_key, generate_api_key
 
 
-def key_exists(db, name: str) -> bool:
+def _get_conn():
+    """Return the connection shared by this run's queries, opening it lazily."""
+    global _conn
+    if _conn is None or _conn.closed:
+        _conn = _get_db().connect_db()
+    return _conn
+
+
+def _close_conn() -> None:
+    """Close the shared connection, if one was opened."""
+    global _conn
+    if _conn is not None:
+        _conn.close()
+        _conn = None
+
+
+def _execute(query: str, params: tuple) -> list | None:
+    """Run one statement on the shared connection and commit it.
+
+    Returns:
+        The rows the statement returned ([] if none), or None on failure
+    """
+    try:
+        conn = _get_conn()
+    except Exception as e:
+        logger.error(f"Unable to connect to the database: {e}")
+        return None
+
+    try:
+        with conn.cursor() as cur:
+            cur.execute(query, params)
+            rows = cur.fetchall() if cur.description else []
+        conn.commit()
+        return rows
+    except Exception as e:
+        # Drop the connection (rolling back); the next query opens a new one
+        _close_conn()
+        logger.error(f"Unable to execute query: {e}")
+        return None
+
+
+def key_exists(name: str) -> bool:
     """Check if an API key with the given name exists."""
-    result = db.query_db(
-        "SELECT 1 FROM medic.api_keys WHERE name = %s", (name,), show_columns=False
-    )
-    return result is not None and len(result) > 0
+    result = _execute("SELECT 1 FROM medic.api_keys WHERE name = %s", (name,))
+    return bool(result)
 
 
 def upsert_api_key(
-    db, name: str, key_hash: str, scopes: list[str], expires_at: str | None = None
+    name: str, key_hash: str, scopes: list[str], expires_at: str | None = None
 ) -> bool:
-    """Upsert an API key into the database."""
-    params: tuple
-    if expires_at:
-        query = """
-            INSERT INTO medic.api_keys (name, key_hash, scopes, expires_at)
-            VALUES (%s, %s, %s, %s)
-            ON CONFLICT (name) DO UPDATE SET
-                key_hash = EXCLUDED.key_hash,
-                scopes = EXCLUDED.scopes,
-                expires_at = EXCLUDED.expires_at,
-                updated_at = NOW()
-        """
-        params = (name, key_hash, scopes, expires_at)
-    else:
-        query = """
-            INSERT INTO medic.api_keys (name, key_hash, scopes)
-            VALUES (%s, %s, %s)
-            ON CONFLICT (name) DO UPDATE SET
-                key_hash = EXCLUDED.key_hash,
-                scopes = EXCLUDED.scopes,
-                updated_at = NOW()
-        """
-        params = (name, key_hash, scopes)
+    """Upsert an API key into the database.
+
+    An omitted expires_at keeps the existing key's expiry on conflict.
+    """
+    query = """
+        INSERT INTO medic.api_keys (name, key_hash, scopes, expires_at)
+        VALUES (%s, %s, %s, %s::timestamptz)
+        ON CONFLICT (name) DO UPDATE SET
+            key_hash = EXCLUDED.key_hash,
+            scopes = EXCLUDED.scopes,
+            expires_at = COALESCE(EXCLUDED.expires_at, medic.api_keys.expires_at),
+            updated_at = NOW()
+    """
+    params = (name, key_hash, scopes, expires_at or None)
 
-    return db.insert_db(query, params)
+    return _execute(query, params) is not None
+
+
+def insert_api_key_if_absent(
+    name: str, key_hash: str, scopes: list[str]
+) -> bool | None:
+    """Insert an API key unless one with the same name already exists.
+
+    Returns:
+        True if the key was inserted, False if it already existed,
+        None if the insert failed
+    """
+    rows = _execute(
+        """
+        INSERT INTO medic.api_keys (name, key_hash, scopes)
+        VALUES (%s, %s, %s)
+        ON CONFLICT (name) DO NOTHING
+        RETURNING name
+        """,
+        (name, key_hash, scopes),
+    )
+    return None if rows is None else bool(rows)
 
 
 def sync_admin_key_from_env() -> bool:
@@ -96,12 +148,11 @@ def sync_admin_key_from_env() -> bool:
     logger.info("Syncing admin API key from environment")
 
     try:
-        db = _get_db()
         hash_api_key, _ = _get_api_keys()
 
         key_hash = hash_api_key(admin_key)
         success = upsert_api_key(
-            db, name="admin", key_hash=key_hash, scopes=["read", "write", "admin"]
+            name="admin", key_hash=key_hash, scopes=["read", "write", "admin"]
         )
 
         if success:
@@ -122,7 +173,7 @@ def auto_create_admin_key() -> str | None:
 
     Only creates a key if:
     - MEDIC_AUTO_CREATE_ADMIN_KEY is "true"
-    - No admin key exists in the database
+    - No admin key exists in the database (checked atomically by the insert)
 
     Returns:
         The generated API key if created, None otherwise
@@ -133,22 +184,20 @@ def auto_create_admin_key() -> str | None:
         return None
 
     try:
-        db = _get_db()
-        hash_api_key, generate_api_key = _get_api_keys()
-
-        # Check if admin key already exists
-        if key_exists(db, "admin"):
-            logger.info("Admin key already exists, skipping auto-create")
-            return None
+        _, generate_api_key = _get_api_keys()
 
-        # Generate new key
+        # Generate a key and insert it unless an admin key already exists;
+        # RETURNING tells us which happened in the same round-trip
         api_key, key_hash = generate_api_key()
 
-        success = upsert_api_key(
-            db, name="admin", key_hash=key_hash, scopes=["read", "write", "admin"]
+        created = insert_api_key_if_absent(
+            name="admin", key_hash=key_hash, scopes=["read", "write", "admin"]
         )
+        if created is False:
+            logger.info("Admin key already exists, skipping auto-create")
+            return None
 
-        if success:
+        if created:
             logger.info("=" * 60)
             logger.info("AUTO-CREATED ADMIN API KEY FOR LOCAL DEVELOPMENT")
             logger.info("=" * 60)
@@ -178,21 +227,37 @@ def init_api_keys() -> bool:
     Returns:
         True if initialization succeeded, False otherwise
     """
+    admin_key = os.environ.get("MEDIC_ADMIN_API_KEY", "").strip()
+    auto_create = os.environ.get("MEDIC_AUTO_CREATE_ADMIN_KEY", "").lower() == "true"
+    if not admin_key and not auto_create:
+        logger.info("No API key initialization needed")
+        return True
+
     logger.info("Initializing API keys...")
 
-    # Try to sync from env var first (production path)
-    if sync_admin_key_from_env():
-        return True
+    try:
+        # Try to sync from env var first (production path)
+        if sync_admin_key_from_env():
+            return True
 
-    # Fall back to auto-create for local dev
-    if auto_create_admin_key():
-        return True
+        # Fall back to auto-create for local dev
+        if auto_create_admin_key():
+            return True
+    finally:
+        _close_conn()
 
     logger.info("No API key initialization performed")
     return True  # Not an error if no keys to sync
 
 
 def main():
+    argparse.ArgumentParser(
+        description="Sync or auto-create Medic API keys from the environment"
+    ).parse_args()
+
+    # Add parent directory to path for imports when run as a script
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -1,6 +1,7 @@
 """Pytest configuration and shared fixtures."""
 import os
 import sys
+from concurrent.futures import Future
 import pytest
 from unittest.mock import MagicMock, patch
 
@@ -8,12 +9,14 @@ from unittest.mock import MagicMock, patch
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="session", autouse=True)
 def mock_env_vars():
     """Set up required environment variables for testing.
 
-    This fixture is autouse=True so it runs for all tests automatically,
-    ensuring database and API credentials are always available.
+    This fixture is autouse=True so it applies to all tests automatically,
+    ensuring database and API credentials are always available. It is set
+    once per session; tests that change the environment isolate themselves
+    with patch.dict or monkeypatch.
 
     Note: These credentials must match the PostgreSQL service configuration
     in .github/workflows/build.yml for CI tests to connect to the database.
@@ -34,8 +37,38 @@ def mock_env_vars():
         ),
         "MEDIC_WEBHOOK_SECRET": "test-webhook-secret",
     }
-    with patch.dict(os.environ, env_vars):
-        yield env_vars
+    saved = {key: os.environ.get(key) for key in env_vars}
+    os.environ.update(env_vars)
+    yield env_vars
+    for key, value in saved.items():
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = value
+
+
+class FakeCursor:
+    """Cursor stand-in with only the DB-API calls the code under test makes.
+
+    Unlike a bare MagicMock it doesn't create attributes on access, so each
+    call is cheap and a cursor method the stub lacks fails loudly.
+    """
+
+    def __init__(self, connection=None):
+        self.connection = connection
+        self.description = None
+        self.rowcount = -1
+        self.execute = MagicMock(return_value=None)
+        self.executemany = MagicMock(return_value=None)
+        self.fetchone = MagicMock(return_value=None)
+        self.fetchall = MagicMock(return_value=[])
+        self.close = MagicMock(return_value=None)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
 
 
 @pytest.fixture
@@ -43,7 +76,7 @@ def mock_db_connection():
     """Mock database connection."""
     with patch("psycopg2.connect") as mock_connect:
         mock_conn = MagicMock()
-        mock_cursor = MagicMock()
+        mock_cursor = FakeCursor(mock_conn)
         mock_conn.cursor.return_value = mock_cursor
         mock_connect.return_value = mock_conn
         yield {
@@ -53,6 +86,59 @@ def mock_db_connection():
         }
 
 
+class InlineExecutor:
+    """Executor stand-in that runs submitted calls immediately."""
+
+    def submit(self, func, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(func(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def map(self, func, *iterables):
+        return [func(*args) for args in zip(*iterables)]
+
+
+@pytest.fixture
+def inline_notifications():
+    """Deliver the worker's Slack and PagerDuty notifications synchronously."""
+    with patch("Medic.Worker.monitor._notifier", InlineExecutor()):
+        yield
+
+
+@pytest.fixture
+def inline_service_checks():
+    """Check the services of a worker cycle one after another on the test thread."""
+    with patch("Medic.Worker.monitor._service_executor", InlineExecutor()):
+        yield
+
+
+@pytest.fixture
+def mock_query_db(monkeypatch):
+    """Replace db.query_db, as seen by the API routes, with a MagicMock."""
+    mock = MagicMock()
+    monkeypatch.setattr("Medic.Core.routes.db.query_db", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_add_heartbeat(monkeypatch):
+    """Replace the routes' heartbeat insert with a MagicMock."""
+    mock = MagicMock()
+    monkeypatch.setattr("Medic.Core.routes.hbeat.addHeartbeat", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_job_runs(monkeypatch):
+    """Replace the routes' job_runs module so job signals skip the database."""
+    mock = MagicMock()
+    monkeypatch.setattr("Medic.Core.routes.job_runs", mock)
+    return mock
+
+
 @pytest.fixture
 def mock_slack_client():
     """Mock Slack WebClient."""
@@ -74,9 +160,13 @@ def mock_requests():
         yield mock_post
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def app():
-    """Create Flask test application."""
+    """Create the Flask test application once for the whole session.
+
+    Routes look up their collaborators when a request is handled, so tests
+    can keep patching them per test.
+    """
     from flask import Flask
     import Medic.Core.routes as routes
 
@@ -86,10 +176,14 @@ def app():
     return app
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client(app):
-    """Create Flask test client."""
-    return app.test_client()
+    """Create a Flask test client shared by the tests of a module.
+
+    The API sets no cookies, so the client keeps no cookie jar and requests
+    carry no state from one test into the next.
+    """
+    return app.test_client(use_cookies=False)
 
 
 @pytest.fixture
@@ -2,8 +2,23 @@
 import pytest
 import json
 import os
+from contextlib import ExitStack
 from unittest.mock import patch, MagicMock
 
+# query_db results returned by the mocked alert flow, encoded once
+_ACTIVE_SERVICE_ROWS = json.dumps([{
+    "service_id": 1,
+    "heartbeat_name": "e2e-mock-heartbeat",
+    "active": 1
+}])
+_SERVICE_INFO_ROWS = json.dumps([{
+    "service_id": 1,
+    "heartbeat_name": "e2e-mock-heartbeat",
+    "active": 1,
+    "muted": 0
+}])
+_NO_ROWS = json.dumps([])
+
 
 @pytest.mark.e2e
 @pytest.mark.skipif(
@@ -25,13 +40,20 @@ class TestEndToEndWithRealService:
     def base_url(self):
         return os.environ.get("E2E_TEST_URL")
 
-    def test_full_service_lifecycle(self, base_url):
-        """Test complete service lifecycle: register -> heartbeat -> alert -> resolve."""
+    @pytest.fixture
+    def session(self):
+        """HTTP session reusing one keep-alive connection to the service."""
         import requests
+
+        with requests.Session() as session:
+            yield session
+
+    def test_full_service_lifecycle(self, base_url, session):
+        """Test complete service lifecycle: register -> heartbeat -> alert -> resolve."""
         import time
 
         # Step 1: Register a service
-        register_response = requests.post(
+        register_response = session.post(
             f"{base_url}/service",
             json={
                 "heartbeat_name": "e2e-test-heartbeat",
@@ -46,7 +68,7 @@ class TestEndToEndWithRealService:
 
         # Step 2: Post heartbeats
         for _ in range(3):
-            hb_response = requests.post(
+            hb_response = session.post(
                 f"{base_url}/heartbeat",
                 json={
                     "heartbeat_name": "e2e-test-heartbeat",
@@ -57,7 +79,7 @@ class TestEndToEndWithRealService:
             time.sleep(1)
 
         # Step 3: Query heartbeats
-        query_response = requests.get(
+        query_response = session.get(
             f"{base_url}/heartbeat",
             params={"heartbeat_name": "e2e-test-heartbeat"}
         )
@@ -67,7 +89,7 @@ class TestEndToEndWithRealService:
         assert len(data["results"]) >= 3
 
         # Step 4: Mute the service (cleanup)
-        mute_response = requests.post(
+        mute_response = session.post(
             f"{base_url}/service/e2e-test-heartbeat",
             json={"muted": 1, "active": 0}
         )
@@ -78,78 +100,84 @@ class TestEndToEndWithRealService:
 class TestEndToEndMocked:
     """End-to-end tests with mocked external services."""
 
-    @patch("Medic.Worker.pagerduty_client.requests.post")
-    @patch("Medic.Worker.slack_client.WebClient")
-    def test_complete_alert_flow(self, mock_slack, mock_pd_post, app, mock_env_vars, mock_db_connection):
+    @pytest.fixture
+    def alert_flow_mocks(self):
+        """Patch the database, heartbeat and notification collaborators at once."""
+        with ExitStack() as stack:
+            mocks = {
+                name: stack.enter_context(patch(target))
+                for name, target in (
+                    ("pagerduty_post", "Medic.Worker.pagerduty_client._session.post"),
+                    ("slack_client", "Medic.Worker.slack_client.WebClient"),
+                    ("query_db", "Medic.Core.routes.db.query_db"),
+                    ("insert_db", "Medic.Core.routes.db.insert_db"),
+                    ("add_heartbeat", "Medic.Core.routes.hbeat.addHeartbeat"),
+                    ("heartbeat", "Medic.Core.routes.hbeat.Heartbeat"),
+                )
+            }
+            yield mocks
+
+    def test_complete_alert_flow(self, alert_flow_mocks, app, mock_env_vars, mock_db_connection):
         """Test the complete alert flow from registration to resolution."""
+        from Medic.Worker.slack_client import reload_settings
+
+        reload_settings()
         client = app.test_client()
 
         # Mock PagerDuty response
         mock_pd_response = MagicMock()
         mock_pd_response.status_code = 202
         mock_pd_response.json.return_value = {"status": "success"}
-        mock_pd_post.return_value = mock_pd_response
+        alert_flow_mocks["pagerduty_post"].return_value = mock_pd_response
 
         # Mock Slack
         mock_slack_instance = MagicMock()
         mock_slack_instance.chat_postMessage.return_value = {"ok": True}
-        mock_slack.return_value = mock_slack_instance
-
-        with patch("Medic.Core.routes.db.query_db") as mock_query:
-            with patch("Medic.Core.routes.db.insert_db") as mock_insert:
-                mock_insert.return_value = True
-
-                # Step 1: Register service
-                mock_query.return_value = [(0,)]  # Not registered
-                response = client.post(
-                    "/service",
-                    data=json.dumps({
-                        "heartbeat_name": "e2e-mock-heartbeat",
-                        "service_name": "e2e-mock-service",
-                        "alert_interval": 5,
-                        "team": "platform"
-                    }),
-                    content_type="application/json"
-                )
-                assert response.status_code == 201
-
-                # Step 2: Post heartbeat
-                mock_query.return_value = json.dumps([{
-                    "service_id": 1,
-                    "heartbeat_name": "e2e-mock-heartbeat",
-                    "active": 1
-                }])
-
-                with patch("Medic.Core.routes.hbeat.addHeartbeat") as mock_add:
-                    mock_add.return_value = True
-                    with patch("Medic.Core.routes.hbeat.Heartbeat"):
-                        response = client.post(
-                            "/heartbeat",
-                            data=json.dumps({
-                                "heartbeat_name": "e2e-mock-heartbeat",
-                                "status": "UP"
-                            }),
-                            content_type="application/json"
-                        )
-                        assert response.status_code == 201
-
-                # Step 3: Get service info
-                mock_query.return_value = json.dumps([{
-                    "service_id": 1,
-                    "heartbeat_name": "e2e-mock-heartbeat",
-                    "active": 1,
-                    "muted": 0
-                }])
-
-                response = client.get("/service/e2e-mock-heartbeat")
-                assert response.status_code == 200
-                data = json.loads(response.data)
-                assert data["success"] is True
-
-                # Step 4: Check alerts endpoint
-                mock_query.return_value = json.dumps([])
-                response = client.get("/alerts")
-                assert response.status_code == 200
+        alert_flow_mocks["slack_client"].return_value = mock_slack_instance
+
+        mock_query = alert_flow_mocks["query_db"]
+        alert_flow_mocks["insert_db"].return_value = True
+        alert_flow_mocks["add_heartbeat"].return_value = True
+
+        # Step 1: Register service
+        mock_query.return_value = [(0,)]  # Not registered
+        response = client.post(
+            "/service",
+            data=json.dumps({
+                "heartbeat_name": "e2e-mock-heartbeat",
+                "service_name": "e2e-mock-service",
+                "alert_interval": 5,
+                "team": "platform"
+            }),
+            content_type="application/json"
+        )
+        assert response.status_code == 201
+
+        # Step 2: Post heartbeat
+        mock_query.return_value = _ACTIVE_SERVICE_ROWS
+
+        response = client.post(
+            "/heartbeat",
+            data=json.dumps({
+                "heartbeat_name": "e2e-mock-heartbeat",
+                "status": "UP"
+            }),
+            content_type="application/json"
+        )
+        assert response.status_code == 201
+
+        # Step 3: Get service info
+        mock_query.return_value = _SERVICE_INFO_ROWS
+
+        response = client.get("/service/e2e-mock-heartbeat")
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data["success"] is True
+
+        # Step 4: Check alerts endpoint
+        mock_query.return_value = _NO_ROWS
+        response = client.get("/alerts")
+        assert response.status_code == 200
 
     def test_api_error_handling(self, app, mock_env_vars):
         """Test API error handling for invalid requests."""
@@ -2,22 +2,70 @@
 import os
 import pytest
 import json
+from datetime import datetime
 from unittest.mock import patch, MagicMock
+from zoneinfo import ZoneInfo
+
+from Medic.Core.audit_log import (
+    AuditActionType,
+    AuditLogEntry,
+    AuditLogQueryResult,
+)
+from Medic.Core.job_runs import DurationStatistics
+
+# Request bodies and query_db results shared across tests, encoded once
+_ACTIVE_JOB_ROWS = json.dumps([{
+    "service_id": 1,
+    "heartbeat_name": "test-job",
+    "active": 1
+}])
+_ACTIVE_BATCH_JOB_ROWS = json.dumps([{
+    "service_id": 1,
+    "heartbeat_name": "batch-job",
+    "active": 1
+}])
+_BATCH_JOB_ROWS = json.dumps([{
+    "service_id": 1,
+    "heartbeat_name": "batch-job"
+}])
+_TEST_SERVICE_ROWS = json.dumps([{
+    "service_id": 42,
+    "heartbeat_name": "test-service"
+}])
+_RUN_ID_BODY = json.dumps({"run_id": "job-run-123"})
+_EMPTY_BODY = json.dumps({})
+
+_CHICAGO_TZ = ZoneInfo("America/Chicago")
+
+
+@pytest.fixture(scope="class")
+def db_mocks():
+    """Connection and cursor mocks built once per test class."""
+    mock_conn = MagicMock()
+    mock_cursor = MagicMock()
+    mock_conn.cursor.return_value = mock_cursor
+    return mock_conn, mock_cursor
 
 
 @pytest.mark.integration
 class TestAPIIntegration:
     """Integration tests for the full API flow."""
 
+    @pytest.fixture(autouse=True)
+    def reset_db_mocks(self, db_mocks):
+        """Clear calls and configured results left by the previous test."""
+        mock_conn, mock_cursor = db_mocks
+        mock_conn.reset_mock()
+        mock_cursor.reset_mock(return_value=True, side_effect=True)
+        mock_cursor.description = None
+
     @patch("Medic.Core.database.connect_db")
-    def test_full_heartbeat_flow(self, mock_connect, app, mock_env_vars):
+    def test_full_heartbeat_flow(
+        self, mock_connect, client, db_mocks, mock_env_vars
+    ):
         """Test the full heartbeat registration and posting flow."""
-        client = app.test_client()
-
         # Mock database responses
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_conn.cursor.return_value = mock_cursor
+        mock_conn, mock_cursor = db_mocks
         mock_connect.return_value = mock_conn
 
         # Step 1: Register a service
@@ -64,37 +112,34 @@ class TestAPIIntegration:
                     assert response.status_code == 201
 
     @patch("Medic.Core.database.connect_db")
-    def test_service_update_flow(self, mock_connect, app, mock_env_vars):
+    def test_service_update_flow(
+        self, mock_connect, client, mock_query_db, db_mocks, mock_env_vars
+    ):
         """Test service update operations."""
-        client = app.test_client()
-
-        mock_conn = MagicMock()
-        mock_cursor = MagicMock()
-        mock_conn.cursor.return_value = mock_cursor
+        mock_conn, _ = db_mocks
         mock_connect.return_value = mock_conn
 
-        with patch("Medic.Core.routes.db.query_db") as mock_query:
-            # Service exists
-            mock_query.return_value = json.dumps([{"service_id": 1}])
+        # Service exists
+        mock_query_db.return_value = json.dumps([{"service_id": 1}])
 
-            with patch("Medic.Core.routes.db.insert_db") as mock_insert:
-                mock_insert.return_value = True
+        with patch("Medic.Core.routes.db.insert_db") as mock_insert:
+            mock_insert.return_value = True
 
-                # Mute the service
-                response = client.post(
-                    "/service/test-heartbeat",
-                    data=json.dumps({"muted": 1}),
-                    content_type="application/json"
-                )
-                assert response.status_code == 200
+            # Mute the service
+            response = client.post(
+                "/service/test-heartbeat",
+                data=json.dumps({"muted": 1}),
+                content_type="application/json"
+            )
+            assert response.status_code == 200
 
-                # Update priority
-                response = client.post(
-                    "/service/test-heartbeat",
-                    data=json.dumps({"priority": "p1"}),
-                    content_type="application/json"
-                )
-                assert response.status_code == 200
+            # Update priority
+            response = client.post(
+                "/service/test-heartbeat",
+                data=json.dumps({"priority": "p1"}),
+                content_type="application/json"
+            )
+            assert response.status_code == 200
 
 
 @pytest.mark.integration
@@ -133,538 +178,391 @@ class TestDatabaseIntegration:
 class TestV2HeartbeatSignals:
     """Integration tests for V2 heartbeat start/complete/fail endpoints."""
 
-    def test_heartbeat_start_success(self, app, mock_env_vars):
-        """Test successful recording of STARTED signal."""
-        client = app.test_client()
-
-        with patch("Medic.Core.routes.db.query_db") as mock_query:
-            mock_query.return_value = json.dumps([{
-                "service_id": 1,
-                "heartbeat_name": "test-job",
-                "active": 1
-            }])
-
-            with patch("Medic.Core.routes.hbeat.addHeartbeat") as mock_add:
-                mock_add.return_value = True
-
-                # Mock job_runs module to avoid database dependency
-                with patch("Medic.Core.routes.job_runs") as mock_job_runs:
-                    mock_job_runs.record_job_start.return_value = None
-
-                    response = client.post(
-                        "/v2/heartbeat/1/start",
-                        data=json.dumps({"run_id": "job-run-123"}),
-                        content_type="application/json"
-                    )
-
-                    assert response.status_code == 201
-                    data = json.loads(response.data)
-                    assert data["success"] is True
-                    assert data["message"] == "Job signal STARTED recorded successfully."
-                    assert data["results"]["status"] == "STARTED"
-                    assert data["results"]["run_id"] == "job-run-123"
-
-    def test_heartbeat_complete_success(self, app, mock_env_vars):
-        """Test successful recording of COMPLETED signal."""
-        client = app.test_client()
-
-        with patch("Medic.Core.routes.db.query_db") as mock_query:
-            mock_query.return_value = json.dumps([{
-                "service_id": 1,
-                "heartbeat_name": "test-job",
-                "active": 1
-            }])
-
-            with patch("Medic.Core.routes.hbeat.addHeartbeat") as mock_add:
-                mock_add.return_value = True
-
-                # Mock job_runs module to avoid database dependency
-                with patch("Medic.Core.routes.job_runs") as mock_job_runs:
-                    mock_job_runs.record_job_completion.return_value = None
-
-                    response = client.post(
-                        "/v2/heartbeat/1/complete",
-                        data=json.dumps({"run_id": "job-run-123"}),
-                        content_type="application/json"
-                    )
-
-                    assert response.status_code == 201
-                    data = json.loads(response.data)
-                    assert data["success"] is True
-                    assert data["message"] == "Job signal COMPLETED recorded successfully."
-                    assert data["results"]["status"] == "COMPLETED"
-                    assert data["results"]["run_id"] == "job-run-123"
+    @pytest.mark.parametrize("action,status", [
+        ("start", "STARTED"),
+        ("complete", "COMPLETED"),
+        ("fail", "FAILED"),
+    ])
+    def test_heartbeat_signal_success(
+        self, action, status, client, mock_query_db, mock_add_heartbeat,
+        mock_job_runs, mock_env_vars
+    ):
+        """Test successful recording of each job signal."""
+        mock_query_db.return_value = _ACTIVE_JOB_ROWS
 
-    def test_heartbeat_fail_success(self, app, mock_env_vars):
-        """Test successful recording of FAILED signal."""
-        client = app.test_client()
+        mock_add_heartbeat.return_value = True
 
-        with patch("Medic.Core.routes.db.query_db") as mock_query:
-            mock_query.return_value = json.dumps([{
-                "service_id": 1,
-                "heartbeat_name": "test-job",
-                "active": 1
-            }])
+        # Mock job_runs module to avoid database dependency
+        mock_job_runs.record_job_start.return_value = None
+        mock_job_runs.record_job_completion.return_value = None
 
-            with patch("Medic.Core.routes.hbeat.addHeartbeat") as mock_add:
-                mock_add.return_value = True
-
-                # Mock job_runs module to avoid database dependency
-                with patch("Medic.Core.routes.job_runs") as mock_job_runs:
-                    mock_job_runs.record_job_completion.return_value = None
-
-                    response = client.post(
-                        "/v2/heartbeat/1/fail",
-                        data=json.dumps({"run_id": "job-run-123"}),
-                        content_type="application/json"
-                    )
+        response = client.post(
+            f"/v2/heartbeat/1/{action}",
+            data=_RUN_ID_BODY,
+            content_type="application/json"
+        )
 
-                    assert response.status_code == 201
-                    data = json.loads(response.data)
-                    assert data["success"] is True
-                    assert data["message"] == "Job signal FAILED recorded successfully."
-                    assert data["results"]["status"] == "FAILED"
-                    assert data["results"]["run_id"] == "job-run-123"
+        assert response.status_code == 201
+        data = json.loads(response.data)
+        assert data["success"] is True
+        assert data["message"] == f"Job signal {status} recorded successfully."
+        assert data["results"]["status"] == status
+        assert data["results"]["run_id"] == "job-run-123"
 
-    def test_heartbeat_start_without_run_id(self, app, mock_env_vars):
+    def test_heartbeat_start_without_run_id(
+        self, client, mock_query_db, mock_add_heartbeat, mock_env_vars
+    ):
         """Test recording STARTED signal without run_id."""
-        client = app.test_client()
+        mock_query_db.return_value = _ACTIVE_JOB_ROWS
 
-        with patch("Medic.Core.routes.db.query_db") as mock_query:
-            mock_query.return_value = json.dumps([{
-                "service_id": 1,
-                "heartbeat_name": "test-job",
-                "active": 1
-            }])
+        mock_add_heartbeat.return_value = True
 
-            with patch("Medic.Core.routes.hbeat.addHeartbeat") as mock_add:
-                mock_add.return_value = True
-
-                response = client.post(
-                    "/v2/heartbeat/1/start",
-                    content_type="application/json"
-                )
+        response = client.post(
+            "/v2/heartbeat/1/start",
+            content_type="application/json"
+        )
 
-                assert response.status_code == 201
-                data = json.loads(response.data)
-                assert data["success"] is True
-                assert data["results"]["run_id"] is None
+        assert response.status_code == 201
+        data = json.loads(response.data)
+        assert data["success"] is True
+        assert data["results"]["run_id"] is None
 
-    def test_heartbeat_signal_service_not_found(self, app, mock_env_vars):
+    def test_heartbeat_signal_service_not_found(
+        self, client, mock_query_db, mock_env_vars
+    ):
         """Test signal recording when service doesn't exist."""
-        client = app.test_client()
-
-        with patch("Medic.Core.routes.db.query_db") as mock_query:
-            mock_query.return_value = '[]'
+        mock_query_db.return_value = '[]'
 
-            response = client.post(
-                "/v2/heartbeat/999/start",
-                data=json.dumps({"run_id": "job-run-123"}),
-                content_type="application/json"
-            )
+        response = client.post(
+            "/v2/heartbeat/999/start",
+            data=_RUN_ID_BODY,
+            content_type="application/json"
+        )
 
-            assert response.status_code == 404
-            data = json.loads(response.data)
-            assert data["success"] is False
-            assert "not found" in data["message"]
+        assert response.status_code == 404
+        data = json.loads(response.data)
+        assert data["success"] is False
+        assert "not found" in data["message"]
 
-    def test_heartbeat_signal_service_inactive(self, app, mock_env_vars):
+    def test_heartbeat_signal_service_inactive(
+        self, client, mock_query_db, mock_env_vars
+    ):
         """Test signal recording when service is inactive."""
-        client = app.test_client()
-
-        with patch("Medic.Core.routes.db.query_db") as mock_query:
-            mock_query.return_value = json.dumps([{
-                "service_id": 1,
-                "heartbeat_name": "test-job",
-                "active": 0
-            }])
+        mock_query_db.return_value = json.dumps([{
+            "service_id": 1,
+            "heartbeat_name": "test-job",
+            "active": 0
+        }])
 
-            response = client.post(
-                "/v2/heartbeat/1/start",
-                data=json.dumps({"run_id": "job-run-123"}),
-                content_type="application/json"
-            )
+        response = client.post(
+            "/v2/heartbeat/1/start",
+            data=_RUN_ID_BODY,
+            content_type="application/json"
+        )
 
-            assert response.status_code == 400
-            data = json.loads(response.data)
-            assert data["success"] is False
-            assert "inactive" in data["message"]
+        assert response.status_code == 400
+        data = json.loads(response.data)
+        assert data["success"] is False
+        assert "inactive" in data["message"]
 
-    def test_heartbeat_signal_database_error(self, app, mock_env_vars):
+    def test_heartbeat_signal_database_error(
+        self, client, mock_query_db, mock_add_heartbeat, mock_env_vars
+    ):
         """Test signal recording when database insert fails."""
-        client = app.test_client()
+        mock_query_db.return_value = _ACTIVE_JOB_ROWS
 
-        with patch("Medic.Core.routes.db.query_db") as mock_query:
-            mock_query.return_value = json.dumps([{
-                "service_id": 1,
-                "heartbeat_name": "test-job",
-                "active": 1
-            }])
-
-            with patch("Medic.Core.routes.hbeat.addHeartbeat") as mock_add:
-                mock_add.return_value = False
-
-                response = client.post(
-                    "/v2/heartbeat/1/start",
-                    data=json.dumps({"run_id": "job-run-123"}),
-                    content_type="application/json"
-                )
-
-                assert response.status_code == 500
-                data = json.loads(response.data)
-                assert data["success"] is False
-                assert "Failed" in data["message"]
-
-    def test_full_job_lifecycle(self, app, mock_env_vars):
-        """Test complete job lifecycle: start -> complete."""
-        client = app.test_client()
-
-        with patch("Medic.Core.routes.db.query_db") as mock_query:
-            mock_query.return_value = json.dumps([{
-                "service_id": 1,
-                "heartbeat_name": "batch-job",
-                "active": 1
-            }])
-
-            with patch("Medic.Core.routes.hbeat.addHeartbeat") as mock_add:
-                mock_add.return_value = True
-
-                # Mock job_runs module to avoid database dependency
-                with patch("Medic.Core.routes.job_runs") as mock_job_runs:
-                    mock_job_runs.record_job_start.return_value = None
-                    mock_job_runs.record_job_completion.return_value = None
-
-                    run_id = "batch-run-456"
+        mock_add_heartbeat.return_value = False
 
-                    # Start the job
-                    response = client.post(
-                        "/v2/heartbeat/1/start",
-                        data=json.dumps({"run_id": run_id}),
-                        content_type="application/json"
-                    )
-                    assert response.status_code == 201
-                    data = json.loads(response.data)
-                    assert data["results"]["status"] == "STARTED"
-
-                    # Complete the job
-                    response = client.post(
-                        "/v2/heartbeat/1/complete",
-                        data=json.dumps({"run_id": run_id}),
-                        content_type="application/json"
-                    )
-                    assert response.status_code == 201
-                    data = json.loads(response.data)
-                    assert data["results"]["status"] == "COMPLETED"
-
-    def test_full_job_lifecycle_with_failure(self, app, mock_env_vars):
-        """Test job lifecycle with failure: start -> fail."""
-        client = app.test_client()
+        response = client.post(
+            "/v2/heartbeat/1/start",
+            data=_RUN_ID_BODY,
+            content_type="application/json"
+        )
 
-        with patch("Medic.Core.routes.db.query_db") as mock_query:
-            mock_query.return_value = json.dumps([{
-                "service_id": 1,
-                "heartbeat_name": "batch-job",
-                "active": 1
-            }])
+        assert response.status_code == 500
+        data = json.loads(response.data)
+        assert data["success"] is False
+        assert "Failed" in data["message"]
+
+    @pytest.mark.parametrize("action,status", [
+        ("complete", "COMPLETED"),
+        ("fail", "FAILED"),
+    ])
+    def test_full_job_lifecycle(
+        self, action, status, client, mock_query_db, mock_add_heartbeat,
+        mock_job_runs, mock_env_vars
+    ):
+        """Test job lifecycle: start -> complete, and start -> fail."""
+        mock_query_db.return_value = _ACTIVE_BATCH_JOB_ROWS
 
-            with patch("Medic.Core.routes.hbeat.addHeartbeat") as mock_add:
-                mock_add.return_value = True
+        mock_add_heartbeat.return_value = True
 
-                # Mock job_runs module to avoid database dependency
-                with patch("Medic.Core.routes.job_runs") as mock_job_runs:
-                    mock_job_runs.record_job_start.return_value = None
-                    mock_job_runs.record_job_completion.return_value = None
+        # Mock job_runs module to avoid database dependency
+        mock_job_runs.record_job_start.return_value = None
+        mock_job_runs.record_job_completion.return_value = None
 
-                    run_id = "batch-run-789"
+        body = json.dumps({"run_id": "batch-run-456"})
 
-                    # Start the job
-                    response = client.post(
-                        "/v2/heartbeat/1/start",
-                        data=json.dumps({"run_id": run_id}),
-                        content_type="application/json"
-                    )
-                    assert response.status_code == 201
+        # Start the job
+        response = client.post(
+            "/v2/heartbeat/1/start",
+            data=body,
+            content_type="application/json"
+        )
+        assert response.status_code == 201
+        data = json.loads(response.data)
+        assert data["results"]["status"] == "STARTED"
 
-                    # Fail the job
-                    response = client.post(
-                        "/v2/heartbeat/1/fail",
-                        data=json.dumps({"run_id": run_id}),
-                        content_type="application/json"
-                    )
-                    assert response.status_code == 201
-                    data = json.loads(response.data)
-                    assert data["results"]["status"] == "FAILED"
+        # Complete or fail the job
+        response = client.post(
+            f"/v2/heartbeat/1/{action}",
+            data=body,
+            content_type="application/json"
+        )
+        assert response.status_code == 201
+        data = json.loads(response.data)
+        assert data["results"]["status"] == status
 
-    def test_heartbeat_signal_invalid_json_body(self, app, mock_env_vars):
+    def test_heartbeat_signal_invalid_json_body(
+        self, client, mock_query_db, mock_add_heartbeat, mock_env_vars
+    ):
         """Test signal recording with invalid JSON body (still works, run_id=None)."""
-        client = app.test_client()
+        mock_query_db.return_value = _ACTIVE_JOB_ROWS
 
-        with patch("Medic.Core.routes.db.query_db") as mock_query:
-            mock_query.return_value = json.dumps([{
-                "service_id": 1,
-                "heartbeat_name": "test-job",
-                "active": 1
-            }])
-
-            with patch("Medic.Core.routes.hbeat.addHeartbeat") as mock_add:
-                mock_add.return_value = True
+        mock_add_heartbeat.return_value = True
 
-                # Send invalid JSON - should still work with run_id=None
-                response = client.post(
-                    "/v2/heartbeat/1/start",
-                    data="not valid json",
-                    content_type="application/json"
-                )
+        # Send invalid JSON - should still work with run_id=None
+        response = client.post(
+            "/v2/heartbeat/1/start",
+            data="not valid json",
+            content_type="application/json"
+        )
 
-                assert response.status_code == 201
-                data = json.loads(response.data)
-                assert data["success"] is True
-                assert data["results"]["run_id"] is None
+        assert response.status_code == 201
+        data = json.loads(response.data)
+        assert data["success"] is True
+        assert data["results"]["run_id"] is None
 
 
 @pytest.mark.integration
 class TestV2DurationStatistics:
     """Integration tests for V2 duration statistics endpoint."""
 
-    def test_duration_stats_success_with_data(self, app, mock_env_vars):
+    def test_duration_stats_success_with_data(
+        self, client, mock_query_db, mock_env_vars
+    ):
         """Test successful stats retrieval with sufficient data."""
-        client = app.test_client()
-
-        with patch("Medic.Core.routes.db.query_db") as mock_query:
-            mock_query.return_value = json.dumps([{
-                "service_id": 1,
-                "heartbeat_name": "batch-job"
-            }])
+        mock_query_db.return_value = _BATCH_JOB_ROWS
 
-            with patch("Medic.Core.routes.job_runs.get_duration_statistics") as mock_stats:
-                from Medic.Core.job_runs import DurationStatistics
-                mock_stats.return_value = DurationStatistics(
-                    service_id=1,
-                    run_count=50,
-                    avg_duration_ms=1500.5,
-                    p50_duration_ms=1200,
-                    p95_duration_ms=2800,
-                    p99_duration_ms=3500,
-                    min_duration_ms=500,
-                    max_duration_ms=4000
-                )
+        with patch("Medic.Core.routes.job_runs.get_duration_statistics") as mock_stats:
+            mock_stats.return_value = DurationStatistics(
+                service_id=1,
+                run_count=50,
+                avg_duration_ms=1500.5,
+                p50_duration_ms=1200,
+                p95_duration_ms=2800,
+                p99_duration_ms=3500,
+                min_duration_ms=500,
+                max_duration_ms=4000
+            )
 
-                response = client.get("/v2/services/1/stats")
+            response = client.get("/v2/services/1/stats")
 
-                assert response.status_code == 200
-                data = json.loads(response.data)
-                assert data["success"] is True
-                assert data["results"]["service_id"] == 1
-                assert data["results"]["run_count"] == 50
-                assert data["results"]["avg_duration_ms"] == 1500.5
-                assert data["results"]["p50_duration_ms"] == 1200
-                assert data["results"]["p95_duration_ms"] == 2800
-                assert data["results"]["p99_duration_ms"] == 3500
-                assert data["results"]["min_duration_ms"] == 500
-                assert data["results"]["max_duration_ms"] == 4000
-
-    def test_duration_stats_insufficient_data(self, app, mock_env_vars):
+            assert response.status_code == 200
+            data = json.loads(response.data)
+            assert data["success"] is True
+            assert data["results"]["service_id"] == 1
+            assert data["results"]["run_count"] == 50
+            assert data["results"]["avg_duration_ms"] == 1500.5
+            assert data["results"]["p50_duration_ms"] == 1200
+            assert data["results"]["p95_duration_ms"] == 2800
+            assert data["results"]["p99_duration_ms"] == 3500
+            assert data["results"]["min_duration_ms"] == 500
+            assert data["results"]["max_duration_ms"] == 4000
+
+    def test_duration_stats_insufficient_data(
+        self, client, mock_query_db, mock_env_vars
+    ):
         """Test stats retrieval with insufficient data (< 5 runs)."""
-        client = app.test_client()
-
-        with patch("Medic.Core.routes.db.query_db") as mock_query:
-            mock_query.return_value = json.dumps([{
-                "service_id": 1,
-                "heartbeat_name": "batch-job"
-            }])
+        mock_query_db.return_value = _BATCH_JOB_ROWS
 
-            with patch("Medic.Core.routes.job_runs.get_duration_statistics") as mock_stats:
-                from Medic.Core.job_runs import DurationStatistics
-                # Return empty stats (fewer than 5 runs)
-                mock_stats.return_value = DurationStatistics(
-                    service_id=1,
-                    run_count=3
-                )
+        with patch("Medic.Core.routes.job_runs.get_duration_statistics") as mock_stats:
+            # Return empty stats (fewer than 5 runs)
+            mock_stats.return_value = DurationStatistics(
+                service_id=1,
+                run_count=3
+            )
 
-                response = client.get("/v2/services/1/stats")
+            response = client.get("/v2/services/1/stats")
 
-                assert response.status_code == 200
-                data = json.loads(response.data)
-                assert data["success"] is True
-                assert data["results"]["service_id"] == 1
-                assert data["results"]["run_count"] == 3
-                assert data["results"]["avg_duration_ms"] is None
-                assert data["results"]["p50_duration_ms"] is None
-                assert data["results"]["p95_duration_ms"] is None
-                assert data["results"]["p99_duration_ms"] is None
-
-    def test_duration_stats_no_runs(self, app, mock_env_vars):
+            assert response.status_code == 200
+            data = json.loads(response.data)
+            assert data["success"] is True
+            assert data["results"]["service_id"] == 1
+            assert data["results"]["run_count"] == 3
+            assert data["results"]["avg_duration_ms"] is None
+            assert data["results"]["p50_duration_ms"] is None
+            assert data["results"]["p95_duration_ms"] is None
+            assert data["results"]["p99_duration_ms"] is None
+
+    def test_duration_stats_no_runs(self, client, mock_query_db, mock_env_vars):
         """Test stats retrieval with no runs."""
-        client = app.test_client()
+        mock_query_db.return_value = _BATCH_JOB_ROWS
 
-        with patch("Medic.Core.routes.db.query_db") as mock_query:
-            mock_query.return_value = json.dumps([{
-                "service_id": 1,
-                "heartbeat_name": "batch-job"
-            }])
-
-            with patch("Medic.Core.routes.job_runs.get_duration_statistics") as mock_stats:
-                from Medic.Core.job_runs import DurationStatistics
-                mock_stats.return_value = DurationStatistics(
-                    service_id=1,
-                    run_count=0
-                )
+        with patch("Medic.Core.routes.job_runs.get_duration_statistics") as mock_stats:
+            mock_stats.return_value = DurationStatistics(
+                service_id=1,
+                run_count=0
+            )
 
-                response = client.get("/v2/services/1/stats")
+            response = client.get("/v2/services/1/stats")
 
-                assert response.status_code == 200
-                data = json.loads(response.data)
-                assert data["success"] is True
-                assert data["results"]["run_count"] == 0
-                assert data["results"]["avg_duration_ms"] is None
+            assert response.status_code == 200
+            data = json.loads(response.data)
+            assert data["success"] is True
+            assert data["results"]["run_count"] == 0
+            assert data["results"]["avg_duration_ms"] is None
 
-    def test_duration_stats_service_not_found(self, app, mock_env_vars):
+    def test_duration_stats_service_not_found(
+        self, client, mock_query_db, mock_env_vars
+    ):
         """Test stats retrieval when service doesn't exist."""
-        client = app.test_client()
+        mock_query_db.return_value = '[]'
 
-        with patch("Medic.Core.routes.db.query_db") as mock_query:
-            mock_query.return_value = '[]'
-
-            response = client.get("/v2/services/999/stats")
+        response = client.get("/v2/services/999/stats")
 
-            assert response.status_code == 404
-            data = json.loads(response.data)
-            assert data["success"] is False
-            assert "not found" in data["message"]
+        assert response.status_code == 404
+        data = json.loads(response.data)
+        assert data["success"] is False
+        assert "not found" in data["message"]
 
-    def test_duration_stats_service_null_result(self, app, mock_env_vars):
+    def test_duration_stats_service_null_result(
+        self, client, mock_query_db, mock_env_vars
+    ):
         """Test stats retrieval when database returns null."""
-        client = app.test_client()
+        mock_query_db.return_value = None
 
-        with patch("Medic.Core.routes.db.query_db") as mock_query:
-            mock_query.return_value = None
+        response = client.get("/v2/services/999/stats")
 
-            response = client.get("/v2/services/999/stats")
+        assert response.status_code == 404
+        data = json.loads(response.data)
+        assert data["success"] is False
 
-            assert response.status_code == 404
-            data = json.loads(response.data)
-            assert data["success"] is False
+
+@pytest.fixture(scope="class")
+def mock_query_audit_logs():
+    """Patch query_audit_logs once for every test of a class."""
+    with patch("Medic.Core.audit_log.query_audit_logs") as mock:
+        yield mock
 
 
 @pytest.mark.integration
 class TestV2AuditLogs:
     """Integration tests for V2 audit logs query endpoint."""
 
-    def test_audit_logs_query_no_filters(self, app, mock_env_vars):
-        """Test querying audit logs without any filters."""
-        client = app.test_client()
-
-        with patch("Medic.Core.audit_log.query_audit_logs") as mock_query:
-            from Medic.Core.audit_log import AuditLogQueryResult
-            mock_query.return_value = AuditLogQueryResult(
-                entries=[],
-                total_count=0,
-                limit=50,
-                offset=0,
-                has_more=False,
-            )
+    @pytest.fixture(autouse=True)
+    def reset_mock_query_audit_logs(self, mock_query_audit_logs):
+        """Clear calls and results left by the previous test."""
+        mock_query_audit_logs.reset_mock(return_value=True, side_effect=True)
 
-            response = client.get("/v2/audit-logs")
+    def test_audit_logs_query_no_filters(
+        self, client, mock_query_audit_logs, mock_env_vars
+    ):
+        """Test querying audit logs without any filters."""
+        mock_query_audit_logs.return_value = AuditLogQueryResult(
+            entries=[],
+            total_count=0,
+            limit=50,
+            offset=0,
+            has_more=False,
+        )
 
-            assert response.status_code == 200
-            data = json.loads(response.data)
-            assert data["success"] is True
-            assert data["results"]["total_count"] == 0
-            assert data["results"]["limit"] == 50
-            assert data["results"]["offset"] == 0
-            assert data["results"]["has_more"] is False
+        response = client.get("/v2/audit-logs")
 
-    def test_audit_logs_query_with_execution_id(self, app, mock_env_vars):
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data["success"] is True
+        assert data["results"]["total_count"] == 0
+        assert data["results"]["limit"] == 50
+        assert data["results"]["offset"] == 0
+        assert data["results"]["has_more"] is False
+
+    def test_audit_logs_query_with_execution_id(
+        self, client, mock_query_audit_logs, mock_env_vars
+    ):
         """Test querying audit logs by execution_id."""
-        client = app.test_client()
-
-        with patch("Medic.Core.audit_log.query_audit_logs") as mock_query:
-            from Medic.Core.audit_log import (
-                AuditActionType,
-                AuditLogEntry,
-                AuditLogQueryResult,
-            )
-            from datetime import datetime
-            import pytz
-
-            now = datetime.now(pytz.timezone('America/Chicago'))
-            mock_query.return_value = AuditLogQueryResult(
-                entries=[
-                    AuditLogEntry(
-                        log_id=1,
-                        execution_id=100,
-                        action_type=AuditActionType.EXECUTION_STARTED,
-                        details={"playbook_name": "test"},
-                        actor=None,
-                        timestamp=now,
-                    )
-                ],
-                total_count=1,
-                limit=50,
-                offset=0,
-                has_more=False,
-            )
-
-            response = client.get("/v2/audit-logs?execution_id=100")
-
-            assert response.status_code == 200
-            data = json.loads(response.data)
-            assert data["success"] is True
-            assert data["results"]["total_count"] == 1
-            assert len(data["results"]["entries"]) == 1
-            assert data["results"]["entries"][0]["execution_id"] == 100
+        now = datetime.now(_CHICAGO_TZ)
+        mock_query_audit_logs.return_value = AuditLogQueryResult(
+            entries=[
+                AuditLogEntry(
+                    log_id=1,
+                    execution_id=100,
+                    action_type=AuditActionType.EXECUTION_STARTED,
+                    details={"playbook_name": "test"},
+                    actor=None,
+                    timestamp=now,
+                )
+            ],
+            total_count=1,
+            limit=50,
+            offset=0,
+            has_more=False,
+        )
 
-            # Verify query was called with correct params
-            mock_query.assert_called_once()
-            call_kwargs = mock_query.call_args[1]
-            assert call_kwargs["execution_id"] == 100
+        response = client.get("/v2/audit-logs?execution_id=100")
 
-    def test_audit_logs_query_with_service_id(self, app, mock_env_vars):
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data["success"] is True
+        assert data["results"]["total_count"] == 1
+        assert len(data["results"]["entries"]) == 1
+        assert data["results"]["entries"][0]["execution_id"] == 100
+
+        # Verify query was called with correct params
+        mock_query_audit_logs.assert_called_once()
+        call_kwargs = mock_query_audit_logs.call_args[1]
+        assert call_kwargs["execution_id"] == 100
+
+    def test_audit_logs_query_with_service_id(
+        self, client, mock_query_audit_logs, mock_env_vars
+    ):
         """Test querying audit logs by service_id."""
-        client = app.test_client()
-
-        with patch("Medic.Core.audit_log.query_audit_logs") as mock_query:
-            from Medic.Core.audit_log import AuditLogQueryResult
-            mock_query.return_value = AuditLogQueryResult(
-                entries=[],
-                total_count=0,
-                limit=50,
-                offset=0,
-                has_more=False,
-            )
+        mock_query_audit_logs.return_value = AuditLogQueryResult(
+            entries=[],
+            total_count=0,
+            limit=50,
+            offset=0,
+            has_more=False,
+        )
 
-            response = client.get("/v2/audit-logs?service_id=42")
+        response = client.get("/v2/audit-logs?service_id=42")
 
-            assert response.status_code == 200
-            mock_query.assert_called_once()
-            call_kwargs = mock_query.call_args[1]
-            assert call_kwargs["service_id"] == 42
+        assert response.status_code == 200
+        mock_query_audit_logs.assert_called_once()
+        call_kwargs = mock_query_audit_logs.call_args[1]
+        assert call_kwargs["service_id"] == 42
 
-    def test_audit_logs_query_with_action_type(self, app, mock_env_vars):
+    def test_audit_logs_query_with_action_type(
+        self, client, mock_query_audit_logs, mock_env_vars
+    ):
         """Test querying audit logs by action_type."""
-        client = app.test_client()
-
-        with patch("Medic.Core.audit_log.query_audit_logs") as mock_query:
-            from Medic.Core.audit_log import AuditLogQueryResult
-            mock_query.return_value = AuditLogQueryResult(
-                entries=[],
-                total_count=0,
-                limit=50,
-                offset=0,
-                has_more=False,
-            )
+        mock_query_audit_logs.return_value = AuditLogQueryResult(
+            entries=[],
+            total_count=0,
+            limit=50,
+            offset=0,
+            has_more=False,
+        )
 
-            response = client.get("/v2/audit-logs?action_type=approved")
+        response = client.get("/v2/audit-logs?action_type=approved")
 
-            assert response.status_code == 200
-            mock_query.assert_called_once()
-            call_kwargs = mock_query.call_args[1]
-            assert call_kwargs["action_type"] == "approved"
+        assert response.status_code == 200
+        mock_query_audit_logs.assert_called_once()
+        call_kwargs = mock_query_audit_logs.call_args[1]
+        assert call_kwargs["action_type"] == "approved"
 
-    def test_audit_logs_query_with_invalid_action_type(self, app, mock_env_vars):
+    def test_audit_logs_query_with_invalid_action_type(self, client, mock_env_vars):
         """Test querying audit logs with invalid action_type."""
-        client = app.test_client()
-
         response = client.get("/v2/audit-logs?action_type=invalid_type")
 
         assert response.status_code == 400
@@ -672,36 +570,32 @@ class TestV2AuditLogs:
         assert data["success"] is False
         assert "Invalid action_type" in data["message"]
 
-    def test_audit_logs_query_with_date_range(self, app, mock_env_vars):
+    def test_audit_logs_query_with_date_range(
+        self, client, mock_query_audit_logs, mock_env_vars
+    ):
         """Test querying audit logs with date range."""
-        client = app.test_client()
-
-        with patch("Medic.Core.audit_log.query_audit_logs") as mock_query:
-            from Medic.Core.audit_log import AuditLogQueryResult
-            mock_query.return_value = AuditLogQueryResult(
-                entries=[],
-                total_count=0,
-                limit=50,
-                offset=0,
-                has_more=False,
-            )
+        mock_query_audit_logs.return_value = AuditLogQueryResult(
+            entries=[],
+            total_count=0,
+            limit=50,
+            offset=0,
+            has_more=False,
+        )
 
-            response = client.get(
-                "/v2/audit-logs?"
-                "start_date=2026-01-01T00:00:00Z&"
-                "end_date=2026-01-31T23:59:59Z"
-            )
+        response = client.get(
+            "/v2/audit-logs?"
+            "start_date=2026-01-01T00:00:00Z&"
+            "end_date=2026-01-31T23:59:59Z"
+        )
 
-            assert response.status_code == 200
-            mock_query.assert_called_once()
-            call_kwargs = mock_query.call_args[1]
-            assert call_kwargs["start_date"] is not None
-            assert call_kwargs["end_date"] is not None
+        assert response.status_code == 200
+        mock_query_audit_logs.assert_called_once()
+        call_kwargs = mock_query_audit_logs.call_args[1]
+        assert call_kwargs["start_date"] is not None
+        assert call_kwargs["end_date"] is not None
 
-    def test_audit_logs_query_with_invalid_start_date(self, app, mock_env_vars):
+    def test_audit_logs_query_with_invalid_start_date(self, client, mock_env_vars):
         """Test querying audit logs with invalid start_date format."""
-        client = app.test_client()
-
         response = client.get("/v2/audit-logs?start_date=not-a-date")
 
         assert response.status_code == 400
@@ -709,10 +603,8 @@ class TestV2AuditLogs:
         assert data["success"] is False
         assert "Invalid start_date format" in data["message"]
 
-    def test_audit_logs_query_with_invalid_end_date(self, app, mock_env_vars):
+    def test_audit_logs_query_with_invalid_end_date(self, client, mock_env_vars):
         """Test querying audit logs with invalid end_date format."""
-        client = app.test_client()
-
         response = client.get("/v2/audit-logs?end_date=2026/01/31")
 
         assert response.status_code == 400
@@ -720,143 +612,126 @@ class TestV2AuditLogs:
         assert data["success"] is False
         assert "Invalid end_date format" in data["message"]
 
-    def test_audit_logs_query_with_pagination(self, app, mock_env_vars):
+    def test_audit_logs_query_with_pagination(
+        self, client, mock_query_audit_logs, mock_env_vars
+    ):
         """Test querying audit logs with pagination."""
-        client = app.test_client()
-
-        with patch("Medic.Core.audit_log.query_audit_logs") as mock_query:
-            from Medic.Core.audit_log import AuditLogQueryResult
-            mock_query.return_value = AuditLogQueryResult(
-                entries=[],
-                total_count=100,
-                limit=10,
-                offset=50,
-                has_more=True,
-            )
+        mock_query_audit_logs.return_value = AuditLogQueryResult(
+            entries=[],
+            total_count=100,
+            limit=10,
+            offset=50,
+            has_more=True,
+        )
 
-            response = client.get("/v2/audit-logs?limit=10&offset=50")
+        response = client.get("/v2/audit-logs?limit=10&offset=50")
 
-            assert response.status_code == 200
-            data = json.loads(response.data)
-            assert data["results"]["limit"] == 10
-            assert data["results"]["offset"] == 50
-            assert data["results"]["has_more"] is True
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data["results"]["limit"] == 10
+        assert data["results"]["offset"] == 50
+        assert data["results"]["has_more"] is True
 
-            mock_query.assert_called_once()
-            call_kwargs = mock_query.call_args[1]
-            assert call_kwargs["limit"] == 10
-            assert call_kwargs["offset"] == 50
+        mock_query_audit_logs.assert_called_once()
+        call_kwargs = mock_query_audit_logs.call_args[1]
+        assert call_kwargs["limit"] == 10
+        assert call_kwargs["offset"] == 50
 
-    def test_audit_logs_csv_export(self, app, mock_env_vars):
+    def test_audit_logs_csv_export(self, client, mock_query_audit_logs, mock_env_vars):
         """Test exporting audit logs as CSV."""
-        client = app.test_client()
-
-        with patch("Medic.Core.audit_log.query_audit_logs") as mock_query:
-            from Medic.Core.audit_log import (
-                AuditActionType,
-                AuditLogEntry,
-                AuditLogQueryResult,
-            )
-            from datetime import datetime
-            import pytz
-
-            now = datetime.now(pytz.timezone('America/Chicago'))
-            mock_query.return_value = AuditLogQueryResult(
-                entries=[
-                    AuditLogEntry(
-                        log_id=1,
-                        execution_id=100,
-                        action_type=AuditActionType.EXECUTION_STARTED,
-                        details={"playbook_name": "test"},
-                        actor=None,
-                        timestamp=now,
-                    ),
-                    AuditLogEntry(
-                        log_id=2,
-                        execution_id=100,
-                        action_type=AuditActionType.APPROVED,
-                        details={},
-                        actor="user123",
-                        timestamp=now,
-                    ),
-                ],
-                total_count=2,
-                limit=50,
-                offset=0,
-                has_more=False,
-            )
-
-            response = client.get(
-                "/v2/audit-logs",
-                headers={"Accept": "text/csv"}
-            )
-
-            assert response.status_code == 200
-            assert response.content_type == "text/csv; charset=utf-8"
-            assert (
-                response.headers.get("Content-Disposition") ==
-                "attachment; filename=audit_logs.csv"
-            )
-            assert response.headers.get("X-Total-Count") == "2"
-            assert response.headers.get("X-Has-More") == "false"
+        now = datetime.now(_CHICAGO_TZ)
+        mock_query_audit_logs.return_value = AuditLogQueryResult(
+            entries=[
+                AuditLogEntry(
+                    log_id=1,
+                    execution_id=100,
+                    action_type=AuditActionType.EXECUTION_STARTED,
+                    details={"playbook_name": "test"},
+                    actor=None,
+                    timestamp=now,
+                ),
+                AuditLogEntry(
+                    log_id=2,
+                    execution_id=100,
+                    action_type=AuditActionType.APPROVED,
+                    details={},
+                    actor="user123",
+                    timestamp=now,
+                ),
+            ],
+            total_count=2,
+            limit=50,
+            offset=0,
+            has_more=False,
+        )
 
-            # Verify CSV content
-            csv_content = response.data.decode("utf-8")
-            assert "log_id" in csv_content  # Header
-            assert "execution_started" in csv_content
-            assert "approved" in csv_content
-            assert "user123" in csv_content
+        response = client.get(
+            "/v2/audit-logs",
+            headers={"Accept": "text/csv"}
+        )
 
-    def test_audit_logs_query_with_actor(self, app, mock_env_vars):
+        assert response.status_code == 200
+        assert response.content_type == "text/csv; charset=utf-8"
+        assert (
+            response.headers.get("Content-Disposition") ==
+            "attachment; filename=audit_logs.csv"
+        )
+        assert response.headers.get("X-Total-Count") == "2"
+        assert response.headers.get("X-Has-More") == "false"
+
+        # Verify CSV content
+        csv_content = response.data.decode("utf-8")
+        assert "log_id" in csv_content  # Header
+        assert "execution_started" in csv_content
+        assert "approved" in csv_content
+        assert "user123" in csv_content
+
+    def test_audit_logs_query_with_actor(
+        self, client, mock_query_audit_logs, mock_env_vars
+    ):
         """Test querying audit logs by actor."""
-        client = app.test_client()
-
-        with patch("Medic.Core.audit_log.query_audit_logs") as mock_query:
-            from Medic.Core.audit_log import AuditLogQueryResult
-            mock_query.return_value = AuditLogQueryResult(
-                entries=[],
-                total_count=0,
-                limit=50,
-                offset=0,
-                has_more=False,
-            )
+        mock_query_audit_logs.return_value = AuditLogQueryResult(
+            entries=[],
+            total_count=0,
+            limit=50,
+            offset=0,
+            has_more=False,
+        )
 
-            response = client.get("/v2/audit-logs?actor=user123")
+        response = client.get("/v2/audit-logs?actor=user123")
 
-            assert response.status_code == 200
-            mock_query.assert_called_once()
-            call_kwargs = mock_query.call_args[1]
-            assert call_kwargs["actor"] == "user123"
+        assert response.status_code == 200
+        mock_query_audit_logs.assert_called_once()
+        call_kwargs = mock_query_audit_logs.call_args[1]
+        assert call_kwargs["actor"] == "user123"
 
-    def test_audit_logs_query_multiple_filters(self, app, mock_env_vars):
+    def test_audit_logs_query_multiple_filters(
+        self, client, mock_query_audit_logs, mock_env_vars
+    ):
         """Test querying audit logs with multiple filters."""
-        client = app.test_client()
-
-        with patch("Medic.Core.audit_log.query_audit_logs") as mock_query:
-            from Medic.Core.audit_log import AuditLogQueryResult
-            mock_query.return_value = AuditLogQueryResult(
-                entries=[],
-                total_count=0,
-                limit=50,
-                offset=0,
-                has_more=False,
-            )
+        mock_query_audit_logs.return_value = AuditLogQueryResult(
+            entries=[],
+            total_count=0,
+            limit=50,
+            offset=0,
+            has_more=False,
+        )
 
-            response = client.get(
-                "/v2/audit-logs?"
-                "execution_id=100&"
-                "service_id=42&"
-                "action_type=approved&"
-                "actor=user123"
-            )
+        response = client.get(
+            "/v2/audit-logs?"
+            "execution_id=100&"
+            "service_id=42&"
+            "action_type=approved&"
+            "actor=user123"
+        )
 
-            assert response.status_code == 200
-            mock_query.assert_called_once()
-            call_kwargs = mock_query.call_args[1]
-            assert call_kwargs["execution_id"] == 100
-            assert call_kwargs["service_id"] == 42
-            assert call_kwargs["action_type"] == "approved"
-            assert call_kwargs["actor"] == "user123"
+        assert response.status_code == 200
+        mock_query_audit_logs.assert_called_once()
+        call_kwargs = mock_query_audit_logs.call_args[1]
+        assert call_kwargs["execution_id"] == 100
+        assert call_kwargs["service_id"] == 42
+        assert call_kwargs["action_type"] == "approved"
+        assert call_kwargs["actor"] == "user123"
 
 
 @pytest.mark.integration
@@ -865,12 +740,10 @@ class TestV2PlaybookExecute:
 
     @patch("Medic.Core.rate_limit_middleware.verify_rate_limit")
     def test_execute_playbook_success_no_approval(
-        self, mock_rate, app, mock_env_vars
+        self, mock_rate, client, mock_env_vars
     ):
         """Test successful playbook execution without approval required."""
         mock_rate.return_value = None  # Not rate limited
-        client = app.test_client()
-
         with patch("Medic.Core.playbook_engine.get_playbook_by_id") as mock_get:
             from Medic.Core.playbook_parser import (
                 ApprovalMode,
@@ -902,7 +775,7 @@ class TestV2PlaybookExecute:
 
                 response = client.post(
                     "/v2/playbooks/1/execute",
-                    data=json.dumps({}),
+                    data=_EMPTY_BODY,
                     content_type="application/json"
                 )
 
@@ -916,12 +789,10 @@ class TestV2PlaybookExecute:
 
     @patch("Medic.Core.rate_limit_middleware.verify_rate_limit")
     def test_execute_playbook_with_service_id(
-        self, mock_rate, app, mock_env_vars
+        self, mock_rate, client, mock_env_vars
     ):
         """Test playbook execution with service_id parameter."""
         mock_rate.return_value = None  # Not rate limited
-        client = app.test_client()
-
         with patch("Medic.Core.playbook_engine.get_playbook_by_id") as mock_get:
             from Medic.Core.playbook_parser import (
                 ApprovalMode,
@@ -938,10 +809,7 @@ class TestV2PlaybookExecute:
 
             with patch("Medic.Core.routes.db.query_db") as mock_query:
                 # Service exists
-                mock_query.return_value = json.dumps([{
-                    "service_id": 42,
-                    "heartbeat_name": "test-service"
-                }])
+                mock_query.return_value = _TEST_SERVICE_ROWS
 
                 with patch(
                     "Medic.Core.playbook_engine.start_playbook_execution"
@@ -972,12 +840,10 @@ class TestV2PlaybookExecute:
 
     @patch("Medic.Core.rate_limit_middleware.verify_rate_limit")
     def test_execute_playbook_with_variables(
-        self, mock_rate, app, mock_env_vars
+        self, mock_rate, client, mock_env_vars
     ):
         """Test playbook execution with custom variables."""
         mock_rate.return_value = None  # Not rate limited
-        client = app.test_client()
-
         with patch("Medic.Core.playbook_engine.get_playbook_by_id") as mock_get:
             from Medic.Core.playbook_parser import (
                 ApprovalMode,
@@ -1029,12 +895,10 @@ class TestV2PlaybookExecute:
 
     @patch("Medic.Core.rate_limit_middleware.verify_rate_limit")
     def test_execute_playbook_pending_approval(
-        self, mock_rate, app, mock_env_vars
+        self, mock_rate, client, mock_env_vars
     ):
         """Test playbook execution that requires approval."""
         mock_rate.return_value = None  # Not rate limited
-        client = app.test_client()
-
         with patch("Medic.Core.playbook_engine.get_playbook_by_id") as mock_get:
             from Medic.Core.playbook_parser import (
                 ApprovalMode,
@@ -1066,7 +930,7 @@ class TestV2PlaybookExecute:
 
                 response = client.post(
                     "/v2/playbooks/1/execute",
-                    data=json.dumps({}),
+                    data=_EMPTY_BODY,
                     content_type="application/json"
                 )
 
@@ -1077,17 +941,15 @@ class TestV2PlaybookExecute:
                 assert "approval" in data["results"]["message"].lower()
 
     @patch("Medic.Core.rate_limit_middleware.verify_rate_limit")
-    def test_execute_playbook_not_found(self, mock_rate, app, mock_env_vars):
+    def test_execute_playbook_not_found(self, mock_rate, client, mock_env_vars):
         """Test playbook execution when playbook doesn't exist."""
         mock_rate.return_value = None  # Not rate limited
-        client = app.test_client()
-
         with patch("Medic.Core.playbook_engine.get_playbook_by_id") as mock_get:
             mock_get.return_value = None
 
             response = client.post(
                 "/v2/playbooks/999/execute",
-                data=json.dumps({}),
+                data=_EMPTY_BODY,
                 content_type="application/json"
             )
 
@@ -1098,12 +960,10 @@ class TestV2PlaybookExecute:
 
     @patch("Medic.Core.rate_limit_middleware.verify_rate_limit")
     def test_execute_playbook_service_not_found(
-        self, mock_rate, app, mock_env_vars
+        self, mock_rate, client, mock_env_vars
     ):
         """Test playbook execution when service_id doesn't exist."""
         mock_rate.return_value = None  # Not rate limited
-        client = app.test_client()
-
         with patch("Medic.Core.playbook_engine.get_playbook_by_id") as mock_get:
             from Medic.Core.playbook_parser import (
                 ApprovalMode,
@@ -1135,12 +995,10 @@ class TestV2PlaybookExecute:
 
     @patch("Medic.Core.rate_limit_middleware.verify_rate_limit")
     def test_execute_playbook_invalid_service_id(
-        self, mock_rate, app, mock_env_vars
+        self, mock_rate, client, mock_env_vars
     ):
         """Test playbook execution with invalid service_id type."""
         mock_rate.return_value = None  # Not rate limited
-        client = app.test_client()
-
         with patch("Medic.Core.playbook_engine.get_playbook_by_id") as mock_get:
             from Medic.Core.playbook_parser import (
                 ApprovalMode,
@@ -1168,12 +1026,10 @@ class TestV2PlaybookExecute:
 
     @patch("Medic.Core.rate_limit_middleware.verify_rate_limit")
     def test_execute_playbook_invalid_variables(
-        self, mock_rate, app, mock_env_vars
+        self, mock_rate, client, mock_env_vars
     ):
         """Test playbook execution with invalid variables type."""
         mock_rate.return_value = None  # Not rate limited
-        client = app.test_client()
-
         with patch("Medic.Core.playbook_engine.get_playbook_by_id") as mock_get:
             from Medic.Core.playbook_parser import (
                 ApprovalMode,
@@ -1200,11 +1056,9 @@ class TestV2PlaybookExecute:
             assert "dictionary" in data["message"].lower()
 
     @patch("Medic.Core.rate_limit_middleware.verify_rate_limit")
-    def test_execute_playbook_invalid_json(self, mock_rate, app, mock_env_vars):
+    def test_execute_playbook_invalid_json(self, mock_rate, client, mock_env_vars):
         """Test playbook execution with invalid JSON body."""
         mock_rate.return_value = None  # Not rate limited
-        client = app.test_client()
-
         with patch("Medic.Core.playbook_engine.get_playbook_by_id") as mock_get:
             from Medic.Core.playbook_parser import (
                 ApprovalMode,
@@ -1232,12 +1086,10 @@ class TestV2PlaybookExecute:
 
     @patch("Medic.Core.rate_limit_middleware.verify_rate_limit")
     def test_execute_playbook_execution_failure(
-        self, mock_rate, app, mock_env_vars
+        self, mock_rate, client, mock_env_vars
     ):
         """Test playbook execution when start fails."""
         mock_rate.return_value = None  # Not rate limited
-        client = app.test_client()
-
         with patch("Medic.Core.playbook_engine.get_playbook_by_id") as mock_get:
             from Medic.Core.playbook_parser import (
                 ApprovalMode,
@@ -1259,7 +1111,7 @@ class TestV2PlaybookExecute:
 
                 response = client.post(
                     "/v2/playbooks/1/execute",
-                    data=json.dumps({}),
+                    data=_EMPTY_BODY,
                     content_type="application/json"
                 )
 
@@ -1269,11 +1121,9 @@ class TestV2PlaybookExecute:
                 assert "Failed to start" in data["message"]
 
     @patch("Medic.Core.rate_limit_middleware.verify_rate_limit")
-    def test_execute_playbook_empty_body(self, mock_rate, app, mock_env_vars):
+    def test_execute_playbook_empty_body(self, mock_rate, client, mock_env_vars):
         """Test playbook execution with empty request body."""
         mock_rate.return_value = None  # Not rate limited
-        client = app.test_client()
-
         with patch("Medic.Core.playbook_engine.get_playbook_by_id") as mock_get:
             from Medic.Core.playbook_parser import (
                 ApprovalMode,
@@ -1315,12 +1165,10 @@ class TestV2PlaybookExecute:
 
     @patch("Medic.Core.rate_limit_middleware.verify_rate_limit")
     def test_execute_playbook_string_service_id_conversion(
-        self, mock_rate, app, mock_env_vars
+        self, mock_rate, client, mock_env_vars
     ):
         """Test playbook execution with string service_id that converts."""
         mock_rate.return_value = None  # Not rate limited
-        client = app.test_client()
-
         with patch("Medic.Core.playbook_engine.get_playbook_by_id") as mock_get:
             from Medic.Core.playbook_parser import (
                 ApprovalMode,
@@ -1337,10 +1185,7 @@ class TestV2PlaybookExecute:
 
             with patch("Medic.Core.routes.db.query_db") as mock_query:
                 # Service exists
-                mock_query.return_value = json.dumps([{
-                    "service_id": 42,
-                    "heartbeat_name": "test-service"
-                }])
+                mock_query.return_value = _TEST_SERVICE_ROWS
 
                 with patch(
                     "Medic.Core.playbook_engine.start_playbook_execution"
@@ -1375,11 +1220,9 @@ class TestWebhookTriggerPlaybook:
 
     @patch("Medic.Core.rate_limit_middleware.verify_rate_limit")
     @patch.dict(os.environ, {"MEDIC_WEBHOOK_SECRET": "test-webhook-secret"})
-    def test_webhook_trigger_playbook_success(self, mock_rate, app, mock_env_vars):
+    def test_webhook_trigger_playbook_success(self, mock_rate, client, mock_env_vars):
         """Test successful playbook execution via webhook."""
         mock_rate.return_value = None  # Not rate limited
-        client = app.test_client()
-
         with patch("Medic.Core.playbook_engine.get_playbook_by_id") as mock_get:
             from Medic.Core.playbook_parser import (
                 ApprovalMode,
@@ -1411,7 +1254,7 @@ class TestWebhookTriggerPlaybook:
 
                 response = client.post(
                     "/v2/webhooks/playbooks/1/trigger",
-                    data=json.dumps({}),
+                    data=_EMPTY_BODY,
                     content_type="application/json",
                     headers={"X-Webhook-Secret": "test-webhook-secret"}
                 )
@@ -1427,15 +1270,13 @@ class TestWebhookTriggerPlaybook:
     @patch("Medic.Core.rate_limit_middleware.verify_rate_limit")
     @patch.dict(os.environ, {"MEDIC_WEBHOOK_SECRET": "test-webhook-secret"})
     def test_webhook_trigger_missing_secret_header(
-        self, mock_rate, app, mock_env_vars
+        self, mock_rate, client, mock_env_vars
     ):
         """Test webhook trigger without X-Webhook-Secret header."""
         mock_rate.return_value = None
-        client = app.test_client()
-
         response = client.post(
             "/v2/webhooks/playbooks/1/trigger",
-            data=json.dumps({}),
+            data=_EMPTY_BODY,
             content_type="application/json"
             # No X-Webhook-Secret header
         )
@@ -1447,14 +1288,12 @@ class TestWebhookTriggerPlaybook:
 
     @patch("Medic.Core.rate_limit_middleware.verify_rate_limit")
     @patch.dict(os.environ, {"MEDIC_WEBHOOK_SECRET": "test-webhook-secret"})
-    def test_webhook_trigger_invalid_secret(self, mock_rate, app, mock_env_vars):
+    def test_webhook_trigger_invalid_secret(self, mock_rate, client, mock_env_vars):
         """Test webhook trigger with invalid secret."""
         mock_rate.return_value = None
-        client = app.test_client()
-
         response = client.post(
             "/v2/webhooks/playbooks/1/trigger",
-            data=json.dumps({}),
+            data=_EMPTY_BODY,
             content_type="application/json",
             headers={"X-Webhook-Secret": "wrong-secret"}
         )
@@ -1465,11 +1304,11 @@ class TestWebhookTriggerPlaybook:
         assert "Invalid webhook secret" in data["message"]
 
     @patch("Medic.Core.rate_limit_middleware.verify_rate_limit")
-    def test_webhook_trigger_no_secret_configured(self, mock_rate, app, mock_env_vars):
+    def test_webhook_trigger_no_secret_configured(
+        self, mock_rate, client, mock_env_vars
+    ):
         """Test webhook trigger when MEDIC_WEBHOOK_SECRET not configured."""
         mock_rate.return_value = None
-        client = app.test_client()
-
         # Ensure the env var is not set
         with patch.dict(os.environ, {}, clear=False):
             # Remove the key if it exists
@@ -1478,7 +1317,7 @@ class TestWebhookTriggerPlaybook:
 
             response = client.post(
                 "/v2/webhooks/playbooks/1/trigger",
-                data=json.dumps({}),
+                data=_EMPTY_BODY,
                 content_type="application/json",
                 headers={"X-Webhook-Secret": "some-secret"}
             )
@@ -1490,17 +1329,15 @@ class TestWebhookTriggerPlaybook:
 
     @patch("Medic.Core.rate_limit_middleware.verify_rate_limit")
     @patch.dict(os.environ, {"MEDIC_WEBHOOK_SECRET": "test-webhook-secret"})
-    def test_webhook_trigger_playbook_not_found(self, mock_rate, app, mock_env_vars):
+    def test_webhook_trigger_playbook_not_found(self, mock_rate, client, mock_env_vars):
         """Test webhook trigger with non-existent playbook."""
         mock_rate.return_value = None
-        client = app.test_client()
-
         with patch("Medic.Core.playbook_engine.get_playbook_by_id") as mock_get:
             mock_get.return_value = None
 
             response = client.post(
                 "/v2/webhooks/playbooks/999/trigger",
-                data=json.dumps({}),
+                data=_EMPTY_BODY,
                 content_type="application/json",
                 headers={"X-Webhook-Secret": "test-webhook-secret"}
             )
@@ -1512,11 +1349,9 @@ class TestWebhookTriggerPlaybook:
 
     @patch("Medic.Core.rate_limit_middleware.verify_rate_limit")
     @patch.dict(os.environ, {"MEDIC_WEBHOOK_SECRET": "test-webhook-secret"})
-    def test_webhook_trigger_with_service_id(self, mock_rate, app, mock_env_vars):
+    def test_webhook_trigger_with_service_id(self, mock_rate, client, mock_env_vars):
         """Test webhook trigger with service_id in body."""
         mock_rate.return_value = None
-        client = app.test_client()
-
         with patch("Medic.Core.playbook_engine.get_playbook_by_id") as mock_get:
             from Medic.Core.playbook_parser import (
                 ApprovalMode,
@@ -1532,10 +1367,7 @@ class TestWebhookTriggerPlaybook:
             mock_get.return_value = mock_playbook
 
             with patch("Medic.Core.routes.db.query_db") as mock_query:
-                mock_query.return_value = json.dumps([{
-                    "service_id": 42,
-                    "heartbeat_name": "test-service"
-                }])
+                mock_query.return_value = _TEST_SERVICE_ROWS
 
                 with patch(
                     "Medic.Core.playbook_engine.start_playbook_execution"
@@ -1566,11 +1398,9 @@ class TestWebhookTriggerPlaybook:
 
     @patch("Medic.Core.rate_limit_middleware.verify_rate_limit")
     @patch.dict(os.environ, {"MEDIC_WEBHOOK_SECRET": "test-webhook-secret"})
-    def test_webhook_trigger_with_variables(self, mock_rate, app, mock_env_vars):
+    def test_webhook_trigger_with_variables(self, mock_rate, client, mock_env_vars):
         """Test webhook trigger with variables in body."""
         mock_rate.return_value = None
-        client = app.test_client()
-
         with patch("Medic.Core.playbook_engine.get_playbook_by_id") as mock_get:
             from Medic.Core.playbook_parser import (
                 ApprovalMode,
@@ -1621,11 +1451,9 @@ class TestWebhookTriggerPlaybook:
 
     @patch("Medic.Core.rate_limit_middleware.verify_rate_limit")
     @patch.dict(os.environ, {"MEDIC_WEBHOOK_SECRET": "test-webhook-secret"})
-    def test_webhook_trigger_pending_approval(self, mock_rate, app, mock_env_vars):
+    def test_webhook_trigger_pending_approval(self, mock_rate, client, mock_env_vars):
         """Test webhook trigger with playbook requiring approval."""
         mock_rate.return_value = None
-        client = app.test_client()
-
         with patch("Medic.Core.playbook_engine.get_playbook_by_id") as mock_get:
             from Medic.Core.playbook_parser import (
                 ApprovalMode,
@@ -1657,7 +1485,7 @@ class TestWebhookTriggerPlaybook:
 
                 response = client.post(
                     "/v2/webhooks/playbooks/1/trigger",
-                    data=json.dumps({}),
+                    data=_EMPTY_BODY,
                     content_type="application/json",
                     headers={"X-Webhook-Secret": "test-webhook-secret"}
                 )
@@ -1670,11 +1498,9 @@ class TestWebhookTriggerPlaybook:
 
     @patch("Medic.Core.rate_limit_middleware.verify_rate_limit")
     @patch.dict(os.environ, {"MEDIC_WEBHOOK_SECRET": "test-webhook-secret"})
-    def test_webhook_trigger_service_not_found(self, mock_rate, app, mock_env_vars):
+    def test_webhook_trigger_service_not_found(self, mock_rate, client, mock_env_vars):
         """Test webhook trigger with non-existent service_id."""
         mock_rate.return_value = None
-        client = app.test_client()
-
         with patch("Medic.Core.playbook_engine.get_playbook_by_id") as mock_get:
             from Medic.Core.playbook_parser import (
                 ApprovalMode,
@@ -1706,11 +1532,9 @@ class TestWebhookTriggerPlaybook:
 
     @patch("Medic.Core.rate_limit_middleware.verify_rate_limit")
     @patch.dict(os.environ, {"MEDIC_WEBHOOK_SECRET": "test-webhook-secret"})
-    def test_webhook_trigger_invalid_json(self, mock_rate, app, mock_env_vars):
+    def test_webhook_trigger_invalid_json(self, mock_rate, client, mock_env_vars):
         """Test webhook trigger with invalid JSON body."""
         mock_rate.return_value = None
-        client = app.test_client()
-
         with patch("Medic.Core.playbook_engine.get_playbook_by_id") as mock_get:
             from Medic.Core.playbook_parser import (
                 ApprovalMode,
@@ -1739,11 +1563,9 @@ class TestWebhookTriggerPlaybook:
 
     @patch("Medic.Core.rate_limit_middleware.verify_rate_limit")
     @patch.dict(os.environ, {"MEDIC_WEBHOOK_SECRET": "test-webhook-secret"})
-    def test_webhook_trigger_invalid_service_id(self, mock_rate, app, mock_env_vars):
+    def test_webhook_trigger_invalid_service_id(self, mock_rate, client, mock_env_vars):
         """Test webhook trigger with non-integer service_id."""
         mock_rate.return_value = None
-        client = app.test_client()
-
         with patch("Medic.Core.playbook_engine.get_playbook_by_id") as mock_get:
             from Medic.Core.playbook_parser import (
                 ApprovalMode,
@@ -1772,11 +1594,9 @@ class TestWebhookTriggerPlaybook:
 
     @patch("Medic.Core.rate_limit_middleware.verify_rate_limit")
     @patch.dict(os.environ, {"MEDIC_WEBHOOK_SECRET": "test-webhook-secret"})
-    def test_webhook_trigger_execution_failure(self, mock_rate, app, mock_env_vars):
+    def test_webhook_trigger_execution_failure(self, mock_rate, client, mock_env_vars):
         """Test webhook trigger when execution fails to start."""
         mock_rate.return_value = None
-        client = app.test_client()
-
         with patch("Medic.Core.playbook_engine.get_playbook_by_id") as mock_get:
             from Medic.Core.playbook_parser import (
                 ApprovalMode,
@@ -1798,7 +1618,7 @@ class TestWebhookTriggerPlaybook:
 
                 response = client.post(
                     "/v2/webhooks/playbooks/1/trigger",
-                    data=json.dumps({}),
+                    data=_EMPTY_BODY,
                     content_type="application/json",
                     headers={"X-Webhook-Secret": "test-webhook-secret"}
                 )
@@ -1809,10 +1629,8 @@ class TestWebhookTriggerPlaybook:
                 assert "Failed to start" in data["message"]
 
     @patch.dict(os.environ, {"MEDIC_WEBHOOK_SECRET": "test-webhook-secret"})
-    def test_webhook_trigger_rate_limited(self, app, mock_env_vars):
+    def test_webhook_trigger_rate_limited(self, client, mock_env_vars):
         """Test webhook trigger when rate limited."""
-        client = app.test_client()
-
         with patch(
             "Medic.Core.rate_limit_middleware.verify_rate_limit"
         ) as mock_rate:
@@ -1829,7 +1647,7 @@ class TestWebhookTriggerPlaybook:
 
             response = client.post(
                 "/v2/webhooks/playbooks/1/trigger",
-                data=json.dumps({}),
+                data=_EMPTY_BODY,
                 content_type="application/json",
                 headers={"X-Webhook-Secret": "test-webhook-secret"}
             )
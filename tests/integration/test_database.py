@@ -1,6 +1,7 @@
 """Integration tests for database operations with real PostgreSQL."""
 import pytest
 import os
+from datetime import datetime, timezone
 from unittest.mock import patch
 
 
@@ -21,7 +22,7 @@ class TestRealDatabaseIntegration:
     """
 
     @pytest.fixture(autouse=True)
-    def setup_test_db(self):
+    def setup_test_db(self, monkeypatch):
         """Set up test database connection."""
         # Parse TEST_DATABASE_URL and set individual env vars
         db_url = os.environ.get("TEST_DATABASE_URL", "")
@@ -33,10 +34,10 @@ class TestRealDatabaseIntegration:
                 host_db = parts[1].split("/")
                 host_port = host_db[0].split(":")
 
-                os.environ["PG_USER"] = user_pass[0]
-                os.environ["PG_PASS"] = user_pass[1] if len(user_pass) > 1 else ""
-                os.environ["DB_HOST"] = host_port[0]
-                os.environ["DB_NAME"] = host_db[1] if len(host_db) > 1 else "medic_test"
+                monkeypatch.setenv("PG_USER", user_pass[0])
+                monkeypatch.setenv("PG_PASS", user_pass[1] if len(user_pass) > 1 else "")
+                monkeypatch.setenv("DB_HOST", host_port[0])
+                monkeypatch.setenv("DB_NAME", host_db[1] if len(host_db) > 1 else "medic_test")
 
         yield
 
@@ -78,6 +79,75 @@ class TestRealDatabaseIntegration:
         # Cleanup
         insert_db("DROP TABLE IF EXISTS test_table")
 
+    @patch("Medic.Worker.monitor.PLAYBOOK_TRIGGERS_AVAILABLE", False)
+    @patch("Medic.Worker.monitor.slack")
+    @patch("Medic.Worker.monitor.pagerduty")
+    def test_mute_expires_at_auto_unmute_boundary(self, mock_pd, mock_slack):
+        """Test a mute lapses only once its alert is AUTO_UNMUTE_HOURS old."""
+        from Medic.Core.database import connect_db
+        from Medic.Worker.monitor import AUTO_UNMUTE_HOURS, sendAlert
+
+        conn = connect_db()
+        try:
+            cur = conn.cursor()
+            # The session time zone the worker runs with when none is configured
+            cur.execute("SET TIME ZONE 'UTC'")
+            # Temporary tables shadow the real ones for this session only
+            cur.execute("""
+                CREATE TEMP TABLE services (
+                    service_id integer PRIMARY KEY,
+                    muted integer,
+                    date_muted timestamptz,
+                    down integer
+                )
+            """)
+            cur.execute("""
+                CREATE TEMP TABLE alerts (
+                    alert_id serial PRIMARY KEY,
+                    alert_name text,
+                    service_id integer,
+                    active integer,
+                    alert_cycle integer,
+                    created_date timestamptz,
+                    closed_date timestamptz,
+                    external_reference_id text,
+                    next_notify_at timestamptz
+                )
+            """)
+            # Every service was muted long ago
+            cur.execute(
+                "INSERT INTO services "
+                "SELECT id, 1, NOW() - INTERVAL '30 days', 0 FROM generate_series(1, 3) id"
+            )
+            # Service 1's alert is a minute short of the window, service 2's a
+            # minute past it; service 3 has no active alert yet
+            cur.execute(
+                "INSERT INTO alerts (alert_name, service_id, active, alert_cycle, "
+                "created_date) VALUES "
+                "('hb-1', 1, 1, 5, NOW() - make_interval(hours => %s, mins => -1)), "
+                "('hb-2', 2, 1, 5, NOW() - make_interval(hours => %s, mins => 1))",
+                (AUTO_UNMUTE_HOURS, AUTO_UNMUTE_HOURS),
+            )
+
+            for service_id in (1, 2, 3):
+                sendAlert(
+                    service_id, "test-service", f"hb-{service_id}",
+                    "2024-01-01 00:00:00", 5, "platform", "p2", 1,
+                    datetime.now(timezone.utc), conn=conn,
+                )
+
+            cur.execute("SELECT service_id, muted FROM services ORDER BY service_id")
+            assert cur.fetchall() == [(1, 1), (2, 0), (3, 1)]
+            # The new alert is stamped with the real time, not local wall time
+            cur.execute(
+                "SELECT EXTRACT(EPOCH FROM NOW() - created_date) FROM alerts "
+                "WHERE service_id = 3"
+            )
+            assert abs(cur.fetchone()[0]) < 60
+        finally:
+            conn.rollback()
+            conn.close()
+
 
 @pytest.mark.integration
 class TestMockedDatabaseIntegration:
@@ -3,6 +3,8 @@ from datetime import datetime, timezone
 import pytest
 from unittest.mock import patch, MagicMock
 
+pytestmark = pytest.mark.usefixtures("inline_notifications", "inline_service_checks")
+
 
 @pytest.mark.integration
 class TestWorkerIntegration:
@@ -13,7 +15,7 @@ class TestWorkerIntegration:
     @patch("Medic.Worker.monitor.connect_db")
     def test_monitoring_loop_healthy_service(self, mock_connect, mock_pd, mock_slack, mock_env_vars):
         """Test monitoring loop with healthy services."""
-        from Medic.Worker.monitor import queryForNoHeartbeat
+        from Medic.Worker.monitor import Service, queryForNoHeartbeat
 
         # Mock database connection
         mock_conn = MagicMock()
@@ -36,12 +38,13 @@ class TestWorkerIntegration:
 
         with patch("Medic.Worker.monitor.query_db") as mock_query:
             # Service is healthy - has enough heartbeats
-            # Note: The second tuple element must be a datetime object for .astimezone() call
+            # Note: last_heartbeat_time must be a datetime object for .astimezone() call
             mock_query.side_effect = [
-                [{"service_id": 1, "heartbeat_name": "test-hb", "service_name": "test-service",
-                  "active": 1, "alert_interval": 5, "threshold": 1, "team": "platform",
-                  "priority": "p2", "muted": 0, "down": 0}],
-                [(datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc), 2)]  # Has heartbeats
+                [Service(service_id=1, heartbeat_name="test-hb", service_name="test-service",
+                  alert_interval=5, threshold=1, team="platform",
+                  priority="p2", muted=0, down=0, runbook=None, grace_period_seconds=0,
+                  last_heartbeat_time=datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc),
+                  recent_count=2)],  # Has heartbeats
             ]
 
             queryForNoHeartbeat()
@@ -54,7 +57,7 @@ class TestWorkerIntegration:
     @patch("Medic.Worker.monitor.connect_db")
     def test_monitoring_loop_unhealthy_service(self, mock_connect, mock_pd, mock_slack, mock_env_vars):
         """Test monitoring loop detecting unhealthy service."""
-        from Medic.Worker.monitor import queryForNoHeartbeat
+        from Medic.Worker.monitor import Service, queryForNoHeartbeat
 
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
@@ -64,12 +67,13 @@ class TestWorkerIntegration:
         with patch("Medic.Worker.monitor.query_db") as mock_query:
             with patch("Medic.Worker.monitor.sendAlert") as mock_send_alert:
                 # Service is unhealthy - no heartbeats
-                # Note: The first tuple element must be a datetime object for .astimezone() call
+                # Note: last_heartbeat_time must be a datetime object for .astimezone() call
                 mock_query.side_effect = [
-                    [{"service_id": 1, "heartbeat_name": "test-hb", "service_name": "test-service",
-                      "active": 1, "alert_interval": 5, "threshold": 1, "team": "platform",
-                      "priority": "p2", "muted": 0, "down": 0}],
-                    [(datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc), 0)]  # Zero heartbeats - unhealthy
+                    [Service(service_id=1, heartbeat_name="test-hb", service_name="test-service",
+                      alert_interval=5, threshold=1, team="platform",
+                      priority="p2", muted=0, down=0, runbook=None, grace_period_seconds=0,
+                      last_heartbeat_time=datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc),
+                      recent_count=0)],  # Zero heartbeats - unhealthy
                 ]
 
                 queryForNoHeartbeat()
@@ -88,7 +92,7 @@ class TestWorkerIntegration:
 
         with patch("Medic.Worker.monitor.query_db") as mock_query:
             with patch("Medic.Worker.monitor.insert_db") as mock_insert:
-                mock_query.return_value = []
+                mock_query.return_value = [(1, "inserted")]
                 mock_insert.return_value = True
 
                 # Send alert
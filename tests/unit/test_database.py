@@ -1,7 +1,11 @@
 """Unit tests for database module."""
+import json
+from datetime import datetime, timezone
 import pytest
 from unittest.mock import patch, MagicMock
 import psycopg2
+import psycopg2.errors
+import psycopg2.extras
 
 
 class TestConnectDb:
@@ -48,15 +52,16 @@ class TestQueryDb:
 
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = [(1, "test", "UP")]
-        mock_cursor.description = [("id",), ("name",), ("status",)]
+        mock_cursor.fetchall.return_value = [{"id": 1, "name": "test", "status": "UP"}]
         mock_conn.cursor.return_value = mock_cursor
         mock_connect.return_value = mock_conn
 
         result = query_db("SELECT * FROM test WHERE id = %s", (1,))
 
-        assert result is not None
-        assert "id" in result
+        assert json.loads(result) == [{"id": 1, "name": "test", "status": "UP"}]
+        mock_conn.cursor.assert_called_once_with(
+            cursor_factory=psycopg2.extras.RealDictCursor
+        )
         mock_cursor.execute.assert_called_once_with("SELECT * FROM test WHERE id = %s", (1,))
         mock_cursor.close.assert_called_once()
         mock_conn.close.assert_called_once()
@@ -76,6 +81,22 @@ class TestQueryDb:
 
         assert result == [(1, "test", "UP")]
 
+    @patch("Medic.Core.database.connect_db")
+    def test_query_db_serializes_datetimes(self, mock_connect, mock_env_vars):
+        """Test datetime values are encoded as ISO 8601 strings."""
+        from Medic.Core.database import query_db
+
+        ts = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = [{"id": 1, "time": ts}]
+        mock_conn.cursor.return_value = mock_cursor
+        mock_connect.return_value = mock_conn
+
+        result = query_db("SELECT id, time FROM test")
+
+        assert json.loads(result) == [{"id": 1, "time": ts.isoformat()}]
+
     @patch("Medic.Core.database.connect_db")
     def test_query_db_error_handling(self, mock_connect, mock_env_vars):
         """Test query error handling."""
@@ -105,6 +126,124 @@ class TestQueryDb:
         mock_conn.close.assert_called_once()
 
 
+class TestQueryDbRows:
+    """Tests for query_db_rows function."""
+
+    @patch("Medic.Core.database.connect_db")
+    def test_returns_row_dicts(self, mock_connect, mock_env_vars):
+        """Test rows are returned as plain dicts without JSON encoding."""
+        from Medic.Core.database import query_db_rows
+
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = [{"id": 1, "status": "UP"}]
+        mock_conn.cursor.return_value = mock_cursor
+        mock_connect.return_value = mock_conn
+
+        result = query_db_rows("SELECT * FROM test WHERE id = %s", (1,))
+
+        assert result == [{"id": 1, "status": "UP"}]
+        mock_conn.cursor.assert_called_once_with(
+            cursor_factory=psycopg2.extras.RealDictCursor
+        )
+        mock_cursor.execute.assert_called_once_with(
+            "SELECT * FROM test WHERE id = %s", (1,)
+        )
+        mock_cursor.close.assert_called_once()
+        mock_conn.close.assert_called_once()
+
+    @patch("Medic.Core.database.connect_db")
+    def test_returns_none_on_error(self, mock_connect, mock_env_vars):
+        """Test query errors return None."""
+        from Medic.Core.database import query_db_rows
+
+        mock_connect.side_effect = psycopg2.Error("Query failed")
+
+        assert query_db_rows("SELECT * FROM test") is None
+
+
+class TestExecutePrepared:
+    """Tests for execute_prepared server-side prepared statements."""
+
+    @staticmethod
+    def make_cursor(autocommit=False):
+        mock_conn = MagicMock()
+        mock_conn.autocommit = autocommit
+        mock_cursor = MagicMock()
+        mock_cursor.connection = mock_conn
+        return mock_cursor
+
+    def test_first_use_prepares_and_executes(self):
+        """Test PREPARE and EXECUTE are sent together on first use."""
+        from Medic.Core.database import execute_prepared
+
+        mock_cursor = self.make_cursor()
+
+        execute_prepared(
+            mock_cursor,
+            "test_stmt",
+            "SELECT * FROM test WHERE a = %s AND b = %s",
+            (1, 2),
+        )
+
+        sql, params = mock_cursor.execute.call_args[0]
+        assert sql == (
+            "SAVEPOINT medic_prepare; "
+            "PREPARE test_stmt AS SELECT * FROM test WHERE a = $1 AND b = $2; "
+            "RELEASE SAVEPOINT medic_prepare; EXECUTE test_stmt(%s, %s)"
+        )
+        assert params == (1, 2)
+
+    def test_reused_connection_only_executes(self):
+        """Test a connection that already prepared the statement skips PREPARE."""
+        from Medic.Core.database import execute_prepared
+
+        mock_cursor = self.make_cursor()
+
+        execute_prepared(mock_cursor, "test_reuse", "SELECT * FROM test WHERE a = %s", (1,))
+        execute_prepared(mock_cursor, "test_reuse", "SELECT * FROM test WHERE a = %s", (2,))
+
+        mock_cursor.execute.assert_called_with("EXECUTE test_reuse(%s)", (2,))
+
+    def test_duplicate_statement_falls_back_to_execute(self):
+        """Test an already-existing prepared statement is executed directly."""
+        from Medic.Core.database import execute_prepared
+
+        mock_cursor = self.make_cursor()
+        mock_cursor.execute.side_effect = [
+            psycopg2.errors.DuplicatePreparedStatement("exists"),
+            None,
+        ]
+
+        execute_prepared(mock_cursor, "test_dup", "SELECT 1 WHERE 1 = %s", (1,))
+
+        # Only the savepoint is rolled back, not the caller's transaction
+        mock_cursor.connection.rollback.assert_not_called()
+        mock_cursor.execute.assert_called_with(
+            "ROLLBACK TO SAVEPOINT medic_prepare; "
+            "RELEASE SAVEPOINT medic_prepare; EXECUTE test_dup(%s)",
+            (1,),
+        )
+
+    def test_autocommit_connection_skips_savepoint(self):
+        """Test autocommit connections prepare without a savepoint."""
+        from Medic.Core.database import execute_prepared
+
+        mock_cursor = self.make_cursor(autocommit=True)
+        mock_cursor.execute.side_effect = [
+            psycopg2.errors.DuplicatePreparedStatement("exists"),
+            None,
+        ]
+
+        execute_prepared(mock_cursor, "test_auto", "SELECT 1 WHERE 1 = %s", (1,))
+
+        first, second = mock_cursor.execute.call_args_list
+        assert first[0][0] == (
+            "PREPARE test_auto AS SELECT 1 WHERE 1 = $1; EXECUTE test_auto(%s)"
+        )
+        assert second[0] == ("EXECUTE test_auto(%s)", (1,))
+
+
 class TestInsertDb:
     """Tests for insert_db function."""
 
@@ -160,3 +299,54 @@ class TestInsertDb:
         call_args = mock_cursor.execute.call_args
         assert call_args[0][0] == "INSERT INTO services(name, value) VALUES (%s, %s)"
         assert call_args[0][1] == ("test'; DROP TABLE services; --", "value")
+
+
+class TestInsertDbBatch:
+    """Tests for insert_db_batch function."""
+
+    @patch("psycopg2.extras.execute_batch")
+    @patch("Medic.Core.database.connect_db")
+    def test_batch_commits_once(self, mock_connect, mock_batch, mock_env_vars):
+        """Test all parameter sets are sent through execute_batch and committed once."""
+        from Medic.Core.database import insert_db_batch
+
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_connect.return_value = mock_conn
+        rows = [(1, "a"), (2, "b")]
+
+        result = insert_db_batch("UPDATE t SET x = 1 WHERE id = %s AND k = %s", rows)
+
+        assert result is True
+        mock_batch.assert_called_once_with(
+            mock_cursor,
+            "UPDATE t SET x = 1 WHERE id = %s AND k = %s",
+            rows,
+            page_size=100,
+        )
+        mock_conn.commit.assert_called_once()
+        mock_cursor.close.assert_called_once()
+        mock_conn.close.assert_called_once()
+
+    @patch("Medic.Core.database.connect_db")
+    def test_empty_batch_skips_connection(self, mock_connect, mock_env_vars):
+        """Test an empty batch does not open a connection."""
+        from Medic.Core.database import insert_db_batch
+
+        assert insert_db_batch("UPDATE t SET x = 1 WHERE id = %s", []) is True
+        mock_connect.assert_not_called()
+
+    @patch("psycopg2.extras.execute_batch")
+    @patch("Medic.Core.database.connect_db")
+    def test_batch_failure(self, mock_connect, mock_batch, mock_env_vars):
+        """Test a failing batch returns False."""
+        from Medic.Core.database import insert_db_batch
+
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value = MagicMock()
+        mock_connect.return_value = mock_conn
+        mock_batch.side_effect = psycopg2.Error("Update failed")
+
+        assert insert_db_batch("UPDATE t SET x = 1 WHERE id = %s", [(1,)]) is False
+        mock_conn.commit.assert_not_called()
@@ -0,0 +1,206 @@
+"""Unit tests for the database cleanup job."""
+import psycopg2
+import pytest
+from datetime import date
+from unittest.mock import patch, MagicMock
+
+
+def executed_sql(cur):
+    """Return the SQL text of every statement run on a mock cursor."""
+    return [c[0][0] for c in cur.execute.call_args_list]
+
+
+class TestMonthHelpers:
+    """Tests for the month arithmetic helpers."""
+
+    @pytest.mark.parametrize(
+        "month_start,expected",
+        [
+            (date(2026, 1, 1), date(2026, 2, 1)),
+            (date(2026, 11, 1), date(2026, 12, 1)),
+            (date(2026, 12, 1), date(2027, 1, 1)),
+        ],
+    )
+    def test_next_month(self, month_start, expected):
+        """Test the following month rolls over into the next year."""
+        from Medic.Jobs.dbCleanup import _next_month
+
+        assert _next_month(month_start) == expected
+
+    def test_month_start(self):
+        """Test a day maps to the first of its month."""
+        from Medic.Jobs.dbCleanup import _month_start
+
+        assert _month_start(date(2026, 2, 28)) == date(2026, 2, 1)
+
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("heartbeatEvents_202612", date(2026, 12, 1)),
+            ("heartbeatEvents_202701", date(2027, 1, 1)),
+            ("heartbeatEvents_default", None),
+            ("heartbeatEvents_2026", None),
+            ("otherTable_202612", None),
+        ],
+    )
+    def test_partition_month(self, name, expected):
+        """Test only monthly partition names are parsed."""
+        from Medic.Jobs.dbCleanup import _partition_month
+
+        assert _partition_month(name) == expected
+
+
+class TestEnsureHeartbeatPartitions:
+    """Tests for ensure_heartbeat_partitions."""
+
+    def test_creates_current_and_next_month_across_year_end(self):
+        """Test December creates this month's and January's partitions."""
+        from Medic.Jobs.dbCleanup import ensure_heartbeat_partitions
+
+        cur = MagicMock()
+        # Neither partition exists, and there is no default partition
+        cur.fetchone.side_effect = [(False,), (False,), (False,), (False,)]
+
+        ensure_heartbeat_partitions(cur, date(2026, 12, 31))
+
+        creates = [
+            c[0] for c in cur.execute.call_args_list if "CREATE TABLE" in c[0][0]
+        ]
+        assert [sql.split('"')[1] for sql, _ in creates] == [
+            "heartbeatEvents_202612",
+            "heartbeatEvents_202701",
+        ]
+        assert [params for _, params in creates] == [
+            (date(2026, 12, 1), date(2027, 1, 1)),
+            (date(2027, 1, 1), date(2027, 2, 1)),
+        ]
+        assert not any("DETACH" in sql for sql in executed_sql(cur))
+
+    def test_existing_partitions_are_left_alone(self):
+        """Test nothing is created or detached when both partitions exist."""
+        from Medic.Jobs.dbCleanup import ensure_heartbeat_partitions
+
+        cur = MagicMock()
+        cur.fetchone.side_effect = [(True,), (True,)]
+
+        ensure_heartbeat_partitions(cur, date(2026, 10, 18))
+
+        assert all("to_regclass" in sql for sql in executed_sql(cur))
+
+    def test_rows_in_default_partition_are_moved(self):
+        """Test the default is detached, drained for the month and reattached."""
+        from Medic.Jobs.dbCleanup import ensure_heartbeat_partitions
+
+        cur = MagicMock()
+        # Current month missing with a default partition; next month exists
+        cur.fetchone.side_effect = [(False,), (True,), (True,)]
+
+        ensure_heartbeat_partitions(cur, date(2026, 10, 18))
+
+        statements = [
+            sql for sql in executed_sql(cur) if "to_regclass" not in sql
+        ]
+        assert len(statements) == 4
+        assert "DETACH PARTITION \"heartbeatEvents_default\"" in statements[0]
+        assert statements[1].startswith('CREATE TABLE "heartbeatEvents_202610"')
+        assert 'DELETE FROM "heartbeatEvents_default"' in statements[2]
+        assert 'INSERT INTO "heartbeatEvents_202610"' in statements[2]
+        assert statements[3].endswith(
+            'ATTACH PARTITION "heartbeatEvents_default" DEFAULT'
+        )
+        move_params = cur.execute.call_args_list[4][0][1]
+        assert move_params == (date(2026, 10, 1), date(2026, 11, 1))
+
+
+class TestDropExpiredPartitions:
+    """Tests for drop_expired_partitions."""
+
+    PARTITIONS = [
+        ("heartbeatEvents_202601",),
+        ("heartbeatEvents_202602",),
+        ("heartbeatEvents_202603",),
+        ("heartbeatEvents_default",),
+    ]
+
+    @pytest.mark.parametrize(
+        "cutoff,expected",
+        [
+            # February ends 2026-03-01; a day of slack puts it at 03-02
+            (date(2026, 3, 2), ["heartbeatEvents_202601", "heartbeatEvents_202602"]),
+            (date(2026, 3, 1), ["heartbeatEvents_202601"]),
+            (date(2026, 2, 1), []),
+        ],
+    )
+    def test_drops_partitions_wholly_before_cutoff(self, cutoff, expected):
+        """Test a partition is dropped only once its whole range has expired."""
+        from Medic.Jobs.dbCleanup import drop_expired_partitions
+
+        cur = MagicMock()
+        cur.fetchall.return_value = self.PARTITIONS
+
+        dropped = drop_expired_partitions(cur, cutoff)
+
+        drops = [sql for sql in executed_sql(cur) if sql.startswith("DROP TABLE")]
+        assert drops == [f'DROP TABLE IF EXISTS "{name}"' for name in expected]
+        assert dropped == len(expected)
+
+
+class TestCleanupOldHeartbeats:
+    """Tests for cleanup_old_heartbeats."""
+
+    @patch("Medic.Jobs.dbCleanup.CLEANUP_BATCH_SIZE", 2)
+    @patch("Medic.Jobs.dbCleanup.is_partitioned", return_value=False)
+    @patch("Medic.Jobs.dbCleanup.connect_db")
+    def test_deletes_in_batches_until_none_remain(
+        self, mock_connect, mock_partitioned
+    ):
+        """Test each batch is committed and the loop stops on an empty batch."""
+        from Medic.Jobs.dbCleanup import cleanup_old_heartbeats
+
+        conn = MagicMock()
+        cur = conn.cursor.return_value
+        rowcounts = iter([2, 1, 0])
+        cur.execute.side_effect = lambda *args: setattr(
+            cur, "rowcount", next(rowcounts)
+        )
+        mock_connect.return_value = conn
+
+        assert cleanup_old_heartbeats(7) == 3
+
+        assert cur.execute.call_count == 3
+        assert cur.execute.call_args[0][1] == ("7 days", 2)
+        assert conn.commit.call_count == 3
+        conn.close.assert_called_once()
+
+    @patch("Medic.Jobs.dbCleanup.drop_expired_partitions", return_value=1)
+    @patch("Medic.Jobs.dbCleanup.ensure_heartbeat_partitions")
+    @patch("Medic.Jobs.dbCleanup.is_partitioned", return_value=True)
+    @patch("Medic.Jobs.dbCleanup.connect_db")
+    def test_partitioned_table_maintains_partitions_first(
+        self, mock_connect, mock_partitioned, mock_ensure, mock_drop
+    ):
+        """Test partitions are created and dropped before the batched delete."""
+        from Medic.Jobs.dbCleanup import cleanup_old_heartbeats
+
+        conn = MagicMock()
+        conn.cursor.return_value.rowcount = 0
+        mock_connect.return_value = conn
+
+        assert cleanup_old_heartbeats(30) == 0
+
+        mock_ensure.assert_called_once()
+        today = mock_ensure.call_args[0][1]
+        assert (today - mock_drop.call_args[0][1]).days == 30
+
+    @patch("Medic.Jobs.dbCleanup.is_partitioned", return_value=False)
+    @patch("Medic.Jobs.dbCleanup.connect_db")
+    def test_database_error_returns_zero(self, mock_connect, mock_partitioned):
+        """Test a failed delete is logged, reported as zero and closes the connection."""
+        from Medic.Jobs.dbCleanup import cleanup_old_heartbeats
+
+        conn = MagicMock()
+        conn.cursor.return_value.execute.side_effect = psycopg2.Error("boom")
+        mock_connect.return_value = conn
+
+        assert cleanup_old_heartbeats(30) == 0
+        conn.close.assert_called_once()
@@ -178,12 +178,12 @@ class TestQueryHeartbeats:
         """Test querying heartbeats without time range."""
         from Medic.Helpers.heartbeat import queryHeartbeats
 
-        mock_db.query_db.return_value = "[]"
+        mock_db.query_db_rows.return_value = []
 
         result = queryHeartbeats("test-heartbeat")
 
-        mock_db.query_db.assert_called_once()
-        call_args = mock_db.query_db.call_args
+        mock_db.query_db_rows.assert_called_once()
+        call_args = mock_db.query_db_rows.call_args
         assert "%s" in call_args[0][0]
         assert call_args[0][1] == ("test-heartbeat",)
 
@@ -192,7 +192,7 @@ class TestQueryHeartbeats:
         """Test querying heartbeats with time range."""
         from Medic.Helpers.heartbeat import queryHeartbeats
 
-        mock_db.query_db.return_value = "[]"
+        mock_db.query_db_rows.return_value = []
 
         result = queryHeartbeats(
             "test-heartbeat",
@@ -200,8 +200,8 @@ class TestQueryHeartbeats:
             endtime="2024-01-02 00:00:00"
         )
 
-        mock_db.query_db.assert_called_once()
-        call_args = mock_db.query_db.call_args
+        mock_db.query_db_rows.assert_called_once()
+        call_args = mock_db.query_db_rows.call_args
         assert len(call_args[0][1]) == 3  # h_name, starttime, endtime
 
     def test_query_heartbeats_missing_start_time(self):
@@ -227,12 +227,12 @@ class TestQueryLastHeartbeat:
         """Test querying most recent heartbeat."""
         from Medic.Helpers.heartbeat import queryLastHeartbeat
 
-        mock_db.query_db.return_value = "[]"
+        mock_db.query_db_rows.return_value = []
 
         result = queryLastHeartbeat("test-heartbeat")
 
-        mock_db.query_db.assert_called_once()
-        call_args = mock_db.query_db.call_args
+        mock_db.query_db_rows.assert_called_once()
+        call_args = mock_db.query_db_rows.call_args
         assert "%s" in call_args[0][0]
         assert call_args[0][1] == ("test-heartbeat",)
 
@@ -241,11 +241,11 @@ class TestQueryLastHeartbeat:
         """Test that queryLastHeartbeat includes run_id in results."""
         from Medic.Helpers.heartbeat import queryLastHeartbeat
 
-        mock_db.query_db.return_value = "[]"
+        mock_db.query_db_rows.return_value = []
 
         queryLastHeartbeat("test-heartbeat")
 
-        call_args = mock_db.query_db.call_args
+        call_args = mock_db.query_db_rows.call_args
         # Query should include run_id column
         assert "run_id" in call_args[0][0]
 
@@ -258,12 +258,12 @@ class TestQueryHeartbeatsByRunId:
         """Test querying heartbeats by run_id."""
         from Medic.Helpers.heartbeat import queryHeartbeatsByRunId
 
-        mock_db.query_db.return_value = "[]"
+        mock_db.query_db_rows.return_value = []
 
         result = queryHeartbeatsByRunId("job-run-12345")
 
-        mock_db.query_db.assert_called_once()
-        call_args = mock_db.query_db.call_args
+        mock_db.query_db_rows.assert_called_once()
+        call_args = mock_db.query_db_rows.call_args
         assert "%s" in call_args[0][0]
         assert call_args[0][1] == ("job-run-12345",)
         # Query should filter by run_id
@@ -276,8 +276,11 @@ class TestQueryHeartbeatsByRunId:
         """Test that queryHeartbeatsByRunId returns correlated events."""
         from Medic.Helpers.heartbeat import queryHeartbeatsByRunId
 
-        mock_db.query_db.return_value = '[{"status": "STARTED"}, {"status": "COMPLETED"}]'
+        mock_db.query_db_rows.return_value = [
+            {"status": "STARTED"},
+            {"status": "COMPLETED"},
+        ]
 
         result = queryHeartbeatsByRunId("job-run-12345")
 
-        assert result == '[{"status": "STARTED"}, {"status": "COMPLETED"}]'
+        assert result == [{"status": "STARTED"}, {"status": "COMPLETED"}]
@@ -1216,3 +1216,41 @@ class TestMarkStaleRunAlerted:
         result = mark_stale_run_alerted(service_id=10, run_id="stale-run")
 
         assert result is False
+
+
+class TestMarkStaleRunsAlerted:
+    """Tests for mark_stale_runs_alerted function."""
+
+    @patch("Medic.Core.job_runs.db")
+    def test_marks_runs_in_one_batch(self, mock_db):
+        """Test all runs are updated by a single batched call."""
+        from Medic.Core.job_runs import mark_stale_runs_alerted
+
+        mock_db.insert_db_batch.return_value = True
+        runs = [(10, "run-a"), (11, "run-b")]
+
+        result = mark_stale_runs_alerted(runs)
+
+        assert result is True
+        mock_db.insert_db_batch.assert_called_once()
+        query, params = mock_db.insert_db_batch.call_args[0]
+        assert "STALE_ALERTED" in query
+        assert params == runs
+        mock_db.insert_db.assert_not_called()
+
+    @patch("Medic.Core.job_runs.db")
+    def test_empty_list_skips_database(self, mock_db):
+        """Test nothing is sent when there are no runs to mark."""
+        from Medic.Core.job_runs import mark_stale_runs_alerted
+
+        assert mark_stale_runs_alerted([]) is True
+        mock_db.insert_db_batch.assert_not_called()
+
+    @patch("Medic.Core.job_runs.db")
+    def test_failure(self, mock_db):
+        """Test failure to mark stale runs as alerted."""
+        from Medic.Core.job_runs import mark_stale_runs_alerted
+
+        mock_db.insert_db_batch.return_value = False
+
+        assert mark_stale_runs_alerted([(10, "run-a")]) is False
@@ -343,6 +343,57 @@ class TestGetMetrics:
             assert isinstance(result, bytes)
 
 
+class TestPushMetrics:
+    """Tests for push_metrics function."""
+
+    def test_pushes_default_registry(self):
+        """Should push the default registry under the worker job."""
+        from Medic.Core.metrics import REGISTRY, push_metrics
+
+        with patch("Medic.Core.metrics.push_to_gateway") as mock_push:
+            assert push_metrics("pushgw:9091") is True
+
+            mock_push.assert_called_once_with(
+                "pushgw:9091", job="medic-worker", registry=REGISTRY, timeout=3.0
+            )
+
+    def test_returns_false_on_failure(self):
+        """Should swallow push errors and report failure."""
+        from Medic.Core.metrics import push_metrics
+
+        with patch("Medic.Core.metrics.push_to_gateway") as mock_push:
+            mock_push.side_effect = OSError("connection refused")
+
+            assert push_metrics("pushgw:9091") is False
+
+
+class TestDisableRuntimeCollectors:
+    """Tests for disable_runtime_collectors function."""
+
+    def test_unregisters_runtime_collectors(self):
+        """Should unregister process, platform and GC collectors once each."""
+        from Medic.Core import metrics
+
+        with patch.object(metrics, "REGISTRY") as mock_registry:
+            metrics.disable_runtime_collectors()
+
+            unregistered = [c[0][0] for c in mock_registry.unregister.call_args_list]
+            assert unregistered == [
+                metrics.PROCESS_COLLECTOR,
+                metrics.PLATFORM_COLLECTOR,
+                metrics.GC_COLLECTOR,
+            ]
+
+    def test_tolerates_already_unregistered(self):
+        """Should not fail when the collectors are already gone."""
+        from Medic.Core import metrics
+
+        with patch.object(metrics, "REGISTRY") as mock_registry:
+            mock_registry.unregister.side_effect = KeyError("gone")
+
+            metrics.disable_runtime_collectors()
+
+
 class TestGetMetricsContentType:
     """Tests for get_metrics_content_type function."""
 
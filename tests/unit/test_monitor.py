@@ -1,8 +1,51 @@
 """Unit tests for monitor module."""
+import psycopg2.extras
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, MagicMock
 from datetime import datetime, timezone
 
+pytestmark = pytest.mark.usefixtures("inline_notifications", "inline_service_checks")
+
+
+@pytest.fixture(autouse=True)
+def reset_worker_pool():
+    """Discard the worker connection pool between tests.
+
+    psycopg2.connect is mocked so code that borrows a pooled connection
+    never reaches a real database.
+    """
+    from Medic.Worker import monitor
+
+    monitor.close_pool()
+    with patch("psycopg2.connect") as mock_connect:
+        mock_connect.return_value = MagicMock(closed=0)
+        yield
+    monitor.close_pool()
+
+
+def service_row(**overrides):
+    """Build a row of the monitor's services query."""
+    from Medic.Worker.monitor import Service
+
+    row = {
+        "service_id": 1,
+        "heartbeat_name": "test-heartbeat",
+        "service_name": "test-service",
+        "alert_interval": 5,
+        "threshold": 2,
+        "team": "platform",
+        "priority": "p2",
+        "muted": 0,
+        "down": 0,
+        "runbook": None,
+        "grace_period_seconds": None,
+        "last_heartbeat_time": None,
+        "recent_count": None,
+    }
+    row.update(overrides)
+    return Service(**row)
+
 
 class TestMonitorConnectDb:
     """Tests for monitor database connection."""
@@ -30,23 +73,90 @@ class TestMonitorConnectDb:
         with pytest.raises(ConnectionError):
             connect_db()
 
+    @patch("psycopg2.connect")
+    def test_connect_db_reuses_pool(self, mock_connect, mock_env_vars):
+        """Test connections come from one pool created on first use."""
+        from Medic.Worker.monitor import connect_db, get_pool, POOL_MIN_CONNECTIONS
+
+        mock_connect.return_value = MagicMock(closed=0)
+
+        connect_db()
+        connect_db()
+
+        assert get_pool() is get_pool()
+        assert mock_connect.call_count == POOL_MIN_CONNECTIONS
+
+    @patch("psycopg2.connect")
+    def test_release_db_returns_connection_to_pool(self, mock_connect, mock_env_vars):
+        """Test released connections are kept for reuse instead of closed."""
+        from Medic.Worker.monitor import connect_db, release_db
+
+        mock_conn = MagicMock(closed=0)
+        mock_connect.return_value = mock_conn
+
+        conn = connect_db()
+        release_db(conn)
+
+        mock_conn.close.assert_not_called()
+
+    @patch("psycopg2.connect")
+    def test_close_pool_closes_connections(self, mock_connect, mock_env_vars):
+        """Test close_pool closes pooled connections and resets the pool."""
+        from Medic.Worker import monitor
+
+        mock_conn = MagicMock(closed=0)
+        mock_connect.return_value = mock_conn
+
+        monitor.get_pool()
+        monitor.close_pool()
+
+        mock_conn.close.assert_called()
+        assert monitor._pool is None
+
+    @patch("Medic.Worker.monitor.release_db")
+    @patch("Medic.Worker.monitor.connect_db")
+    def test_borrow_returns_pooled_connection(self, mock_connect, mock_release):
+        """Test borrow hands back its pooled connection even on error."""
+        from Medic.Worker.monitor import borrow
+
+        mock_conn = MagicMock()
+        mock_connect.return_value = mock_conn
+
+        with pytest.raises(RuntimeError):
+            with borrow() as conn:
+                assert conn is mock_conn
+                raise RuntimeError("boom")
+
+        mock_release.assert_called_once_with(mock_conn)
+
+    @patch("Medic.Worker.monitor.release_db")
+    @patch("Medic.Worker.monitor.connect_db")
+    def test_borrow_leaves_given_connection(self, mock_connect, mock_release):
+        """Test a connection passed to borrow is neither taken nor released."""
+        from Medic.Worker.monitor import borrow
+
+        mock_conn = MagicMock()
+
+        with borrow(mock_conn) as conn:
+            assert conn is mock_conn
 
-class TestToJson:
-    """Tests for to_json helper function."""
+        mock_connect.assert_not_called()
+        mock_release.assert_not_called()
 
-    def test_to_json_conversion(self):
-        """Test row to JSON conversion."""
-        from Medic.Worker.monitor import to_json
+    @patch("psycopg2.connect")
+    def test_fork_child_discards_pool(self, mock_connect, mock_env_vars):
+        """Test a forked child drops the parent's pool without closing it."""
+        from Medic.Worker import monitor
 
-        rows = [(1, "test", "UP"), (2, "test2", "DOWN")]
-        columns = ["id", "name", "status"]
+        mock_conn = MagicMock(closed=0)
+        mock_connect.return_value = mock_conn
+        parent_pool = monitor.get_pool()
 
-        result = to_json(rows, columns)
+        monitor._reset_pool_after_fork()
 
-        assert len(result) == 2
-        assert result[0]["id"] == 1
-        assert result[0]["name"] == "test"
-        assert result[1]["status"] == "DOWN"
+        assert monitor._pool is None
+        mock_conn.close.assert_not_called()
+        assert monitor.get_pool() is not parent_pool
 
 
 class TestQueryDb:
@@ -59,8 +169,7 @@ class TestQueryDb:
 
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
-        mock_cursor.fetchall.return_value = [(1, "test")]
-        mock_cursor.description = [("id",), ("name",)]
+        mock_cursor.fetchall.return_value = [{"id": 1, "name": "test"}]
         mock_conn.cursor.return_value = mock_cursor
         mock_connect.return_value = mock_conn
 
@@ -74,7 +183,28 @@ class TestQueryDb:
             "SELECT * FROM test WHERE id = %s",
             (1,)
         )
-        assert len(result) == 1
+        mock_conn.cursor.assert_called_once_with(
+            cursor_factory=psycopg2.extras.RealDictCursor
+        )
+        assert result == [{"id": 1, "name": "test"}]
+
+    @patch("Medic.Worker.monitor.connect_db")
+    def test_query_db_without_columns_uses_tuple_cursor(
+        self, mock_connect, mock_env_vars
+    ):
+        """Test raw rows are fetched with the default cursor."""
+        from Medic.Worker.monitor import query_db
+
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchall.return_value = [(1, "test")]
+        mock_conn.cursor.return_value = mock_cursor
+        mock_connect.return_value = mock_conn
+
+        result = query_db("SELECT 1", show_columns=False)
+
+        mock_conn.cursor.assert_called_once_with(cursor_factory=None)
+        assert result == [(1, "test")]
 
     @patch("Medic.Worker.monitor.connect_db")
     def test_query_db_closes_resources(self, mock_connect, mock_env_vars):
@@ -94,6 +224,51 @@ class TestQueryDb:
         mock_conn.close.assert_called_once()
 
 
+    @patch("Medic.Worker.monitor.connect_db")
+    def test_query_db_prepared_statement(self, mock_connect, mock_env_vars):
+        """Test prepared queries are prepared once per connection."""
+        from Medic.Worker.monitor import query_db
+
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.connection = mock_conn
+        mock_cursor.fetchall.return_value = []
+        mock_conn.cursor.return_value = mock_cursor
+        mock_connect.return_value = mock_conn
+
+        query_db("SELECT 1 WHERE 1 = %s", (1,), prepare="test_worker_stmt")
+        query_db("SELECT 1 WHERE 1 = %s", (1,), prepare="test_worker_stmt")
+
+        first, second = mock_cursor.execute.call_args_list
+        assert first[0][0] == (
+            "SAVEPOINT medic_prepare; "
+            "PREPARE test_worker_stmt AS SELECT 1 WHERE 1 = $1; "
+            "RELEASE SAVEPOINT medic_prepare; EXECUTE test_worker_stmt(%s)"
+        )
+        assert second[0] == ("EXECUTE test_worker_stmt(%s)", (1,))
+
+    def test_query_db_raises_on_callers_connection(self):
+        """Test errors on a caller-owned connection are left to the caller."""
+        from Medic.Worker.monitor import query_db
+
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.execute.side_effect = psycopg2.Error("boom")
+
+        with pytest.raises(psycopg2.Error):
+            query_db("SELECT 1", conn=mock_conn)
+
+    @patch("Medic.Worker.monitor.connect_db")
+    def test_query_db_returns_none_on_pooled_error(self, mock_connect, mock_env_vars):
+        """Test errors on a pooled connection are logged and return None."""
+        from Medic.Worker.monitor import query_db
+
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.execute.side_effect = psycopg2.Error("boom")
+        mock_connect.return_value = mock_conn
+
+        assert query_db("SELECT 1") is None
+
+
 class TestInsertDb:
     """Tests for monitor insert_db function."""
 
@@ -119,6 +294,17 @@ class TestInsertDb:
         )
         mock_conn.commit.assert_called_once()
 
+    def test_insert_db_raises_on_callers_connection(self):
+        """Test a failed write on a caller-owned connection is raised."""
+        from Medic.Worker.monitor import insert_db
+
+        mock_conn = MagicMock()
+        mock_conn.cursor.return_value.execute.side_effect = psycopg2.Error("boom")
+
+        with pytest.raises(psycopg2.Error):
+            insert_db("UPDATE test SET x = 1", conn=mock_conn)
+        mock_conn.commit.assert_not_called()
+
 
 class TestSendAlert:
     """Tests for sendAlert function."""
@@ -131,7 +317,7 @@ class TestSendAlert:
         """Test sending a new alert."""
         from Medic.Worker.monitor import sendAlert
 
-        mock_query.return_value = []  # No existing alert
+        mock_query.return_value = [(1, "inserted")]  # No existing alert
         mock_insert.return_value = True
         mock_pd.create_alert.return_value = "medic-test-key"
 
@@ -148,7 +334,45 @@ class TestSendAlert:
         )
 
         mock_pd.create_alert.assert_called_once()
-        mock_slack.send_message.assert_called_once()
+        mock_slack.send_message.assert_called_once_with(
+            ":broken_heart: No heartbeat has been detected for `test-heartbeat` "
+            "for service `test-service` since 2024-01-01 00:00:00. "
+            "Alert is being routed to `platform`"
+        )
+        assert (
+            mock_pd.create_alert.call_args.kwargs["alert_message"]
+            == "Medic - Heartbeat failure for test-heartbeat"
+        )
+
+    @patch("Medic.Worker.monitor.slack")
+    @patch("Medic.Worker.monitor.insert_db")
+    @patch("Medic.Worker.monitor.query_db")
+    def test_send_alert_records_dedup_key_on_insert(
+        self, mock_query, mock_insert, mock_slack, mock_env_vars
+    ):
+        """Test a new alert stores its PagerDuty dedup key without a follow-up write."""
+        from Medic.Worker.monitor import sendAlert
+
+        mock_query.return_value = [(1, "inserted", True)]
+
+        with patch(
+            "Medic.Worker.monitor.pagerduty.create_alert"
+        ) as mock_create:
+            sendAlert(
+                service_id=1,
+                service_name="test-service",
+                heartbeat_name="test-heartbeat",
+                last_seen="2024-01-01 00:00:00",
+                interval=5,
+                team="platform",
+                priority="p2",
+                muted=0,
+                current_time="2024-01-01 00:05:00"
+            )
+
+        assert mock_query.call_args[0][1][8] == "medic-test-heartbeat"
+        mock_create.assert_called_once()
+        mock_insert.assert_not_called()
 
     @patch("Medic.Worker.monitor.slack")
     @patch("Medic.Worker.monitor.pagerduty")
@@ -158,7 +382,7 @@ class TestSendAlert:
         """Test that muted alerts don't send notifications."""
         from Medic.Worker.monitor import sendAlert
 
-        mock_query.return_value = []
+        mock_query.return_value = [(1, "inserted")]
         mock_insert.return_value = True
 
         sendAlert(
@@ -175,232 +399,514 @@ class TestSendAlert:
 
         mock_pd.create_alert.assert_not_called()
         mock_slack.send_message.assert_not_called()
+        # muted alerts are not paged, so they carry no dedup key
+        assert mock_query.call_args[0][1][8] is None
 
 
-class TestCloseAlert:
-    """Tests for closeAlert function."""
-
     @patch("Medic.Worker.monitor.slack")
     @patch("Medic.Worker.monitor.pagerduty")
     @patch("Medic.Worker.monitor.insert_db")
     @patch("Medic.Worker.monitor.query_db")
-    def test_close_alert_success(self, mock_query, mock_insert, mock_pd, mock_slack, mock_env_vars):
-        """Test closing an alert."""
-        from Medic.Worker.monitor import closeAlert
+    def test_send_alert_existing_alert_renotifies_on_interval(
+        self, mock_query, mock_insert, mock_pd, mock_slack, mock_env_vars
+    ):
+        """Test an advanced alert re-notifies when its notify time is due."""
+        from Medic.Worker.monitor import sendAlert
 
-        mock_query.return_value = [(1, "test", 1, 1, "medic-test-key", 5)]
-        mock_insert.return_value = True
+        mock_query.return_value = [(21, "updated", True)]
 
-        closeAlert(
-            heartbeat_name="test-heartbeat",
-            service_name="test-service",
+        sendAlert(
             service_id=1,
-            last_seen="2024-01-01 00:05:00",
+            service_name="test-service",
+            heartbeat_name="test-heartbeat",
+            last_seen="2024-01-01 00:00:00",
+            interval=5,
             team="platform",
+            priority="p2",
             muted=0,
-            current_time="2024-01-01 00:10:00"
+            current_time="2024-01-01 00:05:00"
         )
 
-        mock_pd.close_alert.assert_called_once_with("medic-test-key")
+        assert "next_notify_at" in mock_query.call_args[0][0]
+        assert mock_query.call_args.kwargs["commit"] is True
+        assert mock_query.call_args.kwargs["prepare"] == "medic_worker_alert_upsert"
+        mock_insert.assert_not_called()
+        mock_pd.create_alert.assert_not_called()
         mock_slack.send_message.assert_called_once()
 
     @patch("Medic.Worker.monitor.slack")
     @patch("Medic.Worker.monitor.pagerduty")
     @patch("Medic.Worker.monitor.insert_db")
     @patch("Medic.Worker.monitor.query_db")
-    def test_close_alert_no_pd_key(self, mock_query, mock_insert, mock_pd, mock_slack, mock_env_vars):
-        """Test closing alert without PagerDuty key."""
-        from Medic.Worker.monitor import closeAlert
+    def test_send_alert_existing_alert_not_due(
+        self, mock_query, mock_insert, mock_pd, mock_slack, mock_env_vars
+    ):
+        """Test an advanced alert stays quiet before its notify time."""
+        from Medic.Worker.monitor import sendAlert
 
-        mock_query.return_value = [(1, "test", 1, 1, None, 5)]
-        mock_insert.return_value = True
+        mock_query.return_value = [(20, "updated", False)]
 
-        closeAlert(
-            heartbeat_name="test-heartbeat",
-            service_name="test-service",
+        sendAlert(
             service_id=1,
-            last_seen="2024-01-01 00:05:00",
+            service_name="test-service",
+            heartbeat_name="test-heartbeat",
+            last_seen="2024-01-01 00:00:00",
+            interval=5,
             team="platform",
+            priority="p2",
             muted=0,
-            current_time="2024-01-01 00:10:00"
+            current_time="2024-01-01 00:05:00"
         )
 
-        mock_pd.close_alert.assert_not_called()
-
-
-class TestColorCode:
-    """Tests for color_code function."""
-
-    def test_color_code_mapping(self):
-        """Test priority to color mapping."""
-        from Medic.Worker.monitor import color_code
-
-        assert color_code("p1") == "#F35A00"
-        assert color_code("p2") == "#e9a820"
-        assert color_code("p3") == "#e9a820"
-        assert color_code("unknown") == "#F35A00"
-
-
-class TestMaintenanceWindowSuppression:
-    """Tests for maintenance window alert suppression."""
+        # interval is passed as seconds to both the advance and the insert
+        params = mock_query.call_args[0][1]
+        assert params[4] == 300
+        assert params[9] == 300
+        # a service that is already down is not rewritten
+        assert "services.down IS DISTINCT FROM 1" in mock_query.call_args[0][0]
+        mock_slack.send_message.assert_not_called()
 
-    @patch("Medic.Worker.monitor.get_active_maintenance_window_for_service")
-    @patch("Medic.Worker.monitor.is_service_in_maintenance")
-    @patch("Medic.Worker.monitor.MAINTENANCE_WINDOWS_AVAILABLE", True)
     @patch("Medic.Worker.monitor.slack")
     @patch("Medic.Worker.monitor.pagerduty")
     @patch("Medic.Worker.monitor.insert_db")
     @patch("Medic.Worker.monitor.query_db")
-    def test_alert_suppressed_during_maintenance(
-        self,
-        mock_query,
-        mock_insert,
-        mock_pd,
-        mock_slack,
-        mock_in_maintenance,
-        mock_get_window,
-        mock_env_vars
+    def test_send_alert_muted_existing_alert(
+        self, mock_query, mock_insert, mock_pd, mock_slack, mock_env_vars
     ):
-        """Test that alerts are suppressed when service is in maintenance."""
-        from Medic.Worker.monitor import queryForNoHeartbeat
-
-        # Mock maintenance window functions
-        mock_in_maintenance.return_value = True
-        mock_window = MagicMock()
-        mock_window.name = "Weekly DB Maintenance"
-        mock_get_window.return_value = mock_window
-
-        # Setup service data - threshold 2, but only 1 heartbeat (should alert)
-        mock_query.side_effect = [
-            # First query: services
-            [{
-                "service_id": 1,
-                "heartbeat_name": "test-heartbeat",
-                "service_name": "test-service",
-                "alert_interval": 5,
-                "threshold": 2,
-                "team": "platform",
-                "priority": "p2",
-                "muted": 0,
-                "down": 0,
-                "runbook": None
-            }],
-            # Second query: heartbeat count
-            [(datetime.now(), 1)],  # Only 1 heartbeat, below threshold
-        ]
+        """Test a muted alert is silent and its expiry is left to the upsert."""
+        from Medic.Worker.monitor import sendAlert
 
-        queryForNoHeartbeat()
+        mock_query.return_value = [(97, "updated", True)]
 
-        # Maintenance window check should have been called
-        mock_in_maintenance.assert_called_once_with(1)
+        sendAlert(
+            service_id=1,
+            service_name="test-service",
+            heartbeat_name="test-heartbeat",
+            last_seen="2024-01-01 00:00:00",
+            interval=5,
+            team="platform",
+            priority="p2",
+            muted=1,
+            current_time="2024-01-01 00:05:00"
+        )
 
-        # Alert should NOT have been sent due to maintenance
-        mock_pd.create_alert.assert_not_called()
+        assert "date_muted = CASE" in mock_query.call_args[0][0]
+        mock_insert.assert_not_called()
         mock_slack.send_message.assert_not_called()
 
-    @patch("Medic.Worker.monitor.get_active_maintenance_window_for_service")
-    @patch("Medic.Worker.monitor.is_service_in_maintenance")
-    @patch("Medic.Worker.monitor.MAINTENANCE_WINDOWS_AVAILABLE", True)
     @patch("Medic.Worker.monitor.slack")
     @patch("Medic.Worker.monitor.pagerduty")
     @patch("Medic.Worker.monitor.insert_db")
     @patch("Medic.Worker.monitor.query_db")
-    def test_alert_sent_when_not_in_maintenance(
-        self,
-        mock_query,
-        mock_insert,
-        mock_pd,
-        mock_slack,
-        mock_in_maintenance,
-        mock_get_window,
-        mock_env_vars
+    def test_send_alert_long_muted_without_active_alert_stays_muted(
+        self, mock_query, mock_insert, mock_pd, mock_slack, mock_env_vars
     ):
-        """Test that alerts are sent when service is NOT in maintenance."""
-        from Medic.Worker.monitor import queryForNoHeartbeat
-
-        # Mock maintenance window - not in maintenance
-        mock_in_maintenance.return_value = False
-
-        # Setup service data
-        mock_query.side_effect = [
-            # First query: services
-            [{
-                "service_id": 1,
-                "heartbeat_name": "test-heartbeat",
-                "service_name": "test-service",
-                "alert_interval": 5,
-                "threshold": 2,
-                "team": "platform",
-                "priority": "p2",
-                "muted": 0,
-                "down": 0,
-                "runbook": None
-            }],
-            # Second query: heartbeat count
-            [(datetime.now(), 1)],  # Only 1 heartbeat, below threshold
-            # Third query: check for existing alert
-            [],
-        ]
-        mock_insert.return_value = True
-        mock_pd.create_alert.return_value = "test-dedup-key"
+        """Test a service muted long ago is not unmuted by its first failure."""
+        from Medic.Worker.monitor import sendAlert
 
-        queryForNoHeartbeat()
+        # No active alert existed, so the upsert opened one
+        mock_query.return_value = [(1, "inserted", True)]
 
-        # Maintenance window check should have been called
-        mock_in_maintenance.assert_called_once_with(1)
+        sendAlert(
+            service_id=1,
+            service_name="test-service",
+            heartbeat_name="test-heartbeat",
+            last_seen="2024-01-01 00:00:00",
+            interval=5,
+            team="platform",
+            priority="p2",
+            muted=1,
+            current_time="2024-01-01 00:05:00"
+        )
 
-        # Alert SHOULD have been sent since not in maintenance
-        mock_pd.create_alert.assert_called_once()
-        mock_slack.send_message.assert_called_once()
+        query = mock_query.call_args[0][0]
+        # The mute only expires against an active alert's age, never
+        # against services.date_muted alone
+        assert "e.alert_id IS NOT NULL" in query
+        assert "make_interval(hours => %s)" in query
+        assert "COALESCE(s.date_muted" not in query
+        mock_insert.assert_not_called()
+        mock_pd.create_alert.assert_not_called()
+        mock_slack.send_message.assert_not_called()
 
-    @patch("Medic.Worker.monitor.MAINTENANCE_WINDOWS_AVAILABLE", False)
+    @patch("Medic.Worker.monitor.AUTO_UNMUTE_HOURS", 6)
     @patch("Medic.Worker.monitor.slack")
     @patch("Medic.Worker.monitor.pagerduty")
-    @patch("Medic.Worker.monitor.insert_db")
     @patch("Medic.Worker.monitor.query_db")
-    def test_alert_sent_when_maintenance_module_unavailable(
-        self,
-        mock_query,
-        mock_insert,
-        mock_pd,
-        mock_slack,
-        mock_env_vars
+    def test_send_alert_uses_configured_unmute_window(
+        self, mock_query, mock_pd, mock_slack, mock_env_vars
     ):
-        """Test alerts are sent when maintenance module is not available."""
-        from Medic.Worker.monitor import queryForNoHeartbeat
+        """Test the auto-unmute window is passed to the upsert."""
+        from Medic.Worker.monitor import sendAlert
 
-        # Setup service data
-        mock_query.side_effect = [
-            # First query: services
-            [{
-                "service_id": 1,
-                "heartbeat_name": "test-heartbeat",
-                "service_name": "test-service",
-                "alert_interval": 5,
-                "threshold": 2,
-                "team": "platform",
-                "priority": "p2",
-                "muted": 0,
-                "down": 0,
-                "runbook": None
-            }],
-            # Second query: heartbeat count
-            [(datetime.now(), 1)],  # Only 1 heartbeat, below threshold
-            # Third query: check for existing alert
-            [],
-        ]
-        mock_insert.return_value = True
-        mock_pd.create_alert.return_value = "test-dedup-key"
+        mock_query.return_value = [(97, "updated", True)]
 
-        queryForNoHeartbeat()
+        sendAlert(
+            service_id=1,
+            service_name="test-service",
+            heartbeat_name="test-heartbeat",
+            last_seen="2024-01-01 00:00:00",
+            interval=5,
+            team="platform",
+            priority="p2",
+            muted=1,
+            current_time="2024-01-01 00:05:00"
+        )
 
-        # Alert SHOULD have been sent since maintenance module unavailable
-        mock_pd.create_alert.assert_called_once()
-        mock_slack.send_message.assert_called_once()
+        query, params = mock_query.call_args[0]
+        assert "INTERVAL '24 hours'" not in query
+        assert params[1] == 6
 
-    @patch("Medic.Worker.monitor.get_active_maintenance_window_for_service")
-    @patch("Medic.Worker.monitor.is_service_in_maintenance")
-    @patch("Medic.Worker.monitor.MAINTENANCE_WINDOWS_AVAILABLE", True)
+    @patch("Medic.Worker.monitor.slack")
+    @patch("Medic.Worker.monitor.pagerduty")
+    @patch("Medic.Worker.monitor.insert_db")
+    @patch("Medic.Worker.monitor.query_db")
+    def test_send_alert_upsert_failure_skips_notifications(
+        self, mock_query, mock_insert, mock_pd, mock_slack, mock_env_vars
+    ):
+        """Test nothing is sent when the alert state cannot be recorded."""
+        from Medic.Worker.monitor import sendAlert
+
+        mock_query.return_value = None
+
+        sendAlert(
+            service_id=1,
+            service_name="test-service",
+            heartbeat_name="test-heartbeat",
+            last_seen="2024-01-01 00:00:00",
+            interval=5,
+            team="platform",
+            priority="p2",
+            muted=0,
+            current_time="2024-01-01 00:05:00"
+        )
+
+        mock_pd.create_alert.assert_not_called()
+        mock_slack.send_message.assert_not_called()
+
+
+class TestCloseAlert:
+    """Tests for closeAlert function."""
+
+    @patch("Medic.Worker.monitor.slack")
+    @patch("Medic.Worker.monitor.pagerduty")
+    @patch("Medic.Worker.monitor.insert_db")
+    @patch("Medic.Worker.monitor.query_db")
+    def test_close_alert_success(self, mock_query, mock_insert, mock_pd, mock_slack, mock_env_vars):
+        """Test closing an alert."""
+        from Medic.Worker.monitor import closeAlert
+
+        mock_query.return_value = [(1, "test", 1, 1, "medic-test-key", 5)]
+        mock_insert.return_value = True
+
+        closeAlert(
+            heartbeat_name="test-heartbeat",
+            service_name="test-service",
+            service_id=1,
+            last_seen="2024-01-01 00:05:00",
+            team="platform",
+            muted=0,
+            current_time="2024-01-01 00:10:00"
+        )
+
+        mock_pd.close_alert.assert_called_once_with("medic-test-key")
+        mock_slack.send_message.assert_called_once()
+
+    @patch("Medic.Worker.monitor.slack")
+    @patch("Medic.Worker.monitor.pagerduty")
+    @patch("Medic.Worker.monitor.insert_db")
+    @patch("Medic.Worker.monitor.query_db")
+    def test_close_alert_no_pd_key(self, mock_query, mock_insert, mock_pd, mock_slack, mock_env_vars):
+        """Test closing alert without PagerDuty key."""
+        from Medic.Worker.monitor import closeAlert
+
+        mock_query.return_value = [(1, "test", 1, 1, None, 5)]
+        mock_insert.return_value = True
+
+        closeAlert(
+            heartbeat_name="test-heartbeat",
+            service_name="test-service",
+            service_id=1,
+            last_seen="2024-01-01 00:05:00",
+            team="platform",
+            muted=0,
+            current_time="2024-01-01 00:10:00"
+        )
+
+        mock_pd.close_alert.assert_not_called()
+
+    @patch("Medic.Worker.monitor.slack")
+    @patch("Medic.Worker.monitor.pagerduty")
+    @patch("Medic.Worker.monitor.insert_db")
+    @patch("Medic.Worker.monitor.query_db")
+    def test_close_alert_failed_write_sends_nothing(
+        self, mock_query, mock_insert, mock_pd, mock_slack, mock_env_vars
+    ):
+        """Test no recovery notice goes out when the alert could not be closed."""
+        from Medic.Worker.monitor import closeAlert
+
+        mock_query.return_value = [(1, "test", 1, 1, "pd-key", 5)]
+        mock_insert.side_effect = [True, False]
+
+        closeAlert(
+            heartbeat_name="test-heartbeat",
+            service_name="test-service",
+            service_id=1,
+            last_seen="2024-01-01 00:05:00",
+            team="platform",
+            muted=0,
+            current_time="2024-01-01 00:10:00"
+        )
+
+        assert mock_insert.call_count == 2
+        mock_slack.send_message.assert_not_called()
+        mock_pd.close_alert.assert_not_called()
+
+    @patch("Medic.Worker.monitor.slack")
+    @patch("Medic.Worker.monitor.pagerduty")
+    @patch("Medic.Worker.monitor.insert_db")
+    @patch("Medic.Worker.monitor.query_db")
+    def test_close_alert_uses_preloaded_alerts(
+        self, mock_query, mock_insert, mock_pd, mock_slack, mock_env_vars
+    ):
+        """Test one bulk load serves every service closed in a cycle."""
+        from Medic.Worker.monitor import closeAlert, _ActiveAlerts
+
+        mock_query.return_value = [
+            (7, "alert-a", 1, 1, "pd-a", 5),
+            (9, "alert-b", 2, 1, "pd-b", 3),
+        ]
+        active_alerts = _ActiveAlerts()
+
+        for service_id in (1, 2):
+            closeAlert(
+                heartbeat_name="test-heartbeat",
+                service_name="test-service",
+                service_id=service_id,
+                last_seen="2024-01-01 00:05:00",
+                team="platform",
+                muted=0,
+                current_time="2024-01-01 00:10:00",
+                active_alerts=active_alerts,
+            )
+
+        mock_query.assert_called_once()
+        assert "DISTINCT ON (service_id)" in mock_query.call_args[0][0]
+        closed = [c[0][1][1] for c in mock_insert.call_args_list if "alerts" in c[0][0]]
+        assert closed == [7, 9]
+        assert [c[0][0] for c in mock_pd.close_alert.call_args_list] == ["pd-a", "pd-b"]
+
+    @patch("Medic.Worker.monitor.slack")
+    @patch("Medic.Worker.monitor.pagerduty")
+    @patch("Medic.Worker.monitor.insert_db")
+    @patch("Medic.Worker.monitor.query_db")
+    def test_close_alert_falls_back_when_not_preloaded(
+        self, mock_query, mock_insert, mock_pd, mock_slack, mock_env_vars
+    ):
+        """Test a service missing from the preload is looked up directly."""
+        from Medic.Worker.monitor import closeAlert, _ActiveAlerts
+
+        mock_query.side_effect = [[], [(4, "late", 3, 1, "pd-late", 1)]]
+
+        closeAlert(
+            heartbeat_name="test-heartbeat",
+            service_name="test-service",
+            service_id=3,
+            last_seen="2024-01-01 00:05:00",
+            team="platform",
+            muted=0,
+            current_time="2024-01-01 00:10:00",
+            active_alerts=_ActiveAlerts(),
+        )
+
+        assert mock_query.call_count == 2
+        assert mock_query.call_args[0][1] == (3,)
+        mock_pd.close_alert.assert_called_once_with("pd-late")
+
+    @patch("Medic.Worker.monitor.query_db")
+    def test_active_alerts_load_on_callers_connection(self, mock_query):
+        """Test the preload uses the caller's connection and a failure is not cached."""
+        from Medic.Worker.monitor import _ActiveAlerts
+
+        conn = MagicMock()
+        mock_query.side_effect = [None, [(7, "alert-a", 1, 1, "pd-a", 5)]]
+        active_alerts = _ActiveAlerts()
+
+        assert active_alerts.pop(1, conn) is None
+        assert active_alerts.pop(1, conn)[0] == 7
+        assert mock_query.call_count == 2
+        assert all(c.kwargs["conn"] is conn for c in mock_query.call_args_list)
+
+
+class TestColorCode:
+    """Tests for color_code function."""
+
+    def test_color_code_mapping(self):
+        """Test priority to color mapping."""
+        from Medic.Worker.monitor import color_code
+
+        assert color_code("p1") == "#F35A00"
+        assert color_code("p2") == "#e9a820"
+        assert color_code("p3") == "#e9a820"
+        assert color_code("unknown") == "#F35A00"
+
+
+class TestMaintenanceWindowSuppression:
+    """Tests for maintenance window alert suppression."""
+
+    @patch("Medic.Worker.monitor.get_active_maintenance_windows")
+    @patch("Medic.Worker.monitor.MAINTENANCE_WINDOWS_AVAILABLE", True)
+    @patch("Medic.Worker.monitor.slack")
+    @patch("Medic.Worker.monitor.pagerduty")
+    @patch("Medic.Worker.monitor.insert_db")
+    @patch("Medic.Worker.monitor.query_db")
+    def test_alert_suppressed_during_maintenance(
+        self,
+        mock_query,
+        mock_insert,
+        mock_pd,
+        mock_slack,
+        mock_active_windows,
+        mock_env_vars
+    ):
+        """Test that alerts are suppressed when service is in maintenance."""
+        from Medic.Worker.monitor import queryForNoHeartbeat
+
+        # Mock an active maintenance window covering the service
+        mock_window = MagicMock()
+        mock_window.name = "Weekly DB Maintenance"
+        mock_window.applies_to_service.return_value = True
+        mock_active_windows.return_value = [mock_window]
+
+        # Setup service data - threshold 2, but only 1 heartbeat (should alert)
+        mock_query.side_effect = [
+            # First query: services with last heartbeat and recent count
+            [service_row(
+                service_id=1,
+                heartbeat_name="test-heartbeat",
+                service_name="test-service",
+                alert_interval=5,
+                threshold=2,
+                team="platform",
+                priority="p2",
+                muted=0,
+                down=0,
+                runbook=None,
+                last_heartbeat_time=datetime.now(),
+                recent_count=1
+            )],
+        ]
+
+        queryForNoHeartbeat()
+
+        # Maintenance windows should have been checked for the service
+        mock_active_windows.assert_called_once()
+        mock_window.applies_to_service.assert_called_once_with(1)
+
+        # Alert should NOT have been sent due to maintenance
+        mock_pd.create_alert.assert_not_called()
+        mock_slack.send_message.assert_not_called()
+
+    @patch("Medic.Worker.monitor.get_active_maintenance_windows")
+    @patch("Medic.Worker.monitor.MAINTENANCE_WINDOWS_AVAILABLE", True)
+    @patch("Medic.Worker.monitor.slack")
+    @patch("Medic.Worker.monitor.pagerduty")
+    @patch("Medic.Worker.monitor.insert_db")
+    @patch("Medic.Worker.monitor.query_db")
+    def test_alert_sent_when_not_in_maintenance(
+        self,
+        mock_query,
+        mock_insert,
+        mock_pd,
+        mock_slack,
+        mock_active_windows,
+        mock_env_vars
+    ):
+        """Test that alerts are sent when service is NOT in maintenance."""
+        from Medic.Worker.monitor import queryForNoHeartbeat
+
+        # Mock maintenance window - not in maintenance
+        mock_active_windows.return_value = []
+
+        # Setup service data
+        mock_query.side_effect = [
+            # First query: services with last heartbeat and recent count
+            [service_row(
+                service_id=1,
+                heartbeat_name="test-heartbeat",
+                service_name="test-service",
+                alert_interval=5,
+                threshold=2,
+                team="platform",
+                priority="p2",
+                muted=0,
+                down=0,
+                runbook=None,
+                last_heartbeat_time=datetime.now(),
+                recent_count=1
+            )],
+            # Second query: alert upsert opens a new alert
+            [(1, "inserted")],
+        ]
+        mock_insert.return_value = True
+        mock_pd.create_alert.return_value = "test-dedup-key"
+
+        queryForNoHeartbeat()
+
+        # Maintenance windows should have been checked
+        mock_active_windows.assert_called_once()
+
+        # Alert SHOULD have been sent since not in maintenance
+        mock_pd.create_alert.assert_called_once()
+        mock_slack.send_message.assert_called_once()
+
+    @patch("Medic.Worker.monitor.MAINTENANCE_WINDOWS_AVAILABLE", False)
+    @patch("Medic.Worker.monitor.slack")
+    @patch("Medic.Worker.monitor.pagerduty")
+    @patch("Medic.Worker.monitor.insert_db")
+    @patch("Medic.Worker.monitor.query_db")
+    def test_alert_sent_when_maintenance_module_unavailable(
+        self,
+        mock_query,
+        mock_insert,
+        mock_pd,
+        mock_slack,
+        mock_env_vars
+    ):
+        """Test alerts are sent when maintenance module is not available."""
+        from Medic.Worker.monitor import queryForNoHeartbeat
+
+        # Setup service data
+        mock_query.side_effect = [
+            # First query: services with last heartbeat and recent count
+            [service_row(
+                service_id=1,
+                heartbeat_name="test-heartbeat",
+                service_name="test-service",
+                alert_interval=5,
+                threshold=2,
+                team="platform",
+                priority="p2",
+                muted=0,
+                down=0,
+                runbook=None,
+                last_heartbeat_time=datetime.now(),
+                recent_count=1
+            )],
+            # Second query: alert upsert opens a new alert
+            [(1, "inserted")],
+        ]
+        mock_insert.return_value = True
+        mock_pd.create_alert.return_value = "test-dedup-key"
+
+        queryForNoHeartbeat()
+
+        # Alert SHOULD have been sent since maintenance module unavailable
+        mock_pd.create_alert.assert_called_once()
+        mock_slack.send_message.assert_called_once()
+
+    @patch("Medic.Worker.monitor.get_active_maintenance_windows")
+    @patch("Medic.Worker.monitor.MAINTENANCE_WINDOWS_AVAILABLE", True)
     @patch("Medic.Worker.monitor.slack")
     @patch("Medic.Worker.monitor.pagerduty")
     @patch("Medic.Worker.monitor.insert_db")
@@ -411,8 +917,7 @@ class TestMaintenanceWindowSuppression:
         mock_insert,
         mock_pd,
         mock_slack,
-        mock_in_maintenance,
-        mock_get_window,
+        mock_active_windows,
         mock_env_vars,
         caplog
     ):
@@ -420,27 +925,28 @@ class TestMaintenanceWindowSuppression:
         import logging
         from Medic.Worker.monitor import queryForNoHeartbeat
 
-        # Mock maintenance window functions
-        mock_in_maintenance.return_value = True
+        # Mock an active maintenance window covering the service
         mock_window = MagicMock()
         mock_window.name = "Database Upgrade Window"
-        mock_get_window.return_value = mock_window
+        mock_window.applies_to_service.return_value = True
+        mock_active_windows.return_value = [mock_window]
 
         # Setup service data
         mock_query.side_effect = [
-            [{
-                "service_id": 1,
-                "heartbeat_name": "test-heartbeat",
-                "service_name": "test-service",
-                "alert_interval": 5,
-                "threshold": 2,
-                "team": "platform",
-                "priority": "p2",
-                "muted": 0,
-                "down": 0,
-                "runbook": None
-            }],
-            [(datetime.now(), 1)],
+            [service_row(
+                service_id=1,
+                heartbeat_name="test-heartbeat",
+                service_name="test-service",
+                alert_interval=5,
+                threshold=2,
+                team="platform",
+                priority="p2",
+                muted=0,
+                down=0,
+                runbook=None,
+                last_heartbeat_time=datetime.now(),
+                recent_count=1
+            )],
         ]
 
         with caplog.at_level(logging.INFO):
@@ -453,8 +959,7 @@ class TestMaintenanceWindowSuppression:
             for msg in log_messages
         )
 
-    @patch("Medic.Worker.monitor.get_active_maintenance_window_for_service")
-    @patch("Medic.Worker.monitor.is_service_in_maintenance")
+    @patch("Medic.Worker.monitor.get_active_maintenance_windows")
     @patch("Medic.Worker.monitor.MAINTENANCE_WINDOWS_AVAILABLE", True)
     @patch("Medic.Worker.monitor.slack")
     @patch("Medic.Worker.monitor.pagerduty")
@@ -466,35 +971,34 @@ class TestMaintenanceWindowSuppression:
         mock_insert,
         mock_pd,
         mock_slack,
-        mock_in_maintenance,
-        mock_get_window,
+        mock_active_windows,
         mock_env_vars
     ):
         """Test that recovery alerts are sent even during maintenance."""
         from Medic.Worker.monitor import queryForNoHeartbeat
 
         # Service in maintenance but recovering (was down, now healthy)
-        mock_in_maintenance.return_value = True
         mock_window = MagicMock()
         mock_window.name = "Weekly Maintenance"
-        mock_get_window.return_value = mock_window
+        mock_window.applies_to_service.return_value = True
+        mock_active_windows.return_value = [mock_window]
 
         # Setup service data - service is down but heartbeat is healthy now
         mock_query.side_effect = [
-            [{
-                "service_id": 1,
-                "heartbeat_name": "test-heartbeat",
-                "service_name": "test-service",
-                "alert_interval": 5,
-                "threshold": 2,
-                "team": "platform",
-                "priority": "p2",
-                "muted": 0,
-                "down": 1,  # Service was down
-                "runbook": None
-            }],
-            # Heartbeat count now meets threshold
-            [(datetime.now(), 3)],  # 3 heartbeats, above threshold of 2
+            [service_row(
+                service_id=1,
+                heartbeat_name="test-heartbeat",
+                service_name="test-service",
+                alert_interval=5,
+                threshold=2,
+                team="platform",
+                priority="p2",
+                muted=0,
+                down=1,  # Service was down
+                runbook=None,
+                last_heartbeat_time=datetime.now(),
+                recent_count=3
+            )],
             # Query for active alert to close
             [(1, "test", 1, 1, "pd-key", 5)],
         ]
@@ -507,6 +1011,59 @@ class TestMaintenanceWindowSuppression:
         mock_pd.close_alert.assert_called_once_with("pd-key")
 
 
+    @patch("Medic.Worker.monitor.get_active_maintenance_windows")
+    @patch("Medic.Worker.monitor.MAINTENANCE_WINDOWS_AVAILABLE", True)
+    @patch("Medic.Worker.monitor.slack")
+    @patch("Medic.Worker.monitor.pagerduty")
+    @patch("Medic.Worker.monitor.insert_db")
+    @patch("Medic.Worker.monitor.query_db")
+    def test_maintenance_windows_loaded_once_per_cycle(
+        self,
+        mock_query,
+        mock_insert,
+        mock_pd,
+        mock_slack,
+        mock_active_windows,
+        mock_env_vars
+    ):
+        """Test active windows are loaded once for all failing services."""
+        from Medic.Worker.monitor import queryForNoHeartbeat
+
+        mock_window = MagicMock()
+        mock_window.name = "Weekly Maintenance"
+        mock_window.applies_to_service.side_effect = lambda service_id: service_id == 1
+        mock_active_windows.return_value = [mock_window]
+
+        mock_query.side_effect = [
+            [
+                service_row(
+                    service_id=service_id,
+                    heartbeat_name=f"hb-{service_id}",
+                    service_name=f"service-{service_id}",
+                    alert_interval=5,
+                    threshold=2,
+                    team="platform",
+                    priority="p2",
+                    muted=0,
+                    down=0,
+                    runbook=None,
+                    last_heartbeat_time=datetime.now(),
+                    recent_count=1
+                )
+                for service_id in (1, 2, 3)
+            ],
+            # Alert upserts for the two services outside the window
+            [(1, "inserted")],
+            [(1, "inserted")],
+        ]
+        mock_pd.create_alert.return_value = None
+
+        queryForNoHeartbeat()
+
+        mock_active_windows.assert_called_once()
+        assert mock_slack.send_message.call_count == 2
+
+
 class TestGracePeriod:
     """Tests for grace period alert delay functionality."""
 
@@ -536,22 +1093,22 @@ class TestGracePeriod:
 
         # Setup service data with 120 second grace period
         mock_query.side_effect = [
-            # First query: services
-            [{
-                "service_id": 1,
-                "heartbeat_name": "test-heartbeat",
-                "service_name": "test-service",
-                "alert_interval": 5,  # 5 minutes
-                "threshold": 2,
-                "team": "platform",
-                "priority": "p2",
-                "muted": 0,
-                "down": 0,
-                "runbook": None,
-                "grace_period_seconds": 120  # 2 minute grace period
-            }],
-            # Second query: heartbeat count - below threshold
-            [(last_hbeat_time, 1)],
+            # First query: services with last heartbeat and recent count
+            [service_row(
+                service_id=1,
+                heartbeat_name="test-heartbeat",
+                service_name="test-service",
+                alert_interval=5,  # 5 minutes
+                threshold=2,
+                team="platform",
+                priority="p2",
+                muted=0,
+                down=0,
+                runbook=None,
+                grace_period_seconds=120,  # 2 minute grace period
+                last_heartbeat_time=last_hbeat_time,
+                recent_count=1
+            )],
         ]
 
         with caplog.at_level(logging.INFO):
@@ -589,24 +1146,24 @@ class TestGracePeriod:
 
         # Setup service data with 120 second grace period
         mock_query.side_effect = [
-            # First query: services
-            [{
-                "service_id": 1,
-                "heartbeat_name": "test-heartbeat",
-                "service_name": "test-service",
-                "alert_interval": 5,  # 5 minutes
-                "threshold": 2,
-                "team": "platform",
-                "priority": "p2",
-                "muted": 0,
-                "down": 0,
-                "runbook": None,
-                "grace_period_seconds": 120  # 2 minute grace period
-            }],
-            # Second query: heartbeat count - below threshold
-            [(last_hbeat_time, 1)],
-            # Third query: check for existing alert
-            [],
+            # First query: services with last heartbeat and recent count
+            [service_row(
+                service_id=1,
+                heartbeat_name="test-heartbeat",
+                service_name="test-service",
+                alert_interval=5,  # 5 minutes
+                threshold=2,
+                team="platform",
+                priority="p2",
+                muted=0,
+                down=0,
+                runbook=None,
+                grace_period_seconds=120,  # 2 minute grace period
+                last_heartbeat_time=last_hbeat_time,
+                recent_count=1
+            )],
+            # Second query: alert upsert opens a new alert
+            [(1, "inserted")],
         ]
         mock_insert.return_value = True
         mock_pd.create_alert.return_value = "test-dedup-key"
@@ -641,24 +1198,24 @@ class TestGracePeriod:
 
         # Setup service data with no grace period
         mock_query.side_effect = [
-            # First query: services
-            [{
-                "service_id": 1,
-                "heartbeat_name": "test-heartbeat",
-                "service_name": "test-service",
-                "alert_interval": 5,  # 5 minutes
-                "threshold": 2,
-                "team": "platform",
-                "priority": "p2",
-                "muted": 0,
-                "down": 0,
-                "runbook": None,
-                "grace_period_seconds": 0  # No grace period
-            }],
-            # Second query: heartbeat count - below threshold
-            [(last_hbeat_time, 1)],
-            # Third query: check for existing alert
-            [],
+            # First query: services with last heartbeat and recent count
+            [service_row(
+                service_id=1,
+                heartbeat_name="test-heartbeat",
+                service_name="test-service",
+                alert_interval=5,  # 5 minutes
+                threshold=2,
+                team="platform",
+                priority="p2",
+                muted=0,
+                down=0,
+                runbook=None,
+                grace_period_seconds=0,  # No grace period
+                last_heartbeat_time=last_hbeat_time,
+                recent_count=1
+            )],
+            # Second query: alert upsert opens a new alert
+            [(1, "inserted")],
         ]
         mock_insert.return_value = True
         mock_pd.create_alert.return_value = "test-dedup-key"
@@ -693,24 +1250,24 @@ class TestGracePeriod:
 
         # Setup service data with grace_period_seconds not present (legacy)
         mock_query.side_effect = [
-            # First query: services
-            [{
-                "service_id": 1,
-                "heartbeat_name": "test-heartbeat",
-                "service_name": "test-service",
-                "alert_interval": 5,
-                "threshold": 2,
-                "team": "platform",
-                "priority": "p2",
-                "muted": 0,
-                "down": 0,
-                "runbook": None
+            # First query: services with last heartbeat and recent count
+            [service_row(
+                service_id=1,
+                heartbeat_name="test-heartbeat",
+                service_name="test-service",
+                alert_interval=5,
+                threshold=2,
+                team="platform",
+                priority="p2",
+                muted=0,
+                down=0,
+                runbook=None,
                 # grace_period_seconds not included (legacy data)
-            }],
-            # Second query: heartbeat count - below threshold
-            [(last_hbeat_time, 1)],
-            # Third query: check for existing alert
-            [],
+                last_heartbeat_time=last_hbeat_time,
+                recent_count=1
+            )],
+            # Second query: alert upsert opens a new alert
+            [(1, "inserted")],
         ]
         mock_insert.return_value = True
         mock_pd.create_alert.return_value = "test-dedup-key"
@@ -743,22 +1300,22 @@ class TestGracePeriod:
 
         # Setup service data with grace period
         mock_query.side_effect = [
-            # First query: services
-            [{
-                "service_id": 1,
-                "heartbeat_name": "test-heartbeat",
-                "service_name": "test-service",
-                "alert_interval": 5,  # 5 minutes
-                "threshold": 2,
-                "team": "platform",
-                "priority": "p2",
-                "muted": 0,
-                "down": 0,
-                "runbook": None,
-                "grace_period_seconds": 120
-            }],
-            # Second query: heartbeat count - naive datetime
-            [(last_hbeat_time, 1)],
+            # First query: services with last heartbeat and recent count
+            [service_row(
+                service_id=1,
+                heartbeat_name="test-heartbeat",
+                service_name="test-service",
+                alert_interval=5,  # 5 minutes
+                threshold=2,
+                team="platform",
+                priority="p2",
+                muted=0,
+                down=0,
+                runbook=None,
+                grace_period_seconds=120,
+                last_heartbeat_time=last_hbeat_time,
+                recent_count=1
+            )],
         ]
 
         # Should not raise exception due to timezone handling
@@ -792,22 +1349,22 @@ class TestGracePeriod:
 
         # Setup service data with 1 hour grace period
         mock_query.side_effect = [
-            # First query: services
-            [{
-                "service_id": 1,
-                "heartbeat_name": "test-heartbeat",
-                "service_name": "test-service",
-                "alert_interval": 5,  # 5 minutes
-                "threshold": 2,
-                "team": "platform",
-                "priority": "p2",
-                "muted": 0,
-                "down": 0,
-                "runbook": None,
-                "grace_period_seconds": 3600  # 1 hour grace period
-            }],
-            # Second query: heartbeat count - below threshold
-            [(last_hbeat_time, 1)],
+            # First query: services with last heartbeat and recent count
+            [service_row(
+                service_id=1,
+                heartbeat_name="test-heartbeat",
+                service_name="test-service",
+                alert_interval=5,  # 5 minutes
+                threshold=2,
+                team="platform",
+                priority="p2",
+                muted=0,
+                down=0,
+                runbook=None,
+                grace_period_seconds=3600,  # 1 hour grace period
+                last_heartbeat_time=last_hbeat_time,
+                recent_count=1
+            )],
         ]
 
         queryForNoHeartbeat()
@@ -816,8 +1373,7 @@ class TestGracePeriod:
         mock_pd.create_alert.assert_not_called()
         mock_slack.send_message.assert_not_called()
 
-    @patch("Medic.Worker.monitor.get_active_maintenance_window_for_service")
-    @patch("Medic.Worker.monitor.is_service_in_maintenance")
+    @patch("Medic.Worker.monitor.get_active_maintenance_windows")
     @patch("Medic.Worker.monitor.MAINTENANCE_WINDOWS_AVAILABLE", True)
     @patch("Medic.Worker.monitor.slack")
     @patch("Medic.Worker.monitor.pagerduty")
@@ -829,8 +1385,7 @@ class TestGracePeriod:
         mock_insert,
         mock_pd,
         mock_slack,
-        mock_in_maintenance,
-        mock_get_window,
+        mock_active_windows,
         mock_env_vars
     ):
         """Test that grace period is checked before maintenance window check."""
@@ -844,29 +1399,32 @@ class TestGracePeriod:
 
         # Service would be in maintenance, but grace period should prevent
         # the maintenance check from even being reached
-        mock_in_maintenance.return_value = True
+        mock_window = MagicMock()
+        mock_window.applies_to_service.return_value = True
+        mock_active_windows.return_value = [mock_window]
 
         mock_query.side_effect = [
-            [{
-                "service_id": 1,
-                "heartbeat_name": "test-heartbeat",
-                "service_name": "test-service",
-                "alert_interval": 5,
-                "threshold": 2,
-                "team": "platform",
-                "priority": "p2",
-                "muted": 0,
-                "down": 0,
-                "runbook": None,
-                "grace_period_seconds": 120
-            }],
-            [(last_hbeat_time, 1)],
+            [service_row(
+                service_id=1,
+                heartbeat_name="test-heartbeat",
+                service_name="test-service",
+                alert_interval=5,
+                threshold=2,
+                team="platform",
+                priority="p2",
+                muted=0,
+                down=0,
+                runbook=None,
+                grace_period_seconds=120,
+                last_heartbeat_time=last_hbeat_time,
+                recent_count=1
+            )],
         ]
 
         queryForNoHeartbeat()
 
         # Maintenance check should NOT be called (grace period handled first)
-        mock_in_maintenance.assert_not_called()
+        mock_active_windows.assert_not_called()
 
     @patch("Medic.Worker.monitor.MAINTENANCE_WINDOWS_AVAILABLE", False)
     @patch("Medic.Worker.monitor.slack")
@@ -891,21 +1449,21 @@ class TestGracePeriod:
 
         # Service was down but now healthy
         mock_query.side_effect = [
-            [{
-                "service_id": 1,
-                "heartbeat_name": "test-heartbeat",
-                "service_name": "test-service",
-                "alert_interval": 5,
-                "threshold": 2,
-                "team": "platform",
-                "priority": "p2",
-                "muted": 0,
-                "down": 1,  # Was down
-                "runbook": None,
-                "grace_period_seconds": 3600  # Large grace period
-            }],
-            # Heartbeat count now meets threshold
-            [(last_hbeat_time, 5)],  # Above threshold
+            [service_row(
+                service_id=1,
+                heartbeat_name="test-heartbeat",
+                service_name="test-service",
+                alert_interval=5,
+                threshold=2,
+                team="platform",
+                priority="p2",
+                muted=0,
+                down=1,  # Was down
+                runbook=None,
+                grace_period_seconds=3600,  # Large grace period
+                last_heartbeat_time=last_hbeat_time,
+                recent_count=5
+            )],
             # Query for active alert to close
             [(1, "test", 1, 1, "pd-key", 5)],
         ]
@@ -916,3 +1474,810 @@ class TestGracePeriod:
         # Recovery alert should be sent regardless of grace period
         mock_slack.send_message.assert_called_once()
         mock_pd.close_alert.assert_called_once_with("pd-key")
+
+
+class TestHeartbeatLookup:
+    """Tests for the batched service heartbeat lookup."""
+
+    @patch("Medic.Worker.monitor.MAINTENANCE_WINDOWS_AVAILABLE", False)
+    @patch("Medic.Worker.monitor.slack")
+    @patch("Medic.Worker.monitor.pagerduty")
+    @patch("Medic.Worker.monitor.insert_db")
+    @patch("Medic.Worker.monitor.query_db")
+    def test_single_query_for_all_services(
+        self,
+        mock_query,
+        mock_insert,
+        mock_pd,
+        mock_slack,
+        mock_env_vars
+    ):
+        """Test heartbeats for every service come from the services query."""
+        from Medic.Worker.monitor import queryForNoHeartbeat
+
+        mock_query.return_value = [
+            service_row(
+                service_id=service_id,
+                heartbeat_name=f"hb-{service_id}",
+                service_name=f"service-{service_id}",
+                alert_interval=5,
+                threshold=1,
+                team="platform",
+                priority="p2",
+                muted=0,
+                down=0,
+                runbook=None,
+                last_heartbeat_time=datetime.now(timezone.utc),
+                recent_count=2
+            )
+            for service_id in (1, 2, 3)
+        ]
+
+        queryForNoHeartbeat()
+
+        mock_query.assert_called_once()
+        assert "LATERAL" in mock_query.call_args[0][0]
+        mock_slack.send_message.assert_not_called()
+
+    @patch("Medic.Worker.monitor.query_db")
+    def test_cycle_query_skips_healthy_services(self, mock_query, mock_env_vars):
+        """Test only failing or down services are fetched for the cycle."""
+        from Medic.Worker.monitor import queryForNoHeartbeat
+
+        mock_query.return_value = []
+
+        queryForNoHeartbeat()
+
+        query = mock_query.call_args[0][0]
+        assert "s.down = 1" in query
+        assert "h.recent_count < s.threshold" in query
+
+    @patch("Medic.Worker.monitor.slack")
+    @patch("Medic.Worker.monitor.pagerduty")
+    @patch("Medic.Worker.monitor.insert_db")
+    @patch("Medic.Worker.monitor.query_db")
+    def test_service_without_heartbeats_notifies(
+        self,
+        mock_query,
+        mock_insert,
+        mock_pd,
+        mock_slack,
+        mock_env_vars
+    ):
+        """Test a registered service that never sent a heartbeat is reported."""
+        from Medic.Worker.monitor import queryForNoHeartbeat
+
+        mock_query.return_value = [service_row(
+            service_id=1,
+            heartbeat_name="test-heartbeat",
+            service_name="test-service",
+            alert_interval=5,
+            threshold=1,
+            team="platform",
+            priority="p2",
+            muted=0,
+            down=0,
+            runbook=None,
+            last_heartbeat_time=None,
+            recent_count=None
+        )]
+
+        queryForNoHeartbeat()
+
+        mock_slack.send_message.assert_called_once()
+        assert "has not yet sent a heartbeat" in mock_slack.send_message.call_args[0][0]
+        mock_pd.create_alert.assert_not_called()
+
+
+class TestSlackBatch:
+    """Tests for per-cycle Slack notice batching."""
+
+    @patch("Medic.Worker.monitor.slack")
+    def test_few_notices_sent_individually(self, mock_slack):
+        """Test notices below the threshold keep their own messages."""
+        from Medic.Worker.monitor import _SlackBatch
+
+        batch = _SlackBatch()
+        batch.add("first")
+        batch.add("second")
+        batch.flush()
+
+        assert [c[0][0] for c in mock_slack.send_message.call_args_list] == [
+            "first",
+            "second",
+        ]
+
+    @patch("Medic.Worker.monitor.SLACK_BATCH_MAX_NOTICES", 2)
+    @patch("Medic.Worker.monitor.slack")
+    def test_many_notices_combined_in_chunks(self, mock_slack):
+        """Test notices at the threshold are joined, a chunk per message."""
+        from Medic.Worker.monitor import _SlackBatch
+
+        batch = _SlackBatch()
+        for message in ("a", "b", "c"):
+            batch.add(message)
+        batch.flush()
+        batch.flush()
+
+        assert [c[0][0] for c in mock_slack.send_message.call_args_list] == [
+            "a\nb",
+            "c",
+        ]
+
+    @patch("Medic.Worker.monitor.MAINTENANCE_WINDOWS_AVAILABLE", False)
+    @patch("Medic.Worker.monitor.slack")
+    @patch("Medic.Worker.monitor.pagerduty")
+    @patch("Medic.Worker.monitor.insert_db")
+    @patch("Medic.Worker.monitor.query_db")
+    def test_cycle_posts_outage_as_one_message(
+        self, mock_query, mock_insert, mock_pd, mock_slack, mock_env_vars
+    ):
+        """Test a cycle with several failing services posts one Slack message."""
+        from Medic.Worker.monitor import queryForNoHeartbeat
+
+        mock_query.side_effect = [
+            [
+                service_row(
+                    service_id=service_id,
+                    heartbeat_name=f"hb-{service_id}",
+                    last_heartbeat_time=datetime.now(timezone.utc),
+                    recent_count=0,
+                )
+                for service_id in (1, 2, 3)
+            ],
+            [(1, "inserted")],
+            [(1, "inserted")],
+            [(1, "inserted")],
+        ]
+        mock_pd.create_alert.return_value = None
+
+        queryForNoHeartbeat()
+
+        mock_slack.send_message.assert_called_once()
+        message = mock_slack.send_message.call_args[0][0]
+        assert len(message.splitlines()) == 3
+        assert all(f"`hb-{service_id}`" in message for service_id in (1, 2, 3))
+
+
+class TestCycleConnection:
+    """Tests for the connections used by a monitor cycle."""
+
+    @patch("Medic.Worker.monitor.MAINTENANCE_WINDOWS_AVAILABLE", False)
+    @patch("Medic.Worker.monitor.slack")
+    @patch("Medic.Worker.monitor.pagerduty")
+    @patch("Medic.Worker.monitor.insert_db")
+    @patch("Medic.Worker.monitor.query_db")
+    @patch("Medic.Worker.monitor.release_db")
+    @patch("Medic.Worker.monitor.connect_db")
+    def test_each_service_commits_on_its_own_connection(
+        self,
+        mock_connect,
+        mock_release,
+        mock_query,
+        mock_insert,
+        mock_pd,
+        mock_slack,
+        mock_env_vars
+    ):
+        """Test every service borrows, commits and returns its own connection."""
+        from Medic.Worker.monitor import queryForNoHeartbeat
+
+        conns = [MagicMock(), MagicMock()]
+        mock_connect.side_effect = conns
+        mock_query.side_effect = [
+            [
+                service_row(
+                    service_id=service_id,
+                    heartbeat_name=f"hb-{service_id}",
+                    service_name=f"service-{service_id}",
+                    alert_interval=5,
+                    threshold=2,
+                    team="platform",
+                    priority="p2",
+                    muted=0,
+                    down=0,
+                    runbook=None,
+                    last_heartbeat_time=datetime.now(timezone.utc),
+                    recent_count=1
+                )
+                for service_id in (1, 2)
+            ],
+            # Alert upserts for each failing service
+            [(1, "inserted")],
+            [(1, "inserted")],
+        ]
+        mock_pd.create_alert.return_value = None
+
+        queryForNoHeartbeat()
+
+        # The services query borrows a pooled connection itself
+        assert "conn" not in mock_query.call_args_list[0].kwargs
+        upsert_conns = [c.kwargs["conn"] for c in mock_query.call_args_list[1:]]
+        assert upsert_conns == conns
+        assert [c[0][0] for c in mock_release.call_args_list] == conns
+        for conn in conns:
+            conn.commit.assert_called_once()
+
+    @patch("Medic.Worker.monitor.MAINTENANCE_WINDOWS_AVAILABLE", False)
+    @patch("Medic.Worker.monitor.sendAlert")
+    @patch("Medic.Worker.monitor.query_db")
+    @patch("Medic.Worker.monitor.release_db")
+    @patch("Medic.Worker.monitor.connect_db")
+    def test_failed_service_rolls_back_alone(
+        self, mock_connect, mock_release, mock_query, mock_send_alert, mock_env_vars
+    ):
+        """Test a database error for one service does not affect the next."""
+        import psycopg2
+        from Medic.Worker.monitor import queryForNoHeartbeat
+
+        conns = [MagicMock(), MagicMock()]
+        mock_connect.side_effect = conns
+        mock_query.return_value = [
+            service_row(
+                service_id=service_id,
+                last_heartbeat_time=datetime.now(timezone.utc),
+                recent_count=0,
+            )
+            for service_id in (1, 2)
+        ]
+        mock_send_alert.side_effect = [psycopg2.Error("boom"), None]
+
+        queryForNoHeartbeat()
+
+        conns[0].rollback.assert_called_once()
+        conns[0].commit.assert_not_called()
+        conns[1].commit.assert_called_once()
+        assert mock_release.call_count == 2
+
+    @patch("Medic.Worker.monitor.MAINTENANCE_WINDOWS_AVAILABLE", False)
+    @patch("Medic.Worker.monitor.slack")
+    @patch("Medic.Worker.monitor.pagerduty")
+    @patch("Medic.Worker.monitor.release_db")
+    @patch("Medic.Worker.monitor.connect_db")
+    def test_failed_upsert_rolls_back_service_connection(
+        self, mock_connect, mock_release, mock_pd, mock_slack, mock_env_vars
+    ):
+        """Test a failed statement on a service's connection is rolled back."""
+        import psycopg2
+        from Medic.Worker.monitor import queryForNoHeartbeat
+
+        cycle_conn, service_conn = MagicMock(), MagicMock()
+        cycle_conn.cursor.return_value.fetchall.return_value = [
+            service_row(last_heartbeat_time=datetime.now(timezone.utc), recent_count=0)
+        ]
+        service_conn.cursor.return_value.execute.side_effect = psycopg2.Error("boom")
+        mock_connect.side_effect = [cycle_conn, service_conn]
+
+        queryForNoHeartbeat()
+
+        service_conn.rollback.assert_called_once()
+        service_conn.commit.assert_not_called()
+        mock_pd.create_alert.assert_not_called()
+        mock_slack.send_message.assert_not_called()
+
+    @patch("Medic.Worker.monitor.sendAlert")
+    @patch("Medic.Worker.monitor.query_db")
+    def test_services_run_on_service_executor(
+        self, mock_query, mock_send_alert, mock_env_vars
+    ):
+        """Test the cycle fans services out to the service executor."""
+        from Medic.Worker import monitor
+
+        mock_query.return_value = [service_row(service_id=1)]
+        mock_executor = MagicMock()
+
+        with patch.object(monitor, "_service_executor", mock_executor):
+            monitor.queryForNoHeartbeat()
+
+        mock_executor.map.assert_called_once()
+
+    @patch("Medic.Worker.monitor.connect_db")
+    def test_insert_db_with_conn_defers_commit(self, mock_connect, mock_env_vars):
+        """Test writes on a caller's connection are left for the caller to commit."""
+        from Medic.Worker.monitor import insert_db
+
+        mock_conn = MagicMock()
+
+        assert insert_db("UPDATE test SET a = 1", conn=mock_conn) is True
+
+        mock_connect.assert_not_called()
+        mock_conn.commit.assert_not_called()
+        mock_conn.close.assert_not_called()
+
+
+class TestDispatch:
+    """Tests for the notification dispatcher."""
+
+    def test_dispatch_runs_on_notifier_pool(self):
+        """Test notifications run on a notifier thread, not the caller's."""
+        import threading
+        from Medic.Worker import monitor
+
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="medic-notifier")
+        notified = []
+
+        with patch("Medic.Worker.monitor._notifier", pool):
+            monitor._dispatch(
+                lambda message: notified.append(threading.current_thread().name),
+                "hello",
+            )
+            pool.shutdown(wait=True)
+
+        assert notified[0].startswith("medic-notifier")
+        assert threading.current_thread().name not in notified
+
+    def test_dispatch_logs_failures(self, caplog):
+        """Test exceptions from notification calls are logged, not raised."""
+        import logging
+        from Medic.Worker import monitor
+
+        def fail():
+            raise RuntimeError("slack down")
+
+        with caplog.at_level(logging.ERROR):
+            monitor._dispatch(fail)
+
+        assert any("slack down" in r.message for r in caplog.records)
+
+    def test_dispatch_runs_inline_after_shutdown(self):
+        """Test notifications still go out once the pool has shut down."""
+        from Medic.Worker import monitor
+
+        pool = ThreadPoolExecutor(max_workers=1)
+        pool.shutdown(wait=True)
+        notify = MagicMock()
+
+        with patch("Medic.Worker.monitor._notifier", pool):
+            monitor._dispatch(notify, "hello")
+
+        notify.assert_called_once_with("hello")
+
+
+class TestHeartbeatNotifications:
+    """Tests for LISTEN/NOTIFY driven recovery checks."""
+
+    @pytest.fixture(autouse=True)
+    def clear_pending(self):
+        from Medic.Worker import monitor
+
+        monitor._pending_heartbeats.clear()
+        monitor._heartbeat_wake.clear()
+        yield
+        monitor._pending_heartbeats.clear()
+        monitor._heartbeat_wake.clear()
+
+    def test_drain_notifications_collects_service_ids(self):
+        """Test notification payloads are parsed and bad ones skipped."""
+        from Medic.Worker.monitor import _drain_notifications
+
+        conn = MagicMock()
+        conn.notifies = [
+            MagicMock(payload="1"),
+            MagicMock(payload="2"),
+            MagicMock(payload="1"),
+            MagicMock(payload="not-an-id"),
+        ]
+
+        assert _drain_notifications(conn) == {1, 2}
+        assert conn.notifies == []
+
+    @patch("Medic.Worker.monitor.slack")
+    @patch("Medic.Worker.monitor.pagerduty")
+    @patch("Medic.Worker.monitor.insert_db")
+    @patch("Medic.Worker.monitor.query_db")
+    def test_check_recovered_services_closes_alert(
+        self, mock_query, mock_insert, mock_pd, mock_slack, mock_env_vars
+    ):
+        """Test announced services that recovered have their alert closed."""
+        from Medic.Worker import monitor
+
+        monitor._pending_heartbeats.update({1, 2})
+        mock_query.side_effect = [
+            [service_row(
+                service_id=1,
+                heartbeat_name="test-heartbeat",
+                service_name="test-service",
+                alert_interval=5,
+                threshold=1,
+                team="platform",
+                priority="p2",
+                muted=0,
+                down=1,
+                runbook=None,
+                last_heartbeat_time=datetime.now(timezone.utc),
+                recent_count=1
+            )],
+            # Active alert to close
+            [(1, "test", 1, 1, "pd-key", 5)],
+        ]
+
+        monitor.checkRecoveredServices()
+
+        query, params = mock_query.call_args_list[0][0]
+        assert "s.down = 1" in query
+        assert sorted(params[1]) == [1, 2]
+        mock_pd.close_alert.assert_called_once_with("pd-key")
+        assert monitor._pending_heartbeats == set()
+
+    @patch("Medic.Worker.monitor.query_db")
+    @patch("Medic.Worker.monitor.release_db")
+    @patch("Medic.Worker.monitor.connect_db")
+    def test_check_recovered_services_connects_under_check_lock(
+        self, mock_connect, mock_release, mock_query
+    ):
+        """Test a recovery check does not hold a connection while waiting for a cycle."""
+        from Medic.Worker import monitor
+
+        monitor._pending_heartbeats.add(1)
+        locked = []
+
+        def connect():
+            locked.append(monitor._check_lock.locked())
+            return MagicMock()
+
+        mock_connect.side_effect = connect
+        mock_query.return_value = []
+
+        monitor.checkRecoveredServices()
+
+        assert locked == [True]
+        mock_release.assert_called_once()
+
+    @patch("Medic.Worker.monitor.query_db")
+    @patch("Medic.Worker.monitor.release_db")
+    @patch("Medic.Worker.monitor.connect_db")
+    def test_check_recovered_services_rolls_back_failed_lookup(
+        self, mock_connect, mock_release, mock_query
+    ):
+        """Test a failed recovery lookup is rolled back instead of raised."""
+        import psycopg2
+        from Medic.Worker import monitor
+
+        monitor._pending_heartbeats.add(1)
+        conn = MagicMock()
+        mock_connect.return_value = conn
+        mock_query.side_effect = psycopg2.Error("boom")
+
+        monitor.checkRecoveredServices()
+
+        conn.rollback.assert_called_once()
+        mock_release.assert_called_once_with(conn)
+
+    @patch("Medic.Worker.monitor.query_db")
+    def test_check_recovered_services_noop_without_pending(self, mock_query):
+        """Test nothing is queried when no heartbeats were announced."""
+        from Medic.Worker import monitor
+
+        monitor.checkRecoveredServices()
+
+        mock_query.assert_not_called()
+
+    @patch("Medic.Worker.monitor.checkRecoveredServices")
+    def test_wait_for_next_cycle_handles_wakeups(self, mock_check):
+        """Test a wakeup runs the recovery check before the cycle deadline."""
+        from Medic.Worker import monitor
+
+        monitor._heartbeat_wake.set()
+
+        monitor.wait_for_next_cycle(0.05)
+
+        mock_check.assert_called_once()
+
+
+class TestSendStaleJobAlert:
+    """Tests for sendStaleJobAlert."""
+
+    @patch("Medic.Worker.monitor.slack")
+    @patch("Medic.Worker.monitor.pagerduty")
+    @patch("Medic.Worker.monitor.query_db")
+    def test_routes_alert_using_service_row(
+        self, mock_query, mock_pd, mock_slack, mock_env_vars
+    ):
+        """Test team and priority are read from the positional service row."""
+        from Medic.Worker.monitor import sendStaleJobAlert
+
+        mock_query.return_value = [("data-eng", "p1", 0)]
+        alert = MagicMock(
+            service_id=1,
+            service_name="nightly-etl",
+            run_id="run-42",
+            duration_ms=3_900_000,
+            max_duration_ms=3_600_000,
+        )
+
+        assert sendStaleJobAlert(alert) is True
+
+        assert mock_pd.create_alert.call_args.kwargs["team"] == "data-eng"
+        assert mock_pd.create_alert.call_args.kwargs["priority"] == "p1"
+        message = mock_slack.send_message.call_args[0][0]
+        assert "1h 5m" in message and "`data-eng`" in message
+
+    @patch("Medic.Worker.monitor.slack")
+    @patch("Medic.Worker.monitor.pagerduty")
+    @patch("Medic.Worker.monitor.query_db")
+    def test_muted_service_is_skipped(
+        self, mock_query, mock_pd, mock_slack, mock_env_vars
+    ):
+        """Test muted services get no stale job alert."""
+        from Medic.Worker.monitor import sendStaleJobAlert
+
+        mock_query.return_value = [("data-eng", "p1", 1)]
+
+        sendStaleJobAlert(MagicMock(service_id=1, service_name="nightly-etl"))
+
+        mock_pd.create_alert.assert_not_called()
+        mock_slack.send_message.assert_not_called()
+
+    @patch("Medic.Worker.monitor.slack")
+    @patch("Medic.Worker.monitor.pagerduty")
+    @patch("Medic.Worker.monitor.query_db")
+    def test_missing_service_info_reports_failure(
+        self, mock_query, mock_pd, mock_slack, mock_env_vars
+    ):
+        """Test an alert that could not be routed is reported as not sent."""
+        from Medic.Worker.monitor import sendStaleJobAlert
+
+        mock_query.return_value = None
+
+        assert sendStaleJobAlert(MagicMock(service_id=1)) is False
+        mock_pd.create_alert.assert_not_called()
+        mock_slack.send_message.assert_not_called()
+
+
+class TestMetricsPush:
+    """Tests for pushing worker metrics after each cycle."""
+
+    @patch("Medic.Worker.monitor.METRICS_AVAILABLE", True)
+    @patch("Medic.Worker.monitor.METRICS_PUSHGATEWAY", "pushgw:9091")
+    @patch("Medic.Worker.monitor.push_metrics")
+    @patch("Medic.Worker.monitor._queryForNoHeartbeat_impl")
+    def test_cycle_pushes_when_gateway_set(self, mock_impl, mock_push):
+        """Test metrics are pushed once the cycle finishes."""
+        from Medic.Worker.monitor import queryForNoHeartbeat
+
+        queryForNoHeartbeat()
+
+        mock_push.assert_called_once_with("pushgw:9091")
+
+    @patch("Medic.Worker.monitor.METRICS_PUSHGATEWAY", None)
+    @patch("Medic.Worker.monitor.push_metrics")
+    @patch("Medic.Worker.monitor._queryForNoHeartbeat_impl")
+    def test_cycle_does_not_push_by_default(self, mock_impl, mock_push):
+        """Test nothing is pushed when metrics are scraped instead."""
+        from Medic.Worker.monitor import queryForNoHeartbeat
+
+        queryForNoHeartbeat()
+
+        mock_push.assert_not_called()
+
+
+class TestWorkerTracer:
+    """Tests for the worker's tracer lookup."""
+
+    @patch("Medic.Worker.monitor._tracer", None)
+    @patch("Medic.Worker.monitor.get_tracer")
+    @patch("Medic.Worker.monitor.is_tracing_configured", return_value=False)
+    def test_no_tracer_when_tracing_disabled(self, mock_configured, mock_get_tracer):
+        """Test cycles skip span creation when spans are not exported."""
+        from Medic.Worker.monitor import _get_tracer
+
+        assert _get_tracer() is None
+        mock_get_tracer.assert_not_called()
+
+    @patch("Medic.Worker.monitor._tracer", None)
+    @patch("Medic.Worker.monitor.get_tracer")
+    @patch("Medic.Worker.monitor.is_tracing_configured", return_value=True)
+    def test_tracer_when_tracing_configured(self, mock_configured, mock_get_tracer):
+        """Test the worker tracer is created once tracing is set up."""
+        from Medic.Worker.monitor import _get_tracer
+
+        assert _get_tracer() is mock_get_tracer.return_value
+        mock_get_tracer.assert_called_once_with("medic.worker")
+
+
+class TestCheckForStaleJobs:
+    """Tests for checkForStaleJobs."""
+
+    @patch("Medic.Worker.monitor.DURATION_ALERTS_AVAILABLE", True)
+    @patch("Medic.Worker.monitor.MAINTENANCE_WINDOWS_AVAILABLE", False)
+    @patch("Medic.Worker.monitor.record_duration_alert")
+    @patch("Medic.Worker.monitor.update_stale_jobs_count")
+    @patch("Medic.Worker.monitor.mark_stale_runs_alerted")
+    @patch("Medic.Worker.monitor.sendStaleJobAlert")
+    @patch("Medic.Worker.monitor.get_stale_runs_exceeding_max_duration")
+    def test_alerted_runs_marked_in_one_batch(
+        self, mock_stale, mock_send, mock_mark, mock_count, mock_record
+    ):
+        """Test every alerted run is marked by a single batched update."""
+        from Medic.Worker.monitor import checkForStaleJobs
+
+        mock_stale.return_value = [
+            MagicMock(service_id=1, run_id="run-a"),
+            MagicMock(service_id=2, run_id="run-b"),
+        ]
+
+        checkForStaleJobs()
+
+        assert mock_send.call_count == 2
+        mock_mark.assert_called_once_with([(1, "run-a"), (2, "run-b")])
+
+    @patch("Medic.Worker.monitor.DURATION_ALERTS_AVAILABLE", True)
+    @patch("Medic.Worker.monitor.MAINTENANCE_WINDOWS_AVAILABLE", False)
+    @patch("Medic.Worker.monitor.record_duration_alert")
+    @patch("Medic.Worker.monitor.update_stale_jobs_count")
+    @patch("Medic.Worker.monitor.mark_stale_runs_alerted")
+    @patch("Medic.Worker.monitor.sendStaleJobAlert")
+    @patch("Medic.Worker.monitor.get_stale_runs_exceeding_max_duration")
+    def test_runs_alerted_before_failure_are_marked(
+        self, mock_stale, mock_send, mock_mark, mock_count, mock_record
+    ):
+        """Test runs already alerted are still marked if a later alert fails."""
+        from Medic.Worker.monitor import checkForStaleJobs
+
+        mock_stale.return_value = [
+            MagicMock(service_id=1, run_id="run-a"),
+            MagicMock(service_id=2, run_id="run-b"),
+        ]
+        mock_send.side_effect = [True, RuntimeError("slack down")]
+
+        checkForStaleJobs()
+
+        mock_mark.assert_called_once_with([(1, "run-a")])
+
+    @patch("Medic.Worker.monitor.DURATION_ALERTS_AVAILABLE", True)
+    @patch("Medic.Worker.monitor.MAINTENANCE_WINDOWS_AVAILABLE", False)
+    @patch("Medic.Worker.monitor.record_duration_alert")
+    @patch("Medic.Worker.monitor.update_stale_jobs_count")
+    @patch("Medic.Worker.monitor.mark_stale_runs_alerted")
+    @patch("Medic.Worker.monitor.sendStaleJobAlert")
+    @patch("Medic.Worker.monitor.get_stale_runs_exceeding_max_duration")
+    def test_failed_alerts_are_not_marked(
+        self, mock_stale, mock_send, mock_mark, mock_count, mock_record
+    ):
+        """Test runs whose alert could not be sent are retried next cycle."""
+        from Medic.Worker.monitor import checkForStaleJobs
+
+        mock_stale.return_value = [
+            MagicMock(service_id=1, run_id="run-a"),
+            MagicMock(service_id=2, run_id="run-b"),
+            MagicMock(service_id=3, run_id="run-c"),
+        ]
+        mock_send.side_effect = [RuntimeError("slack down"), False, True]
+
+        checkForStaleJobs()
+
+        assert mock_send.call_count == 3
+        mock_mark.assert_called_once_with([(3, "run-c")])
+        mock_record.assert_called_once_with("stale")
+
+
+class TestCycleTimes:
+    """Tests for per-cycle timestamps."""
+
+    @patch("Medic.Worker.monitor.MAINTENANCE_WINDOWS_AVAILABLE", False)
+    @patch("Medic.Worker.monitor.sendAlert")
+    @patch("Medic.Worker.monitor.query_db")
+    def test_alerts_are_stamped_in_utc(self, mock_query, mock_send_alert, mock_env_vars):
+        """Test the alert timestamp is an aware UTC time, not local wall time."""
+        from Medic.Worker.monitor import queryForNoHeartbeat
+
+        mock_query.return_value = [
+            service_row(last_heartbeat_time=datetime.now(timezone.utc), recent_count=0)
+        ]
+
+        before = datetime.now(timezone.utc)
+        queryForNoHeartbeat()
+
+        stamp = mock_send_alert.call_args[0][8]
+        assert stamp.utcoffset().total_seconds() == 0
+        assert abs((stamp - before).total_seconds()) < 60
+
+    @patch("Medic.Worker.monitor.MAINTENANCE_WINDOWS_AVAILABLE", False)
+    @patch("Medic.Worker.monitor.sendAlert")
+    @patch("Medic.Worker.monitor.query_db")
+    def test_services_share_cycle_timestamp(
+        self, mock_query, mock_send_alert, mock_env_vars
+    ):
+        """Test every service in a cycle is stamped with the same time."""
+        from Medic.Worker.monitor import queryForNoHeartbeat
+
+        mock_query.return_value = [
+            service_row(
+                service_id=service_id,
+                last_heartbeat_time=datetime.now(timezone.utc),
+                recent_count=0,
+            )
+            for service_id in (1, 2, 3)
+        ]
+
+        queryForNoHeartbeat()
+
+        stamps = {c[0][8] for c in mock_send_alert.call_args_list}
+        assert mock_send_alert.call_count == 3
+        assert len(stamps) == 1
+
+
+class TestCycleScheduling:
+    """Tests for the fixed-rate cycle scheduler."""
+
+    @patch("Medic.Worker.monitor.wait_for_next_cycle")
+    @patch("Medic.Worker.monitor.time.monotonic")
+    def test_next_tick_does_not_drift(self, mock_monotonic, mock_wait):
+        """Test the wait is shortened by the time the cycle already took."""
+        from Medic.Worker.monitor import schedule_next_cycle
+
+        mock_monotonic.return_value = 103.0
+
+        next_tick = schedule_next_cycle(100.0, interval=15)
+
+        assert next_tick == 115.0
+        mock_wait.assert_called_once_with(12.0)
+
+    @patch("Medic.Worker.monitor.WORKER_CYCLE_OVERRUN")
+    @patch("Medic.Worker.monitor.wait_for_next_cycle")
+    @patch("Medic.Worker.monitor.time.monotonic")
+    def test_overrun_restarts_schedule(
+        self, mock_monotonic, mock_wait, mock_overrun
+    ):
+        """Test an overrun cycle is counted and the schedule resets to now."""
+        from Medic.Worker.monitor import schedule_next_cycle
+
+        mock_monotonic.return_value = 120.0
+
+        next_tick = schedule_next_cycle(100.0, interval=15)
+
+        assert next_tick == 120.0
+        mock_wait.assert_not_called()
+        mock_overrun.inc.assert_called_once()
+
+    @patch("Medic.Worker.monitor.DURATION_ALERTS_AVAILABLE", False)
+    @patch("Medic.Worker.monitor.CYCLE_SECONDS", 1.05)
+    @patch("Medic.Worker.monitor.WORKER_CYCLE_OVERRUN")
+    @patch("Medic.Worker.monitor.queryForNoHeartbeat")
+    def test_skips_cycle_while_previous_running(self, mock_query, mock_overrun):
+        """Test no new heartbeat check starts while one is in progress."""
+        import threading
+        from Medic.Worker import monitor
+
+        release = threading.Event()
+        mock_query.side_effect = lambda: release.wait(5)
+
+        try:
+            monitor.thread_function()
+            monitor.thread_function()
+        finally:
+            release.set()
+            monitor._cycle_futures["heartbeat check"].result(timeout=5)
+
+        assert mock_query.call_count == 1
+        mock_overrun.inc.assert_called_once()
+
+    @patch("Medic.Worker.monitor.DURATION_ALERTS_AVAILABLE", True)
+    @patch("Medic.Worker.monitor.checkForStaleJobs")
+    @patch("Medic.Worker.monitor.queryForNoHeartbeat")
+    def test_checks_run_on_cycle_executor(self, mock_query, mock_stale):
+        """Test both checks run on the shared pool and are waited for."""
+        import threading
+        from Medic.Worker import monitor
+
+        names = []
+        mock_query.side_effect = lambda: names.append(threading.current_thread().name)
+        mock_stale.side_effect = lambda: names.append(threading.current_thread().name)
+
+        monitor.thread_function()
+
+        assert len(names) == 2
+        assert all(name.startswith("medic-cycle") for name in names)
+
+    @patch("Medic.Worker.monitor.DURATION_ALERTS_AVAILABLE", False)
+    @patch("Medic.Worker.monitor.queryForNoHeartbeat")
+    def test_failed_check_allows_next_cycle(self, mock_query):
+        """Test a check that raised does not block the following cycle."""
+        from Medic.Worker import monitor
+
+        mock_query.side_effect = [RuntimeError("boom"), None]
+
+        monitor.thread_function()
+        monitor.thread_function()
+
+        assert mock_query.call_count == 2
@@ -38,10 +38,20 @@ class TestGetSeverity:
         assert get_severity("unknown") == "warning"
 
 
+class TestDedupKeyFor:
+    """Tests for dedup_key_for function."""
+
+    def test_dedup_key_is_derived_from_heartbeat(self):
+        """Test the dedup key is deterministic per heartbeat."""
+        from Medic.Worker.pagerduty_client import dedup_key_for
+
+        assert dedup_key_for("test-heartbeat") == "medic-test-heartbeat"
+
+
 class TestCreateAlert:
     """Tests for create_alert function."""
 
-    @patch("Medic.Worker.pagerduty_client.requests.post")
+    @patch("Medic.Worker.pagerduty_client._session.post")
     def test_create_alert_success(self, mock_post, mock_env_vars):
         """Test successful alert creation."""
         from Medic.Worker.pagerduty_client import create_alert
@@ -69,7 +79,7 @@ class TestCreateAlert:
         assert payload["dedup_key"] == "medic-test-heartbeat"
         assert payload["payload"]["severity"] == "error"
 
-    @patch("Medic.Worker.pagerduty_client.requests.post")
+    @patch("Medic.Worker.pagerduty_client._session.post")
     def test_create_alert_with_runbook(self, mock_post, mock_env_vars):
         """Test alert creation with runbook link."""
         from Medic.Worker.pagerduty_client import create_alert
@@ -92,7 +102,7 @@ class TestCreateAlert:
         assert "links" in payload
         assert payload["links"][0]["href"] == "https://docs.example.com/runbook"
 
-    @patch("Medic.Worker.pagerduty_client.requests.post")
+    @patch("Medic.Worker.pagerduty_client._session.post")
     def test_create_alert_failure(self, mock_post, mock_env_vars):
         """Test alert creation failure."""
         from Medic.Worker.pagerduty_client import create_alert
@@ -129,7 +139,7 @@ class TestCreateAlert:
 class TestCloseAlert:
     """Tests for close_alert function."""
 
-    @patch("Medic.Worker.pagerduty_client.requests.post")
+    @patch("Medic.Worker.pagerduty_client._session.post")
     def test_close_alert_success(self, mock_post, mock_env_vars):
         """Test successful alert resolution."""
         from Medic.Worker.pagerduty_client import close_alert
@@ -146,7 +156,7 @@ class TestCloseAlert:
         assert payload["event_action"] == "resolve"
         assert payload["dedup_key"] == "medic-test-heartbeat"
 
-    @patch("Medic.Worker.pagerduty_client.requests.post")
+    @patch("Medic.Worker.pagerduty_client._session.post")
     def test_close_alert_failure(self, mock_post, mock_env_vars):
         """Test alert resolution failure."""
         from Medic.Worker.pagerduty_client import close_alert
@@ -177,7 +187,7 @@ class TestCloseAlert:
 class TestAcknowledgeAlert:
     """Tests for acknowledge_alert function."""
 
-    @patch("Medic.Worker.pagerduty_client.requests.post")
+    @patch("Medic.Worker.pagerduty_client._session.post")
     def test_acknowledge_alert_success(self, mock_post, mock_env_vars):
         """Test successful alert acknowledgment."""
         from Medic.Worker.pagerduty_client import acknowledge_alert
@@ -192,3 +202,31 @@ class TestAcknowledgeAlert:
         call_kwargs = mock_post.call_args
         payload = call_kwargs[1]["json"]
         assert payload["event_action"] == "acknowledge"
+
+
+class TestSession:
+    """Tests for the shared Events API session."""
+
+    def test_session_keeps_alive_and_retries(self):
+        """Test calls share one pooled session that retries transient errors."""
+        from Medic.Worker.pagerduty_client import _session, PAGERDUTY_EVENTS_URL
+
+        adapter = _session.get_adapter(PAGERDUTY_EVENTS_URL)
+        retries = adapter.max_retries
+
+        assert adapter._pool_maxsize == 10
+        assert retries.total == 3
+        assert set(retries.status_forcelist) == {429, 502, 503, 504}
+        assert "POST" in retries.allowed_methods
+
+    @patch("Medic.Worker.pagerduty_client._session.send")
+    def test_events_sent_as_json(self, mock_send, mock_env_vars):
+        """Test event bodies carry a JSON content type without per-call headers."""
+        from Medic.Worker.pagerduty_client import close_alert
+
+        mock_send.return_value = MagicMock(status_code=202)
+
+        assert close_alert("medic-test-heartbeat") is True
+
+        request = mock_send.call_args[0][0]
+        assert request.headers["Content-Type"] == "application/json"
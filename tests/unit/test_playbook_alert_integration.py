@@ -470,6 +470,7 @@ class TestTriggerPlaybookForAlert:
             mock_find.assert_not_called()
 
 
+@pytest.mark.usefixtures("inline_notifications", "inline_service_checks")
 class TestMonitorIntegration:
     """Tests for monitor.py integration with playbook triggers.
 
@@ -677,4 +678,4 @@ class TestMonitorIntegration:
                 )
 
                 # Should log error
-                mock_logger.log.assert_called()
+                mock_logger.error.assert_called()
@@ -477,6 +477,36 @@ class TestIsTelemetryEnabled:
         assert is_telemetry_enabled() is True
 
 
+class TestIsTracingConfigured:
+    """Tests for is_tracing_configured function."""
+
+    def teardown_method(self):
+        """Reset module state after each test."""
+        import Medic.Core.telemetry as telemetry_module
+
+        telemetry_module._initialized = False
+        telemetry_module._tracer_provider = None
+
+    def test_returns_false_when_tracing_disabled(self):
+        """Should return False when initialized without a tracer provider."""
+        import Medic.Core.telemetry as telemetry_module
+        from Medic.Core.telemetry import is_tracing_configured
+
+        telemetry_module._initialized = True
+        telemetry_module._tracer_provider = None
+
+        assert is_tracing_configured() is False
+
+    def test_returns_true_with_tracer_provider(self):
+        """Should return True once a tracer provider is installed."""
+        import Medic.Core.telemetry as telemetry_module
+        from Medic.Core.telemetry import is_tracing_configured
+
+        telemetry_module._tracer_provider = MagicMock()
+
+        assert is_tracing_configured() is True
+
+
 class TestGetTracer:
     """Tests for get_tracer function."""
 
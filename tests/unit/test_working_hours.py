@@ -7,6 +7,16 @@ from zoneinfo import ZoneInfo
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def reset_schedule_cache():
+    """Clear cached service schedules before and after each test."""
+    from Medic.Core.working_hours import clear_schedule_cache
+
+    clear_schedule_cache()
+    yield
+    clear_schedule_cache()
+
+
 class TestParseTime:
     """Tests for parse_time function."""
 
@@ -613,6 +623,48 @@ class TestGetScheduleForService:
 
             assert result is None
 
+    def test_caches_schedule_per_service(self, mock_env_vars):
+        """Test that repeated lookups for a service reuse the cached schedule."""
+        from Medic.Core.working_hours import get_schedule_for_service
+
+        schedule_data = [{
+            "schedule_id": 1,
+            "name": "US Business Hours",
+            "timezone": "America/Chicago",
+            "hours": {"monday": [{"start": "09:00", "end": "17:00"}]},
+        }]
+
+        with patch("Medic.Core.working_hours.query_db") as mock_query:
+            mock_query.return_value = json.dumps(schedule_data)
+
+            first = get_schedule_for_service(123)
+            second = get_schedule_for_service(123)
+
+            assert first is second
+            mock_query.assert_called_once()
+
+    def test_caches_missing_schedule(self, mock_env_vars):
+        """Test that a service without a schedule is cached as None."""
+        from Medic.Core.working_hours import get_schedule_for_service
+
+        with patch("Medic.Core.working_hours.query_db") as mock_query:
+            mock_query.return_value = json.dumps([])
+
+            assert get_schedule_for_service(123) is None
+            assert get_schedule_for_service(123) is None
+            mock_query.assert_called_once()
+
+    def test_does_not_cache_query_errors(self, mock_env_vars):
+        """Test that database errors are retried on the next lookup."""
+        from Medic.Core.working_hours import get_schedule_for_service
+
+        with patch("Medic.Core.working_hours.query_db") as mock_query:
+            mock_query.return_value = None
+
+            assert get_schedule_for_service(123) is None
+            assert get_schedule_for_service(123) is None
+            assert mock_query.call_count == 2
+
 
 class TestIsServiceWithinWorkingHours:
     """Tests for is_service_within_working_hours function."""